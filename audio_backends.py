@@ -0,0 +1,111 @@
+import importlib
+import importlib.util
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+# audio_mixer pulls in NumPy, so it is imported only when the mixer is tried.
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from audio_mixer import Mixer
+
+# "mixer" is the NumPy + sounddevice stream; the others play one file at a time.
+AUTO_ORDER = ("mixer", "pygame", "simpleaudio", "winsound")
+AUDIO_BACKENDS = ("auto", *AUTO_ORDER, "none")
+
+
+# Picks and opens the sound backend on first use, or ahead of time on a
+# background thread (`start_background`). Nothing is imported or initialised
+# at module import, so runs that never reach audio never pay for it.
+class AudioBackend:
+    def __init__(self, choice: str = "auto") -> None:
+        if choice not in AUDIO_BACKENDS:
+            raise ValueError(f"unknown audio backend {choice!r}")
+        self.choice = choice
+        self.name: str | None = None
+        self.module: object | None = None
+        self.mixer: "Mixer | None" = None
+        self.sink: object | None = None
+        # Seconds spent trying each backend, in the order they were tried.
+        self.timings: dict[str, float] = {}
+        self.lock = threading.Lock()
+        self.thread: threading.Thread | None = None
+
+    def start_background(self) -> None:
+        if self.thread is None and self.name is None:
+            self.thread = threading.Thread(target=self.ensure, name="audio-init", daemon=True)
+            self.thread.start()
+
+    def ensure(self) -> str:
+        with self.lock:
+            if self.name is None:
+                candidates = AUTO_ORDER if self.choice == "auto" else (self.choice,)
+                for candidate in candidates:
+                    start = time.perf_counter()
+                    opened = self.open(candidate)
+                    self.timings[candidate] = time.perf_counter() - start
+                    if opened:
+                        self.name = candidate
+                        break
+                else:
+                    self.name = "none"
+            return self.name
+
+    def open(self, name: str) -> bool:
+        if name == "none":
+            return True
+        if name == "mixer":
+            from audio_mixer import open_device_mixer
+
+            opened = open_device_mixer()
+            if opened is None:
+                return False
+            self.mixer, self.sink = opened
+            return True
+        if importlib.util.find_spec(name) is None:
+            return False
+        try:
+            module = importlib.import_module(name)
+            if name == "pygame":
+                module.mixer.init()
+        except Exception:
+            return False
+        self.module = module
+        return True
+
+    def load(self, path: Path) -> object | None:
+        name = self.ensure()
+        try:
+            if name == "mixer":
+                return self.mixer.load(path)  # type: ignore[union-attr]
+            if name == "pygame":
+                return self.module.mixer.Sound(str(path))  # type: ignore[union-attr]
+            if name == "simpleaudio":
+                return self.module.WaveObject.from_wave_file(str(path))  # type: ignore[union-attr]
+        except Exception:
+            # Unreadable or unsupported files play as silence, as before.
+            return None
+        if name == "winsound":
+            return path
+        return None
+
+    def play(self, sound: object | None) -> None:
+        if sound is None:
+            return
+        name = self.ensure()
+        if name == "mixer":
+            self.mixer.play(sound)  # type: ignore[union-attr, arg-type]
+            return
+        try:
+            if name in ("pygame", "simpleaudio") and hasattr(sound, "play"):
+                sound.play()
+            elif name == "winsound":
+                winsound = self.module
+                flags = winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT  # type: ignore[union-attr]
+                winsound.PlaySound(str(sound), flags)  # type: ignore[union-attr]
+        except Exception:
+            pass
+
+    def stop(self) -> None:
+        if self.sink is not None:
+            self.sink.stop()  # type: ignore[attr-defined]
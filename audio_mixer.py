@@ -0,0 +1,361 @@
+import importlib.util
+import math
+import threading
+import time
+import wave
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable
+
+if importlib.util.find_spec("numpy") is not None:  # pragma: no cover - optional dependency
+    import numpy as np  # type: ignore
+else:  # pragma: no cover - fallback when numpy is unavailable
+    np = None  # type: ignore
+
+# sounddevice loads PortAudio and scans devices on import, so it is only
+# imported when a device stream is actually opened.
+SOUNDDEVICE_AVAILABLE = importlib.util.find_spec("sounddevice") is not None
+
+
+DEFAULT_SAMPLE_RATE = 48000
+DEFAULT_CHANNELS = 2
+DEFAULT_BLOCK_FRAMES = 512
+# Heartbeat.wav holds one beat per second.
+HEARTBEAT_BASE_BPM = 60.0
+HEARTBEAT_BPM_STEP = 2.0
+HEARTBEAT_CACHE_SIZE = 48
+
+# (bpm, scheduled, enqueued, played), all on the time.perf_counter clock.
+BeatListener = Callable[[float, float, float | None, float], None]
+
+
+def mixer_available() -> bool:
+    return np is not None
+
+
+def device_available() -> bool:
+    return np is not None and SOUNDDEVICE_AVAILABLE
+
+
+class Sample:
+    __slots__ = ("name", "frames")
+
+    def __init__(self, name: str, frames: "np.ndarray") -> None:
+        self.name = name
+        # float32, shape (frame count, channels), already at the mixer's rate.
+        self.frames = frames
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def __repr__(self) -> str:
+        return f"Sample({self.name!r}, {len(self.frames)} frames)"
+
+
+def decode_wav(path: Path, sample_rate: int, channels: int) -> "np.ndarray":
+    with wave.open(str(path), "rb") as wav:
+        width = wav.getsampwidth()
+        source_channels = wav.getnchannels()
+        source_rate = wav.getframerate()
+        raw = wav.readframes(wav.getnframes())
+
+    if width == 1:
+        data = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif width == 2:
+        data = np.frombuffer(raw, dtype="<i2").astype(np.float32) / 32768.0
+    elif width == 3:
+        bytes_ = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        values = bytes_[:, 0] | (bytes_[:, 1] << 8) | (bytes_[:, 2] << 16)
+        values = np.where(values >= 1 << 23, values - (1 << 24), values)
+        data = values.astype(np.float32) / float(1 << 23)
+    elif width == 4:
+        data = np.frombuffer(raw, dtype="<i4").astype(np.float32) / float(1 << 31)
+    else:
+        raise ValueError(f"Unsupported sample width {width} in {path}")
+
+    data = data.reshape(-1, source_channels)
+    if source_channels != channels:
+        mono = data.mean(axis=1, keepdims=True)
+        data = np.repeat(mono, channels, axis=1)
+
+    if source_rate != sample_rate and len(data):
+        target_length = max(1, int(round(len(data) * sample_rate / source_rate)))
+        positions = np.linspace(0, len(data) - 1, target_length)
+        source_positions = np.arange(len(data))
+        data = np.stack(
+            [np.interp(positions, source_positions, data[:, ch]) for ch in range(channels)],
+            axis=1,
+        )
+    return np.ascontiguousarray(data, dtype=np.float32)
+
+
+def time_compress(sample: Sample, speed: float, name: str) -> Sample:
+    frames = sample.frames
+    if speed <= 1.0 or len(frames) < 2:
+        return Sample(name, frames)
+    length = max(1, int(len(frames) / speed))
+    positions = np.arange(length, dtype=np.float64) * speed
+    source_positions = np.arange(len(frames))
+    data = np.stack(
+        [np.interp(positions, source_positions, frames[:, ch]) for ch in range(frames.shape[1])],
+        axis=1,
+    )
+    return Sample(name, np.ascontiguousarray(data, dtype=np.float32))
+
+
+# Heartbeats rendered for the exact tempo instead of the old fixed tiers: the
+# base beat is sped up so it never outlasts the beat interval. Renders are
+# keyed by BPM rounded up to `step`, so small multiplier changes reuse a buffer.
+class HeartbeatBank:
+    def __init__(
+        self,
+        base: Sample,
+        base_bpm: float = HEARTBEAT_BASE_BPM,
+        step: float = HEARTBEAT_BPM_STEP,
+        capacity: int = HEARTBEAT_CACHE_SIZE,
+    ) -> None:
+        self.base = base
+        self.base_bpm = base_bpm
+        self.step = step
+        self.capacity = capacity
+        self.renders: OrderedDict[float, Sample] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def quantize(self, bpm: float) -> float:
+        return max(self.step, math.ceil(bpm / self.step) * self.step)
+
+    def get(self, bpm: float) -> Sample:
+        key = self.quantize(bpm)
+        sample = self.renders.get(key)
+        if sample is not None:
+            self.hits += 1
+            self.renders.move_to_end(key)
+            return sample
+
+        self.misses += 1
+        sample = time_compress(self.base, key / self.base_bpm, f"{self.base.name}@{key:g}")
+        self.renders[key] = sample
+        while len(self.renders) > self.capacity:
+            self.renders.popitem(last=False)
+        return sample
+
+
+class Voice:
+    __slots__ = ("sample", "start", "gain")
+
+    def __init__(self, sample: Sample, start: int, gain: float) -> None:
+        self.sample = sample
+        self.start = start
+        self.gain = gain
+
+
+# Everything audible goes through render(), which the output stream calls from
+# its own thread. Start frames are absolute, so voices land on exact sample
+# offsets no matter how late the Tk thread queued them relative to the block.
+class Mixer:
+    def __init__(
+        self,
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+        channels: int = DEFAULT_CHANNELS,
+    ) -> None:
+        if np is None:
+            raise RuntimeError("The audio mixer requires NumPy.")
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.lock = threading.Lock()
+        self.voices: list[Voice] = []
+        self.frame_position = 0
+        self.heartbeat: Sample | None = None
+        self.heartbeat_interval = 0.0
+        self.heartbeat_bpm = 0.0
+        self.beat_listener: BeatListener | None = None
+        # perf_counter time of frame 0, fixed by the first rendered block.
+        self.clock_origin: float | None = None
+        self.heartbeat_gain = 1.0
+        self.next_beat = 0.0
+        self.last_beat: float | None = None
+        self.beats_played = 0
+
+    def load(self, path: Path) -> Sample:
+        return Sample(path.name, decode_wav(path, self.sample_rate, self.channels))
+
+    def play(self, sample: Sample, delay: float = 0.0, gain: float = 1.0) -> int:
+        with self.lock:
+            start = self.frame_position + max(0, int(round(delay * self.sample_rate)))
+            self.voices.append(Voice(sample, start, gain))
+        return start
+
+    def play_at(self, sample: Sample, frame: int, gain: float = 1.0) -> None:
+        with self.lock:
+            self.voices.append(Voice(sample, max(frame, self.frame_position), gain))
+
+    # The beat grid lives in frames: a tempo change keeps the phase of the last
+    # beat and only moves the next one.
+    def set_heartbeat(self, sample: Sample | None, bpm: float, gain: float = 1.0) -> None:
+        with self.lock:
+            if sample is None or bpm <= 0:
+                self.heartbeat = None
+                self.last_beat = None
+                return
+            interval = self.sample_rate * 60.0 / bpm
+            if self.heartbeat is None:
+                self.next_beat = float(self.frame_position) + interval
+            elif self.last_beat is not None:
+                self.next_beat = max(self.last_beat + interval, float(self.frame_position))
+            self.heartbeat = sample
+            self.heartbeat_interval = interval
+            self.heartbeat_bpm = bpm
+            self.heartbeat_gain = gain
+
+    def stop_heartbeat(self) -> None:
+        self.set_heartbeat(None, 0.0)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.voices.clear()
+
+    # output_time is when the block's first frame reaches the speaker, if the
+    # stream knows it; otherwise playback is assumed to follow the nominal clock.
+    def render(self, frames: int, output_time: float | None = None) -> "np.ndarray":
+        block = np.zeros((frames, self.channels), dtype=np.float32)
+        rendered_at = time.perf_counter()
+        beats: list[int] = []
+        with self.lock:
+            block_start = self.frame_position
+            block_end = block_start + frames
+            if self.clock_origin is None:
+                start_time = rendered_at if output_time is None else output_time
+                self.clock_origin = start_time - block_start / self.sample_rate
+            if self.heartbeat is not None:
+                while self.next_beat < block_end:
+                    beat = int(self.next_beat)
+                    self.voices.append(Voice(self.heartbeat, beat, self.heartbeat_gain))
+                    self.last_beat = self.next_beat
+                    self.next_beat += self.heartbeat_interval
+                    self.beats_played += 1
+                    beats.append(beat)
+            bpm = self.heartbeat_bpm
+            origin = self.clock_origin
+
+            remaining = []
+            for voice in self.voices:
+                if voice.start >= block_end:
+                    remaining.append(voice)
+                    continue
+                offset = block_start - voice.start
+                data = voice.sample.frames
+                if offset >= len(data):
+                    continue
+                out_start = max(0, -offset)
+                src_start = max(0, offset)
+                count = min(frames - out_start, len(data) - src_start)
+                chunk = data[src_start : src_start + count]
+                if voice.gain != 1.0:
+                    chunk = chunk * voice.gain
+                block[out_start : out_start + count] += chunk
+                if src_start + count < len(data):
+                    remaining.append(voice)
+            self.voices = remaining
+            self.frame_position = block_end
+        np.clip(block, -1.0, 1.0, out=block)
+
+        listener = self.beat_listener
+        if listener is not None and beats:
+            block_time = origin + block_start / self.sample_rate
+            if output_time is not None:
+                block_time = output_time
+            for beat in beats:
+                offset = (beat - block_start) / self.sample_rate
+                listener(bpm, origin + beat / self.sample_rate, rendered_at, block_time + offset)
+        return block
+
+
+def to_pcm16(block: "np.ndarray") -> bytes:
+    return (block * 32767.0).astype("<i2").tobytes()
+
+
+# Pulls blocks by hand; used when there is no sound device and in tests.
+class NullSink:
+    def __init__(self, mixer: Mixer, block_frames: int = DEFAULT_BLOCK_FRAMES) -> None:
+        self.mixer = mixer
+        self.block_frames = block_frames
+
+    def start(self) -> None:
+        return None
+
+    def stop(self) -> None:
+        return None
+
+    def pull(self, seconds: float) -> "np.ndarray":
+        return self.pull_frames(int(round(seconds * self.mixer.sample_rate)))
+
+    def pull_frames(self, total: int) -> "np.ndarray":
+        blocks = []
+        while total > 0:
+            frames = min(self.block_frames, total)
+            blocks.append(self.mixer.render(frames))
+            total -= frames
+        if not blocks:
+            return np.zeros((0, self.mixer.channels), dtype=np.float32)
+        return np.concatenate(blocks)
+
+
+class WaveFileSink(NullSink):
+    def __init__(
+        self, mixer: Mixer, path: Path, block_frames: int = DEFAULT_BLOCK_FRAMES
+    ) -> None:
+        super().__init__(mixer, block_frames)
+        self.path = path
+        self.wav = wave.open(str(path), "wb")
+        self.wav.setnchannels(mixer.channels)
+        self.wav.setsampwidth(2)
+        self.wav.setframerate(mixer.sample_rate)
+
+    def pull_frames(self, total: int) -> "np.ndarray":
+        block = super().pull_frames(total)
+        self.wav.writeframes(to_pcm16(block))
+        return block
+
+    def stop(self) -> None:
+        self.wav.close()
+
+
+class DeviceSink:  # pragma: no cover - needs a sound device
+    def __init__(self, mixer: Mixer, block_frames: int = DEFAULT_BLOCK_FRAMES) -> None:
+        self.mixer = mixer
+        sounddevice = importlib.import_module("sounddevice")
+        self.stream = sounddevice.OutputStream(
+            samplerate=mixer.sample_rate,
+            channels=mixer.channels,
+            dtype="float32",
+            blocksize=block_frames,
+            latency="low",
+            callback=self.callback,
+        )
+
+    def callback(self, outdata, frames, time_info, status) -> None:  # type: ignore[no-untyped-def]
+        # Stream time is PortAudio's clock; only the distance to the DAC is used.
+        output_time = time.perf_counter() + (
+            time_info.outputBufferDacTime - time_info.currentTime
+        )
+        outdata[:] = self.mixer.render(frames, output_time)
+
+    def start(self) -> None:
+        self.stream.start()
+
+    def stop(self) -> None:
+        self.stream.stop()
+        self.stream.close()
+
+
+def open_device_mixer() -> tuple[Mixer, DeviceSink] | None:
+    if not device_available():
+        return None
+    try:
+        mixer = Mixer()
+        sink = DeviceSink(mixer)
+        sink.start()
+    except Exception:  # pragma: no cover - depends on the sound device
+        return None
+    return mixer, sink
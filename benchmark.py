@@ -0,0 +1,191 @@
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+import config_cache
+from engine import WheelEngine
+from headless_wheel import build_headless_wheel
+from wheel import WheelOfFortune
+
+SIZES = (10, 100, 1_000, 10_000, 100_000)
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.25
+# Differences below this are timer noise, whatever the ratio.
+NOISE_FLOOR_SECONDS = 0.0002
+BASELINE_VERSION = 1
+
+# One line per shape of item the hot paths treat differently; the benchmark
+# wheel repeats them with numbered names so every size has the same mix.
+ITEM_TEMPLATES = (
+    "Plain {n}",
+    "Cooldown {n} (Cooldown 10)",
+    "Fast {n} (+5) (> 90)",
+    "Slow {n} (*0.9) (< 300)",
+    "Fragile {n} (Fragile)",
+    "Timed {n} (> 45s)",
+    "Spawned {n} (Missing) (Spawn 30 10)",
+    "Common (+1)",
+)
+
+# Setup runs untimed before every repeat; the case returns the callable to time.
+BenchmarkCase = Callable[[config_cache.CompiledConfig], Callable[[], object]]
+
+
+def make_items(count: int) -> list[str]:
+    return [
+        ITEM_TEMPLATES[idx % len(ITEM_TEMPLATES)].format(n=idx // len(ITEM_TEMPLATES))
+        for idx in range(count)
+    ]
+
+
+def build_wheel(compiled: config_cache.CompiledConfig) -> WheelOfFortune:
+    return build_headless_wheel(WheelEngine.from_compiled(compiled, initial_bps=120))
+
+
+def case_parse(compiled: config_cache.CompiledConfig) -> Callable[[], object]:
+    engine = WheelEngine.from_compiled(compiled, initial_bps=120)
+    return engine.parse_items_and_modules
+
+
+def case_draw_wheel(compiled: config_cache.CompiledConfig) -> Callable[[], object]:
+    # A scene change, so every sector and label is created.
+    wheel = build_wheel(compiled)
+    return wheel.draw_wheel
+
+
+def case_draw_wheel_rotate(compiled: config_cache.CompiledConfig) -> Callable[[], object]:
+    # A spin frame: same items, new angle.
+    wheel = build_wheel(compiled)
+    wheel.draw_wheel()
+    wheel.angle_offset = 17.0
+    return wheel.draw_wheel
+
+
+def case_apply_bps_conditions(compiled: config_cache.CompiledConfig) -> Callable[[], object]:
+    engine = WheelEngine.from_compiled(compiled, initial_bps=120)
+    engine.bps = 60
+    return engine.apply_bps_conditions
+
+
+def case_finish_spin(compiled: config_cache.CompiledConfig) -> Callable[[], object]:
+    wheel = build_wheel(compiled)
+    wheel.engine.start_spin(0.0)
+    wheel.angle_offset = 0.0
+    return wheel.finish_spin
+
+
+def case_remove_all_by_name(compiled: config_cache.CompiledConfig) -> Callable[[], object]:
+    engine = WheelEngine.from_compiled(compiled, initial_bps=120)
+    return lambda: engine.remove_all_items_by_base_name("Common")
+
+
+def case_spawn_duplicate(compiled: config_cache.CompiledConfig) -> Callable[[], object]:
+    wheel = build_wheel(compiled)
+    config = wheel.engine.spawn_configs[0]
+    return lambda: wheel.engine.duplicate_spawn_item(config)
+
+
+CASES: dict[str, BenchmarkCase] = {
+    "parse_items_and_modules": case_parse,
+    "draw_wheel": case_draw_wheel,
+    "draw_wheel_rotate": case_draw_wheel_rotate,
+    "apply_bps_conditions": case_apply_bps_conditions,
+    "finish_spin": case_finish_spin,
+    "remove_all_items_by_base_name": case_remove_all_by_name,
+    "spawn_duplicate": case_spawn_duplicate,
+}
+
+
+def measure(case: BenchmarkCase, compiled: config_cache.CompiledConfig, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        run = case(compiled)
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmarks(
+    sizes: tuple[int, ...] = SIZES,
+    repeat: int = DEFAULT_REPEAT,
+    cases: list[str] | None = None,
+    progress: Callable[[str, int, float], None] | None = None,
+) -> dict[str, object]:
+    results: dict[str, dict[str, float]] = {}
+    for size in sizes:
+        compiled = config_cache.compile_items(make_items(max(size, len(ITEM_TEMPLATES))))
+        for name in cases or list(CASES):
+            seconds = measure(CASES[name], compiled, repeat)
+            results.setdefault(name, {})[str(size)] = seconds
+            if progress is not None:
+                progress(name, size, seconds)
+    return {
+        "version": BASELINE_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(
+    baseline: dict[str, object],
+    current: dict[str, object],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[str]:
+    regressions = []
+    old_results = baseline.get("results", {})
+    for name, sizes in current["results"].items():  # type: ignore[union-attr]
+        for size, seconds in sizes.items():
+            old = old_results.get(name, {}).get(size)  # type: ignore[union-attr]
+            if old is None:
+                continue
+            if seconds > old * (1 + threshold) and seconds - old > NOISE_FLOOR_SECONDS:
+                regressions.append(
+                    f"{name} @ {size}: {old * 1000:.3f} ms -> {seconds * 1000:.3f} ms "
+                    f"(+{(seconds / old - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Time the wheel's hot paths at growing sizes")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--case", action="append", choices=sorted(CASES), dest="cases")
+    parser.add_argument("--save", type=Path, metavar="PATH", help="write results as a baseline")
+    parser.add_argument(
+        "--compare", type=Path, metavar="PATH", help="flag regressions against a baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="slowdown ratio counted as a regression (default 0.25 = 25%%)",
+    )
+    args = parser.parse_args(argv)
+
+    def progress(name: str, size: int, seconds: float) -> None:
+        print(f"{name:<32} {size:>8} {seconds * 1000:>10.3f} ms")
+
+    current = run_benchmarks(tuple(args.sizes), args.repeat, args.cases, progress)
+    if args.save is not None:
+        args.save.write_text(json.dumps(current, indent=2), encoding="utf-8")
+    if args.compare is None:
+        return 0
+
+    regressions = compare(json.loads(args.compare.read_text(encoding="utf-8")), current, args.threshold)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    if not regressions:
+        print(f"No regressions beyond {args.threshold:.0%}.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+import hashlib
+import json
+import struct
+import zlib
+from pathlib import Path
+
+import module_parser
+
+ModuleSpec = dict[str, int | bool | float | str]
+
+CACHE_MAGIC = b"WOFC"
+# Bump whenever the grammar or the compiled layout changes.
+CACHE_VERSION = 1
+CACHE_HEADER = struct.Struct("<4sH32s")
+CACHE_SUFFIX = ".wheelcache"
+
+PALETTE = [
+    "#FF6B6B",
+    "#4ECDC4",
+    "#FFD93D",
+    "#1A535C",
+    "#FF9F1C",
+    "#9B5DE5",
+    "#00BBF9",
+    "#F15BB5",
+]
+
+
+def generate_colors(count: int) -> list[str]:
+    return [PALETTE[idx % len(PALETTE)] for idx in range(count)]
+
+
+class CompiledConfig:
+    __slots__ = (
+        "items",
+        "modules",
+        "entries",
+        "labels",
+        "colors",
+        "spawn_entries",
+        "special_targets",
+        "max_targets",
+        "warnings",
+        "error",
+    )
+
+    def __init__(self, items: list[str]) -> None:
+        self.items = items
+        # Distinct module specs; entries refer to them by index and share them.
+        self.modules: list[ModuleSpec] = []
+        # (base name, module index, missing) per item line.
+        self.entries: list[tuple[str, int, bool]] = []
+        self.labels: list[str] = []
+        self.colors: list[str] = []
+        # (entry index, visible index or None) per line with a Spawn module.
+        self.spawn_entries: list[tuple[int, int | None]] = []
+        self.special_targets: dict[str, int] = {}
+        self.max_targets: dict[str, int] = {}
+        self.warnings: list[str] = []
+        self.error: str | None = None
+
+    def to_payload(self) -> dict[str, object]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, object]) -> "CompiledConfig":
+        compiled = cls(list(payload["items"]))  # type: ignore[arg-type]
+        compiled.modules = list(payload["modules"])  # type: ignore[arg-type]
+        compiled.entries = [tuple(entry) for entry in payload["entries"]]  # type: ignore[union-attr, misc]
+        compiled.labels = list(payload["labels"])  # type: ignore[arg-type]
+        compiled.colors = list(payload["colors"])  # type: ignore[arg-type]
+        compiled.spawn_entries = [tuple(entry) for entry in payload["spawn_entries"]]  # type: ignore[union-attr, misc]
+        compiled.special_targets = dict(payload["special_targets"])  # type: ignore[arg-type]
+        compiled.max_targets = dict(payload["max_targets"])  # type: ignore[arg-type]
+        compiled.warnings = list(payload["warnings"])  # type: ignore[arg-type]
+        compiled.error = payload["error"]  # type: ignore[assignment]
+        return compiled
+
+
+def compile_items(
+    items: list[str], positions: list[tuple[int, int]] | None = None
+) -> CompiledConfig:
+    compiled = CompiledConfig(list(items))
+    module_index: dict[tuple[tuple[str, int | bool | float | str], ...], int] = {}
+    modules_by_name: dict[str, int] = {}
+
+    for idx, item in enumerate(items):
+        line, column_offset = (
+            positions[idx] if positions is not None and idx < len(positions) else (idx + 1, 0)
+        )
+        base_name, modules, diagnostics = module_parser.parse_item(item, line, column_offset)
+        compiled.warnings.extend(str(diagnostic) for diagnostic in diagnostics)
+
+        key = tuple(sorted(modules.items()))
+        spec_index = module_index.get(key)
+        if spec_index is None:
+            spec_index = len(compiled.modules)
+            module_index[key] = spec_index
+            compiled.modules.append(modules)
+
+        previous = modules_by_name.setdefault(base_name, spec_index)
+        if compiled.modules[previous] != modules:
+            compiled.error = (
+                "Conflicting modules found for choice "
+                f"'{base_name}'. All occurrences must use the same modules."
+            )
+            return compiled
+
+        compiled.entries.append((base_name, spec_index, bool(modules.get("missing"))))
+
+    visible_count = sum(1 for _, _, missing in compiled.entries if not missing)
+    compiled.colors = generate_colors(visible_count)
+    visible_index = 0
+    for entry_index, (base_name, spec_index, missing) in enumerate(compiled.entries):
+        modules = compiled.modules[spec_index]
+        if "spawn_initial" in modules and "spawn_repeat" in modules:
+            compiled.spawn_entries.append((entry_index, None if missing else visible_index))
+        if "special_target" in modules:
+            compiled.special_targets.setdefault(base_name, int(modules["special_target"]))
+        if "max" in modules:
+            compiled.max_targets.setdefault(base_name, int(modules["max"]))
+        if not missing:
+            label = base_name
+            if "special_target" in modules:
+                label = f"{label} (0/{modules['special_target']})"
+            compiled.labels.append(label)
+            visible_index += 1
+
+    return compiled
+
+
+def cache_path_for(config_path: Path) -> Path:
+    return config_path.with_name(f".{config_path.name}{CACHE_SUFFIX}")
+
+
+def content_digest(text: str) -> bytes:
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+def dump_compiled(compiled: CompiledConfig, digest: bytes) -> bytes:
+    payload = json.dumps(compiled.to_payload(), separators=(",", ":")).encode("utf-8")
+    return CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, digest) + zlib.compress(payload)
+
+
+def load_compiled(data: bytes, digest: bytes) -> CompiledConfig | None:
+    if len(data) < CACHE_HEADER.size:
+        return None
+    magic, version, stored_digest = CACHE_HEADER.unpack_from(data)
+    if magic != CACHE_MAGIC or version != CACHE_VERSION or stored_digest != digest:
+        return None
+    try:
+        payload = json.loads(zlib.decompress(data[CACHE_HEADER.size :]))
+        return CompiledConfig.from_payload(payload)
+    except (zlib.error, ValueError, KeyError, TypeError):
+        return None
+
+
+def load_or_compile(
+    config_path: Path,
+    text: str,
+    items: list[str],
+    positions: list[tuple[int, int]] | None = None,
+) -> CompiledConfig:
+    digest = content_digest(text)
+    cache_path = cache_path_for(config_path)
+    try:
+        compiled = load_compiled(cache_path.read_bytes(), digest)
+    except OSError:
+        compiled = None
+    if compiled is not None:
+        return compiled
+
+    compiled = compile_items(items, positions)
+    try:
+        cache_path.write_bytes(dump_compiled(compiled, digest))
+    except OSError:
+        pass
+    return compiled
@@ -0,0 +1,78 @@
+import bisect
+import math
+
+ModuleSpec = dict[str, int | bool | float | str]
+
+BPS_BOUNDS = ("bps_min", "bps_max")
+TIMER_BOUNDS = ("timer_min_seconds", "timer_max_seconds")
+
+
+def threshold_deadline(start: float, bound: str, seconds: int) -> float:
+    # "> min" opens on the first instant strictly past the threshold,
+    # ">= max" closes on the threshold itself.
+    due = start + seconds
+    if bound == "timer_min_seconds":
+        while due - start <= seconds:
+            due = math.nextafter(due, math.inf)
+    else:
+        while due - start < seconds:
+            due = math.nextafter(due, math.inf)
+    return due
+
+
+# Base names with BPM or timer bounds, keyed by the threshold values where
+# their eligibility can flip. All copies of a name share one module spec.
+class EligibilityIndex:
+    def __init__(self) -> None:
+        self.tracked: set[str] = set()
+        self.bps_thresholds: list[int] = []
+        self.names_by_bps: dict[int, set[str]] = {}
+        self.names_by_seconds: dict[tuple[str, int], set[str]] = {}
+        self.timer_names: set[str] = set()
+
+    def clear(self) -> None:
+        self.tracked.clear()
+        self.bps_thresholds.clear()
+        self.names_by_bps.clear()
+        self.names_by_seconds.clear()
+        self.timer_names.clear()
+
+    # Returns the (bound, seconds) timer thresholds that were not indexed before.
+    def track(self, base_name: str, modules: ModuleSpec) -> list[tuple[str, int]]:
+        if base_name in self.tracked:
+            return []
+
+        new_seconds = []
+        for key in BPS_BOUNDS:
+            value = modules.get(key)
+            if isinstance(value, int):
+                names = self.names_by_bps.get(value)
+                if names is None:
+                    names = self.names_by_bps[value] = set()
+                    bisect.insort(self.bps_thresholds, value)
+                names.add(base_name)
+                self.tracked.add(base_name)
+        for key in TIMER_BOUNDS:
+            value = modules.get(key)
+            if isinstance(value, int):
+                threshold = (key, value)
+                names = self.names_by_seconds.get(threshold)
+                if names is None:
+                    names = self.names_by_seconds[threshold] = set()
+                    new_seconds.append(threshold)
+                names.add(base_name)
+                self.timer_names.add(base_name)
+                self.tracked.add(base_name)
+        return new_seconds
+
+    def crossed_by_bps(self, old_bps: float, new_bps: float) -> set[str]:
+        low, high = min(old_bps, new_bps), max(old_bps, new_bps)
+        start = bisect.bisect_left(self.bps_thresholds, low)
+        stop = bisect.bisect_right(self.bps_thresholds, high)
+        names: set[str] = set()
+        for value in self.bps_thresholds[start:stop]:
+            names.update(self.names_by_bps[value])
+        return names
+
+    def crossed_at_seconds(self, threshold: tuple[str, int]) -> set[str]:
+        return self.names_by_seconds.get(threshold, set())
@@ -0,0 +1,1012 @@
+import contextlib
+import copy
+import math
+import random
+import re
+from typing import Callable
+
+import config_cache
+import module_parser
+from config_cache import CompiledConfig
+from eligibility import EligibilityIndex, threshold_deadline
+from item_store import ItemRecord, ItemStore
+from scheduler import Scheduler, TimerHandle
+from spin_trajectory import SpinTrajectory
+
+ModuleSpec = dict[str, int | bool | float | str]
+HiddenRecord = dict[str, str | ModuleSpec | None]
+EngineListener = Callable[[str, dict[str, object]], None]
+
+BOUND_KEYS = ("bps_min", "bps_max", "timer_min_seconds", "timer_max_seconds")
+
+# Emitted at most once per batch, with the payload of the last occurrence.
+COALESCED_EVENTS = frozenset({"items_changed", "bpm_changed", "timers_changed"})
+
+
+class WheelEngine:
+    def __init__(
+        self,
+        raw_items: list[str],
+        now: float = 0.0,
+        rng: random.Random | None = None,
+        initial_bps: int = 60,
+        positions: list[tuple[int, int]] | None = None,
+        compiled: CompiledConfig | None = None,
+    ) -> None:
+        if compiled is None:
+            compiled = config_cache.compile_items(raw_items, positions)
+        self.compiled = compiled
+        self.original_items = list(compiled.items)
+        self.rng = rng if rng is not None else random.Random()
+        self.listeners: list[EngineListener] = []
+        self.batch_depth = 0
+        self.deferred_events: dict[str, dict[str, object]] = {}
+        self.now = now
+        self.initial_bps = initial_bps
+
+        self.store = ItemStore()
+        # Hidden records keyed by a sequence number so restores keep hide order.
+        self.hidden: dict[int, HiddenRecord] = {}
+        self.hidden_by_name: dict[str, dict[int, None]] = {}
+        self.hidden_seq = 0
+        self.eligibility = EligibilityIndex()
+        self.spawn_configs: list[dict[str, int | str]] = []
+        self.special_targets_by_name: dict[str, int] = {}
+        self.special_counts_by_name: dict[str, int] = {}
+        self.max_targets_by_name: dict[str, int] = {}
+        self.max_counts_by_name: dict[str, int] = {}
+        self.max_blocked_names: set[str] = set()
+        self.scheduler = Scheduler()
+        self.wheel_angle = 0.0
+        self.trajectory: SpinTrajectory | None = None
+        self.config_error: str | None = None
+        self.config_warnings: list[str] = []
+
+        self.reset_state()
+        self.parse_items_and_modules()
+
+    @property
+    def items(self) -> tuple[str, ...]:
+        return self.store.column("label")  # type: ignore[return-value]
+
+    @property
+    def base_names(self) -> tuple[str, ...]:
+        return self.store.column("base_name")  # type: ignore[return-value]
+
+    @property
+    def item_modules(self) -> tuple[ModuleSpec, ...]:
+        return self.store.column("modules")  # type: ignore[return-value]
+
+    @property
+    def colors(self) -> tuple[str, ...]:
+        return self.store.column("color")  # type: ignore[return-value]
+
+    @property
+    def hidden_items(self) -> list[HiddenRecord]:
+        return list(self.hidden.values())
+
+    def subscribe(self, listener: EngineListener) -> None:
+        self.listeners.append(listener)
+
+    def emit(self, event: str, **payload: object) -> None:
+        if self.batch_depth and event in COALESCED_EVENTS:
+            self.deferred_events.pop(event, None)
+            self.deferred_events[event] = payload
+            return
+        for listener in self.listeners:
+            listener(event, payload)
+
+    @contextlib.contextmanager
+    def batch(self):
+        self.batch_depth += 1
+        try:
+            yield self
+        finally:
+            self.batch_depth -= 1
+            if not self.batch_depth:
+                deferred = self.deferred_events
+                self.deferred_events = {}
+                for event, payload in deferred.items():
+                    self.emit(event, **payload)
+
+    @classmethod
+    def from_compiled(
+        cls,
+        compiled: CompiledConfig,
+        now: float = 0.0,
+        rng: random.Random | None = None,
+        initial_bps: int = 60,
+    ) -> "WheelEngine":
+        return cls(compiled.items, now=now, rng=rng, initial_bps=initial_bps, compiled=compiled)
+
+    # Everything a session changes, as plain JSON-compatible values. The
+    # config itself is not included; from_payload rebuilds the derived indexes
+    # from it. Add new state here explicitly (and bump the journal version).
+    def to_payload(self) -> dict[str, object]:
+        version, internal, gauss_next = self.rng.getstate()
+        timers = []
+        for handle in sorted(self.scheduler.pending(), key=lambda handle: handle.seq):
+            payload = handle.payload
+            if handle.kind == "spawn":
+                payload = next(
+                    index for index, config in enumerate(self.spawn_configs) if config is payload
+                )
+            timers.append([handle.kind, handle.due, handle.remaining, payload])
+        trajectory = self.trajectory
+        return {
+            "now": self.now,
+            "initial_bps": self.initial_bps,
+            "rng": [version, list(internal), gauss_next],
+            "items": [
+                [record.base_name, record.modules, record.color, record.label]
+                for record in self.store
+            ],
+            "hidden": [
+                [hidden_id, record["base_name"], record["modules"], record["color"]]
+                for hidden_id, record in self.hidden.items()
+            ],
+            "hidden_seq": self.hidden_seq,
+            "spawn_configs": self.spawn_configs,
+            "special_targets_by_name": self.special_targets_by_name,
+            "special_counts_by_name": self.special_counts_by_name,
+            "max_targets_by_name": self.max_targets_by_name,
+            "max_counts_by_name": self.max_counts_by_name,
+            "max_blocked_names": sorted(self.max_blocked_names),
+            "timers": timers,
+            "wheel_angle": self.wheel_angle,
+            "trajectory": None
+            if trajectory is None
+            else [
+                trajectory.start_angle,
+                trajectory.initial_speed,
+                trajectory.noise,
+                trajectory.noise_step,
+            ],
+            "spawn_started": self.spawn_started,
+            "game_over": self.game_over,
+            "spinning": self.spinning,
+            "pending_multiplier": self.pending_multiplier,
+            "bps": self.bps,
+            "wheel_pause_active": self.wheel_pause_active,
+            "wheel_pause_end_time": self.wheel_pause_end_time,
+            "heartbeat_pause_active": self.heartbeat_pause_active,
+            "heartbeat_pause_end_time": self.heartbeat_pause_end_time,
+            "post_pause_reset_pending": self.post_pause_reset_pending,
+            "first_spin_time": self.first_spin_time,
+            "session_start_time": self.session_start_time,
+        }
+
+    @classmethod
+    def from_payload(cls, compiled: CompiledConfig, payload: dict[str, object]) -> "WheelEngine":
+        version, internal, gauss_next = payload["rng"]  # type: ignore[misc]
+        rng = random.Random()
+        rng.setstate((version, tuple(internal), gauss_next))
+        engine = cls.from_compiled(
+            compiled,
+            now=float(payload["now"]),  # type: ignore[arg-type]
+            rng=rng,
+            initial_bps=int(payload["initial_bps"]),  # type: ignore[arg-type]
+        )
+
+        engine.store.clear()
+        for base_name, modules, color, label in payload["items"]:  # type: ignore[union-attr]
+            engine.store.append(ItemRecord(base_name, modules, color, label))
+        engine.hidden.clear()
+        engine.hidden_by_name.clear()
+        for hidden_id, base_name, modules, color in payload["hidden"]:  # type: ignore[union-attr]
+            engine.hidden[hidden_id] = {"base_name": base_name, "modules": modules, "color": color}
+            engine.hidden_by_name.setdefault(base_name, {})[hidden_id] = None
+        engine.hidden_seq = int(payload["hidden_seq"])  # type: ignore[arg-type]
+        engine.spawn_configs = list(payload["spawn_configs"])  # type: ignore[arg-type]
+        engine.special_targets_by_name = dict(payload["special_targets_by_name"])  # type: ignore[arg-type]
+        engine.special_counts_by_name = dict(payload["special_counts_by_name"])  # type: ignore[arg-type]
+        engine.max_targets_by_name = dict(payload["max_targets_by_name"])  # type: ignore[arg-type]
+        engine.max_counts_by_name = dict(payload["max_counts_by_name"])  # type: ignore[arg-type]
+        engine.max_blocked_names = set(payload["max_blocked_names"])  # type: ignore[arg-type]
+
+        engine.scheduler.clear()
+        for kind, due, remaining, timer_payload in payload["timers"]:  # type: ignore[union-attr]
+            if kind == "spawn":
+                timer_payload = engine.spawn_configs[timer_payload]
+            elif kind in ("cooldown", "eligibility"):
+                timer_payload = tuple(timer_payload)
+            handle = engine.scheduler.schedule_at(due, kind, timer_payload)
+            if remaining is not None:
+                handle.remaining = remaining
+                engine.scheduler.frozen[handle.seq] = handle
+                engine.scheduler.live -= 1
+
+        trajectory = payload["trajectory"]
+        engine.trajectory = None if trajectory is None else SpinTrajectory(*trajectory)  # type: ignore[misc]
+        for name in (
+            "wheel_angle",
+            "spawn_started",
+            "game_over",
+            "spinning",
+            "pending_multiplier",
+            "bps",
+            "wheel_pause_active",
+            "wheel_pause_end_time",
+            "heartbeat_pause_active",
+            "heartbeat_pause_end_time",
+            "post_pause_reset_pending",
+            "first_spin_time",
+            "session_start_time",
+        ):
+            setattr(engine, name, payload[name])
+        return engine
+
+    def reset_state(self) -> None:
+        self.scheduler.clear()
+        self.spawn_started = False
+        self.game_over = False
+        self.spinning = False
+        self.wheel_angle = 0.0
+        self.trajectory = None
+        self.pending_multiplier = 1
+        self.bps: float = self.initial_bps
+        self.clamp_bps()
+        self.wheel_pause_active = False
+        self.wheel_pause_end_time = 0.0
+        self.heartbeat_pause_active = False
+        self.heartbeat_pause_end_time = 0.0
+        self.post_pause_reset_pending = False
+        self.first_spin_time: float | None = None
+        self.session_start_time: float | None = None
+
+    def restart(self, now: float) -> None:
+        self.now = now
+        session_start_time = self.session_start_time
+        with self.batch():
+            self.reset_state()
+            self.session_start_time = session_start_time
+            self.parse_items_and_modules()
+            self.emit("restarted", now=now)
+            self.emit("items_changed")
+            self.emit("bpm_changed", bpm=self.display_bps_value())
+            self.emit("timers_changed")
+
+    @staticmethod
+    def generate_colors(count: int) -> list[str]:
+        return config_cache.generate_colors(count)
+
+    def parse_items_and_modules(self) -> None:
+        compiled = self.compiled
+        self.store.clear()
+        self.hidden.clear()
+        self.hidden_by_name.clear()
+        self.eligibility.clear()
+        self.spawn_configs.clear()
+        self.special_targets_by_name.clear()
+        self.special_counts_by_name.clear()
+        self.max_targets_by_name.clear()
+        self.max_counts_by_name.clear()
+        self.max_blocked_names.clear()
+        self.config_error = compiled.error
+        self.config_warnings = list(compiled.warnings)
+        if compiled.error is not None:
+            return
+
+        # Module specs are shared with the compiled config and never mutated.
+        visible_entries = (entry for entry in compiled.entries if not entry[2])
+        for (base_name, spec_index, _), color, label in zip(
+            visible_entries, compiled.colors, compiled.labels
+        ):
+            self.store.append(ItemRecord(base_name, compiled.modules[spec_index], color, label))
+
+        bounded_specs = {
+            spec_index
+            for spec_index, modules in enumerate(compiled.modules)
+            if any(key in modules for key in BOUND_KEYS)
+        }
+        for base_name, spec_index, _ in compiled.entries:
+            if spec_index in bounded_specs:
+                self.eligibility.track(base_name, compiled.modules[spec_index])
+
+        for entry_index, visible_index in compiled.spawn_entries:
+            base_name, spec_index, _ = compiled.entries[entry_index]
+            modules = compiled.modules[spec_index]
+            self.spawn_configs.append(
+                {
+                    "index": visible_index,
+                    "base_name": base_name,
+                    "initial_delay": modules["spawn_initial"],
+                    "repeat_delay": modules["spawn_repeat"],
+                    "color": None if visible_index is None else compiled.colors[visible_index],
+                    "modules": copy.deepcopy(modules),
+                }
+            )
+
+        self.special_targets_by_name.update(compiled.special_targets)
+        self.special_counts_by_name.update(dict.fromkeys(compiled.special_targets, 0))
+        self.max_targets_by_name.update(compiled.max_targets)
+        self.max_counts_by_name.update(dict.fromkeys(compiled.max_targets, 0))
+
+        self.apply_bps_conditions()
+
+    @staticmethod
+    def extract_base_and_modules(item: str) -> tuple[str, list[str]]:
+        return module_parser.split_item(item)
+
+    @staticmethod
+    def interpret_modules(module_texts: list[str]) -> ModuleSpec:
+        return module_parser.interpret_modules(module_texts)
+
+    def is_item_allowed_by_bps(self, modules: ModuleSpec) -> bool:
+        min_bps = modules.get("bps_min")
+        max_bps = modules.get("bps_max")
+
+        if isinstance(min_bps, int) and self.bps <= min_bps:
+            return False
+        if isinstance(max_bps, int) and self.bps >= max_bps:
+            return False
+        return True
+
+    def current_timer_seconds(self) -> float:
+        if self.first_spin_time is None:
+            return 0.0
+        return self.now - self.first_spin_time
+
+    def timer_display_value(self) -> str:
+        elapsed = int(self.current_timer_seconds())
+        minutes, seconds = divmod(elapsed, 60)
+        return f"{minutes:02d}:{seconds:02d}"
+
+    def is_item_allowed_by_timer(self, modules: ModuleSpec) -> bool:
+        min_seconds = modules.get("timer_min_seconds")
+        max_seconds = modules.get("timer_max_seconds")
+        elapsed = self.current_timer_seconds()
+
+        if isinstance(min_seconds, int) and elapsed <= min_seconds:
+            return False
+        if isinstance(max_seconds, int) and elapsed >= max_seconds:
+            return False
+        return True
+
+    def is_item_allowed(self, modules: ModuleSpec) -> bool:
+        return self.is_item_allowed_by_bps(modules) and self.is_item_allowed_by_timer(modules)
+
+    def format_item_label(self, idx: int) -> str:
+        record = self.store[idx]
+        return self.label_for(record.base_name, record.modules)
+
+    def label_for(self, base_name: str, modules: ModuleSpec) -> str:
+        label = base_name
+        if "special_target" in modules:
+            target = modules["special_target"]
+            current = self.special_counts_by_name.get(base_name, 0)
+            label = f"{label} ({current}/{target})"
+        return label
+
+    def add_item_with_modules(
+        self,
+        base_name: str,
+        modules: ModuleSpec,
+        color: str | None = None,
+        register_spawn: bool = False,
+    ) -> None:
+        modules = copy.deepcopy(modules)
+        if base_name in self.max_blocked_names:
+            return
+
+        self.track_bounds(base_name, modules)
+        if not self.is_item_allowed(modules):
+            self.hide_record({"base_name": base_name, "modules": modules, "color": color})
+            return
+
+        if "max" in modules and base_name not in self.max_targets_by_name:
+            self.max_targets_by_name[base_name] = int(modules["max"])
+            self.max_counts_by_name[base_name] = 0
+
+        if color is None:
+            palette = self.generate_colors(len(self.store) + 1)
+            color = palette[len(self.store)]
+
+        new_index = len(self.store)
+        if "special_target" in modules:
+            target = modules["special_target"]
+            if base_name not in self.special_targets_by_name:
+                self.special_targets_by_name[base_name] = target
+                self.special_counts_by_name[base_name] = 0
+
+        label = self.label_for(base_name, modules)
+        self.store.append(ItemRecord(base_name, copy.deepcopy(modules), str(color), label))
+
+        if (
+            register_spawn
+            and "spawn_initial" in modules
+            and "spawn_repeat" in modules
+        ):
+            self.spawn_configs.append(
+                {
+                    "index": new_index,
+                    "base_name": base_name,
+                    "initial_delay": modules["spawn_initial"],
+                    "repeat_delay": modules["spawn_repeat"],
+                    "color": color,
+                    "modules": copy.deepcopy(modules),
+                }
+            )
+
+    def track_bounds(self, base_name: str, modules: ModuleSpec) -> None:
+        if base_name in self.eligibility.tracked:
+            return
+        new_seconds = self.eligibility.track(base_name, modules)
+        if new_seconds and self.first_spin_time is not None:
+            for threshold in new_seconds:
+                self.schedule_threshold(threshold)
+
+    def hide_record(self, record: HiddenRecord) -> None:
+        self.hidden_seq += 1
+        self.hidden[self.hidden_seq] = record
+        self.hidden_by_name.setdefault(str(record["base_name"]), {})[self.hidden_seq] = None
+
+    def unhide_record(self, hidden_id: int) -> HiddenRecord:
+        record = self.hidden.pop(hidden_id)
+        base_name = str(record["base_name"])
+        named = self.hidden_by_name[base_name]
+        del named[hidden_id]
+        if not named:
+            del self.hidden_by_name[base_name]
+        return record
+
+    def apply_bps_conditions(self) -> None:
+        self.refresh_eligibility(self.eligibility.tracked)
+
+    # Only names whose bounds may have been crossed are re-checked.
+    def refresh_eligibility(self, names: set[str]) -> None:
+        closing = [
+            item
+            for name in names
+            for item in self.store.named(name)
+            if not self.is_item_allowed(item.modules)
+        ]
+        closing.sort(key=lambda item: item.slot, reverse=True)
+        for item in closing:
+            self.hide_record(
+                {"base_name": item.base_name, "modules": item.modules, "color": item.color}
+            )
+            self.store.discard(item)
+
+        opening = sorted(
+            hidden_id
+            for name in names
+            for hidden_id in self.hidden_by_name.get(name, ())
+            if self.is_item_allowed(self.hidden[hidden_id]["modules"])  # type: ignore[arg-type]
+        )
+        for hidden_id in opening:
+            record = self.unhide_record(hidden_id)
+            color = record.get("color")
+            self.add_item_with_modules(
+                str(record["base_name"]),
+                record["modules"],  # type: ignore[arg-type]
+                str(color) if color else None,
+                register_spawn=False,
+            )
+
+        if closing or opening:
+            self.emit("items_changed")
+
+    def schedule_threshold(self, threshold: tuple[str, int]) -> None:
+        if self.first_spin_time is None:
+            return
+        due = threshold_deadline(self.first_spin_time, *threshold)
+        if due > self.now:
+            self.schedule_at(due, "eligibility", threshold)
+
+    def schedule_thresholds(self) -> None:
+        self.cancel_timers("eligibility")
+        for threshold in self.eligibility.names_by_seconds:
+            self.schedule_threshold(threshold)
+
+    def timer_bounds_changed(self) -> None:
+        self.schedule_thresholds()
+        self.refresh_eligibility(self.eligibility.timer_names)
+
+    def remove_item(self, index: int) -> None:
+        if index < 0 or index >= len(self.store):
+            return
+
+        self.store.discard(self.store[index])
+        self.emit("items_changed")
+
+    def update_special_label(self, index: int) -> None:
+        record = self.store[index]
+        self.store.relabel(record, self.label_for(record.base_name, record.modules))
+        self.emit("items_changed")
+
+    def remove_all_items_by_base_name(self, base_name: str) -> int:
+        removed = 0
+        for record in self.store.named(base_name):
+            self.store.discard(record)
+            removed += 1
+        if removed:
+            self.emit("items_changed")
+        hidden_ids = list(self.hidden_by_name.get(base_name, ()))
+        for hidden_id in hidden_ids:
+            self.unhide_record(hidden_id)
+        hidden_removed = len(hidden_ids)
+        self.spawn_configs = [
+            cfg for cfg in self.spawn_configs if cfg.get("base_name") != base_name
+        ]
+        # Their pending spawns go too; a timer must not outlive its config.
+        for handle in self.scheduler.pending("spawn"):
+            if handle.payload.get("base_name") == base_name:  # type: ignore[union-attr]
+                self.cancel_timer(handle)
+        return removed + hidden_removed
+
+    def display_bps_value(self) -> int:
+        return int(round(self.bps))
+
+    def clamp_bps(self) -> None:
+        self.bps = min(600, max(1, self.bps))
+
+    def schedule(self, delay: float, kind: str, payload: object = None) -> TimerHandle:
+        return self.schedule_at(self.now + delay, kind, payload)
+
+    def schedule_at(self, due: float, kind: str, payload: object = None) -> TimerHandle:
+        handle = self.scheduler.schedule_at(due, kind, payload)
+        self.emit("timers_changed")
+        return handle
+
+    def cancel_timer(self, handle: TimerHandle | None) -> None:
+        if self.scheduler.cancel(handle):
+            self.emit("timers_changed")
+
+    def cancel_timers(self, *kinds: str) -> None:
+        if self.scheduler.cancel_kind(*kinds):
+            self.emit("timers_changed")
+
+    def freeze_timers(self, *kinds: str) -> None:
+        if self.scheduler.freeze(self.now, *kinds):
+            self.emit("timers_changed")
+
+    def thaw_timers(self) -> None:
+        if self.scheduler.thaw(self.now):
+            self.emit("timers_changed")
+
+    def pending_timers(self, kind: str) -> int:
+        return self.scheduler.count(kind)
+
+    def next_deadline(self) -> float | None:
+        return self.scheduler.next_deadline()
+
+    def advance(self, now: float) -> None:
+        with self.batch():
+            while (handle := self.scheduler.pop_due(now)) is not None:
+                self.now = handle.due
+                self.emit("timer_fired", kind=handle.kind, due=handle.due, now=now)
+                self.fire_timer(handle.kind, handle.payload)
+            self.now = now
+
+    def fire_timer(self, kind: str, payload: object) -> None:
+        if kind == "spawn":
+            self.apply_spawn_effect(payload)  # type: ignore[arg-type]
+        elif kind == "cooldown":
+            base_name, modules, color = payload  # type: ignore[misc]
+            self.restore_cooldown_item(base_name, modules, color)
+        elif kind == "wheel_pause":
+            self.finish_wheel_pause()
+        elif kind == "heartbeat_pause":
+            self.finish_heartbeat_pause()
+        elif kind == "eligibility":
+            self.refresh_eligibility(self.eligibility.crossed_at_seconds(payload))  # type: ignore[arg-type]
+
+    def start_spawn_timers_if_needed(self) -> None:
+        if self.spawn_started:
+            return
+
+        self.spawn_started = True
+        self.schedule_spawn_items()
+
+    def schedule_spawn_items(self) -> None:
+        self.cancel_timers("spawn")
+        for config in self.spawn_configs:
+            delay = config["initial_delay"] if config["initial_delay"] > 0 else config["repeat_delay"]
+            if delay <= 0:
+                continue
+            self.schedule(int(delay), "spawn", config)
+
+    def apply_spawn_effect(self, config: dict[str, int | str]) -> None:
+        base_name = str(config["base_name"])
+        if base_name in self.max_blocked_names:
+            return
+
+        repeat_delay = int(config["repeat_delay"])
+        self.duplicate_spawn_item(config)
+
+        if repeat_delay > 0:
+            self.schedule(repeat_delay, "spawn", config)
+
+    def duplicate_spawn_item(self, config: dict[str, int | str]) -> None:
+        base_name = str(config["base_name"])
+        if base_name in self.max_blocked_names:
+            return
+
+        modules = config.get("modules", {})
+        color = config.get("color")
+        self.add_item_with_modules(base_name, dict(modules), str(color) if color else None)
+        self.emit("items_changed")
+
+    def restore_cooldown_item(
+        self, base_name: str, modules: ModuleSpec, color: str | None
+    ) -> None:
+        self.add_item_with_modules(base_name, modules, color)
+        self.emit("items_changed")
+
+    def reset_spin_timer(self) -> None:
+        self.first_spin_time = self.now
+        self.emit("timer_reset")
+        self.timer_bounds_changed()
+
+    def stop_spin_timer(self) -> None:
+        self.first_spin_time = None
+        self.emit("timer_stopped")
+        self.timer_bounds_changed()
+
+    def start_spin(self, now: float) -> tuple[bool, str | None]:
+        self.now = now
+        if self.game_over:
+            return False, "Game over. Press Restart to play again."
+        if self.wheel_pause_active:
+            return False, None
+        if self.spinning:
+            return False, None
+        if not self.items:
+            return False, "No available choices. Adjust BPM or restart."
+
+        if self.first_spin_time is None:
+            if self.session_start_time is None:
+                self.session_start_time = now
+            self.first_spin_time = now
+            self.schedule_thresholds()
+        elif self.session_start_time is None:
+            self.session_start_time = now
+
+        self.start_spawn_timers_if_needed()
+        self.spinning = True
+        # The whole spin is drawn here so the outcome does not depend on frames.
+        self.trajectory = SpinTrajectory.generate(self.rng, self.wheel_angle)
+        self.emit("spin_started", now=now)
+        return True, None
+
+    def spin(self, now: float) -> dict[str, object] | None:
+        # Headless spin: land on the precomputed winner without animating.
+        started, _ = self.start_spin(now)
+        if not started:
+            return None
+        return self.finish_spin(self.trajectory.winning_index(len(self.items)), now)
+
+    def finish_spin(
+        self, index: int, now: float, angle: float | None = None
+    ) -> dict[str, object]:
+        # `angle` is where the view left the wheel when it is not the exact end
+        # of the trajectory, e.g. snapped to a sprite frame.
+        if angle is None and self.trajectory is not None:
+            angle = self.trajectory.final_angle
+        self.now = now
+        self.emit("spin_finished", index=index, angle=angle, now=now)
+        self.spinning = False
+        self.trajectory = None
+        if angle is not None:
+            self.wheel_angle = angle
+        if not self.items:
+            message = "No items remain. Ending game."
+            self.end_game(message)
+            return {"message": message, "ended": True, "paused": False}
+
+        if index >= len(self.store):
+            message = "All items were removed during the spin."
+            self.end_game(message)
+            return {"message": message, "ended": True, "paused": False}
+
+        record = self.store[index]
+        winner = record.label
+        base_name = record.base_name
+        modules = record.modules
+        selected_index = index
+        selected_winner = winner
+        selected_base_name = base_name
+        selected_modules = copy.deepcopy(modules)
+        lowered_winner = base_name.strip().lower()
+        multiplier_match = re.fullmatch(r"(\d+)x", lowered_winner)
+        multiplier_value = int(multiplier_match.group(1)) if multiplier_match else None
+        applied_multiplier = self.pending_multiplier
+        is_special_multiplier = multiplier_value is not None
+        bpm_effect_multiplier = applied_multiplier if applied_multiplier > 1 else 1
+        has_bpm_effect = "bpm_multiplier" in modules or "bpm_boost" in modules
+        if not has_bpm_effect:
+            bpm_effect_multiplier = 1
+
+        display_winner = selected_winner
+        if applied_multiplier > 1:
+            display_winner = f"{applied_multiplier}x {selected_winner}"
+
+        timer_reset_at: str | None = None
+        previous_bpm = self.display_bps_value()
+        final_bpm = previous_bpm
+        logged = False
+
+        def timer_log_text() -> str:
+            if timer_reset_at is not None:
+                return f"Timer has been reset at {timer_reset_at}"
+            return self.timer_display_value()
+
+        def bpm_log_text() -> str:
+            if final_bpm > previous_bpm:
+                return f"BPM increased to {final_bpm}"
+            if final_bpm < previous_bpm:
+                return f"BPM reduced to {final_bpm}"
+            return str(final_bpm)
+
+        def log_spin() -> None:
+            nonlocal logged
+            if logged:
+                return
+            self.emit(
+                "spin_logged",
+                selection=display_winner,
+                timer_text=timer_log_text(),
+                bpm_text=bpm_log_text(),
+            )
+            logged = True
+
+        if is_special_multiplier:
+            self.pending_multiplier *= multiplier_value
+        else:
+            # Deplete any stored multiplier as soon as a non-multiplier choice resolves.
+            self.pending_multiplier = 1
+
+        module_messages = []
+        bpm_changed = False
+        previous_bps = self.bps
+        applied_multiplier_value: float | None = None
+        applied_boost_value: int | None = None
+        if "bpm_multiplier" in selected_modules:
+            multiplier = float(selected_modules["bpm_multiplier"])
+            total_multiplier = math.pow(multiplier, bpm_effect_multiplier)
+            self.bps *= total_multiplier
+            bpm_changed = True
+            applied_multiplier_value = total_multiplier
+
+        if "bpm_boost" in selected_modules:
+            boost = selected_modules["bpm_boost"] * bpm_effect_multiplier
+            self.bps += boost
+            bpm_changed = True
+            applied_boost_value = boost
+
+        if bpm_changed:
+            self.clamp_bps()
+            self.emit("bpm_changed", bpm=self.display_bps_value())
+            self.refresh_eligibility(self.eligibility.crossed_by_bps(previous_bps, self.bps))
+
+            new_bpm_text = self.display_bps_value()
+            final_bpm = new_bpm_text
+            if applied_multiplier_value is not None:
+                module_messages.append(
+                    f"BPM multiplied by {applied_multiplier_value} to {new_bpm_text}."
+                )
+            if applied_boost_value is not None:
+                module_messages.append(
+                    f"BPM increased by {applied_boost_value} to {new_bpm_text}."
+                )
+
+        if "sound_effect" in selected_modules:
+            self.emit("sound", filename=str(selected_modules["sound_effect"]))
+
+        if selected_modules.get("reset_timer"):
+            timer_reset_at = self.timer_display_value()
+            self.reset_spin_timer()
+            module_messages.append("Timer reset.")
+
+        ended, message = self.handle_special_result(
+            selected_base_name, display_winner, 1
+        )
+
+        max_ended, max_message = self.handle_max_result(selected_base_name, display_winner)
+        if max_message:
+            message = max_message
+        ended = ended or max_ended
+        reached_max = False
+        if selected_base_name in self.max_targets_by_name:
+            reached_max = (
+                self.max_counts_by_name.get(selected_base_name, 0)
+                >= self.max_targets_by_name.get(selected_base_name, 0)
+            )
+
+        if "fragile" in selected_modules and not ended and not reached_max:
+            message = self.handle_fragile_result(
+                selected_index, selected_base_name, display_winner
+            )
+            ended = self.game_over
+
+        if (
+            "cooldown" in selected_modules
+            and not ended
+            and selected_base_name not in self.max_blocked_names
+            and not reached_max
+        ):
+            cooldown_record = self.store.first_named(selected_base_name)
+            if cooldown_record is not None:
+                ended, message = self.handle_cooldown_result(
+                    self.store.index_of(cooldown_record), display_winner
+                )
+
+        if not ended:
+            pause_heartbeat_seconds = (
+                int(selected_modules.get("pause_heartbeat", 0))
+                if "pause_heartbeat" in selected_modules
+                else 0
+            )
+            post_pause_reset = bool(selected_modules.get("post_pause_reset"))
+            if pause_heartbeat_seconds > 0:
+                heartbeat_duration = pause_heartbeat_seconds
+                self.start_heartbeat_pause(heartbeat_duration)
+                if post_pause_reset:
+                    self.post_pause_reset_pending = True
+                module_messages.append(
+                    f"Heartbeat paused for {heartbeat_duration} seconds."
+                )
+
+            pause_wheel_seconds = (
+                int(selected_modules.get("pause_wheel", 0))
+                if "pause_wheel" in selected_modules
+                else 0
+            )
+            if pause_wheel_seconds > 0:
+                wheel_duration = pause_wheel_seconds
+                self.start_wheel_pause(wheel_duration)
+                if post_pause_reset:
+                    self.post_pause_reset_pending = True
+                module_messages.append(
+                    f"Wheel paused for {wheel_duration} seconds."
+                )
+                if module_messages:
+                    message = f"{message} {' '.join(module_messages)}".strip()
+                log_spin()
+                return {"message": message, "ended": False, "paused": True}
+
+        if module_messages:
+            message = f"{message} {' '.join(module_messages)}".strip()
+
+        if not ended and not self.items:
+            message = "All items were removed during the spin."
+            self.end_game(message)
+            ended = True
+
+        log_spin()
+        return {"message": message, "ended": ended, "paused": False}
+
+    def handle_special_result(
+        self, base_name: str, display_winner: str, applied_multiplier: int = 1
+    ) -> tuple[bool, str]:
+        if base_name not in self.special_targets_by_name:
+            return False, f"Result: {display_winner}."
+
+        self.special_counts_by_name[base_name] += max(1, applied_multiplier)
+        target = self.special_targets_by_name[base_name]
+        name = base_name
+        current = self.special_counts_by_name[base_name]
+        display_current = min(current, target)
+        if current >= target:
+            message = f"{name} was chosen {target} times"
+            self.end_game(message)
+            return True, message
+
+        return (
+            False,
+            f"Result: {display_winner}. {name} chosen {display_current}/{target}.",
+        )
+
+    def handle_max_result(self, base_name: str, display_winner: str) -> tuple[bool, str | None]:
+        if base_name not in self.max_targets_by_name:
+            return False, None
+
+        self.max_counts_by_name[base_name] += 1
+        current = self.max_counts_by_name[base_name]
+        target = self.max_targets_by_name[base_name]
+        if current < target:
+            return False, (
+                f"{display_winner} progress {current}/{target} towards Max."
+            )
+
+        self.max_blocked_names.add(base_name)
+        removed = self.remove_all_items_by_base_name(base_name)
+        if not self.items:
+            message = f"{display_winner} reached Max {target}. No items remain."
+            self.end_game(message)
+            return True, message
+
+        return (
+            False,
+            f"{display_winner} reached Max {target}. Removed {removed} choice(s).",
+        )
+
+    def handle_cooldown_result(self, index: int, display_winner: str) -> tuple[bool, str]:
+        record = self.store[index]
+        modules = record.modules
+        base_name = record.base_name
+        duration = int(modules.get("cooldown", 0))
+        if duration <= 0:
+            return False, f"Result: {display_winner}."
+
+        color = record.color
+        modules_copy = dict(modules)
+        self.remove_item(index)
+        self.schedule(duration, "cooldown", (base_name, modules_copy, color))
+
+        if not self.items:
+            message = f"{display_winner} is on cooldown for {duration} seconds. No items remain."
+            self.end_game(message)
+            return True, message
+
+        return (
+            False,
+            f"{display_winner} is on cooldown for {duration} seconds.",
+        )
+
+    def handle_fragile_result(self, index: int, base_name: str, display_winner: str) -> str:
+        target: ItemRecord | None = None
+        if 0 <= index < len(self.store) and self.store[index].base_name == base_name:
+            target = self.store[index]
+        else:
+            candidates = self.store.named(base_name)
+            if candidates:
+                self.store.compact()
+                target = min(candidates, key=lambda record: abs(record.slot - index))
+
+        if target is not None:
+            self.store.discard(target)
+            self.emit("items_changed")
+        if not self.store:
+            end_message = f"{display_winner} was destroyed. No items remain."
+            self.end_game(end_message)
+            return end_message
+
+        return f"{display_winner} was destroyed after being chosen."
+
+    def start_wheel_pause(self, duration: float) -> None:
+        self.cancel_wheel_pause()
+        self.wheel_pause_active = True
+        self.wheel_pause_end_time = self.now + duration
+        self.schedule(duration, "wheel_pause")
+        self.emit("wheel_pause_started", duration=duration)
+
+    def start_heartbeat_pause(self, duration: float) -> None:
+        self.cancel_heartbeat_pause()
+        self.heartbeat_pause_active = True
+        self.heartbeat_pause_end_time = self.now + duration
+        self.schedule(duration, "heartbeat_pause")
+        self.emit("heartbeat_pause_started", duration=duration)
+
+    def apply_post_pause_reset(self) -> bool:
+        if not self.post_pause_reset_pending:
+            return False
+
+        self.post_pause_reset_pending = False
+        self.stop_spin_timer()
+        return True
+
+    def finish_wheel_pause(self) -> None:
+        self.wheel_pause_active = False
+        timer_stopped = self.apply_post_pause_reset()
+        self.emit("wheel_pause_ended", timer_stopped=timer_stopped)
+
+    def finish_heartbeat_pause(self) -> None:
+        self.heartbeat_pause_active = False
+        timer_stopped = self.apply_post_pause_reset()
+        self.emit("heartbeat_pause_ended", timer_stopped=timer_stopped)
+
+    def cancel_wheel_pause(self) -> None:
+        self.cancel_timers("wheel_pause")
+        self.wheel_pause_active = False
+
+    def cancel_heartbeat_pause(self) -> None:
+        self.cancel_timers("heartbeat_pause")
+        self.heartbeat_pause_active = False
+
+    def end_game(self, message: str) -> None:
+        self.game_over = True
+        self.cancel_wheel_pause()
+        self.cancel_heartbeat_pause()
+        self.emit("game_over", message=message)
@@ -0,0 +1,47 @@
+import math
+
+DEFAULT_FPS = 60.0
+
+
+# Frames are aimed at absolute deadlines (start + n * interval) instead of
+# "16 ms after the last one finished", so slow frames do not push every later
+# frame back. Frames sample the spin at their wall time, so the spin covers
+# the same ground at any frame rate or after a stall.
+class FramePacer:
+    def __init__(self, fps: float = DEFAULT_FPS) -> None:
+        if fps <= 0:
+            raise ValueError("fps must be positive")
+        self.fps = fps
+        self.frame_interval = 1.0 / fps
+        self.started = 0.0
+        self.next_frame = 0.0
+        self.frames = 0
+        self.late_frames = 0
+        self.dropped_frames = 0
+        self.worst_lateness = 0.0
+
+    def start(self, now: float) -> None:
+        self.started = now
+        self.next_frame = now
+
+    def begin_frame(self, now: float) -> None:
+        self.frames += 1
+        lateness = now - self.next_frame
+        if lateness > self.frame_interval / 2:
+            self.late_frames += 1
+            self.worst_lateness = max(self.worst_lateness, lateness)
+        missed = max(0, int(lateness / self.frame_interval))
+        self.dropped_frames += missed
+        self.next_frame += (missed + 1) * self.frame_interval
+
+    def delay_ms(self, now: float) -> int:
+        return max(1, math.ceil((self.next_frame - now) * 1000))
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "fps": self.fps,
+            "frames": self.frames,
+            "late_frames": self.late_frames,
+            "dropped_frames": self.dropped_frames,
+            "worst_lateness_ms": self.worst_lateness * 1000,
+        }
@@ -0,0 +1,146 @@
+from audio_backends import AudioBackend
+from engine import WheelEngine
+from label_layout import LabelLayoutCache, estimate_text_width
+from sound_cache import SoundCache
+from wheel import WheelOfFortune
+from wheel_lod import DetailController
+
+
+# Stand-ins for the Tk variables and widgets the wheel talks to, so the view
+# can run without a display (benchmark.py, the tests). They keep what was set
+# on them but draw nothing.
+class HeadlessVar:
+    def __init__(self, value: bool):
+        self.value = value
+
+    def get(self) -> bool:
+        return self.value
+
+    def set(self, value: bool) -> None:
+        self.value = value
+
+
+class HeadlessWidget:
+    def __init__(self) -> None:
+        self.properties: dict[str, str] = {}
+        self.config_calls: list[dict[str, str]] = []
+
+    def config(self, **kwargs: str) -> None:
+        self.config_calls.append(kwargs)
+        self.properties.update(kwargs)
+
+    def cget(self, key: str) -> str:
+        return self.properties.get(key, "")
+
+
+class HeadlessCanvas(HeadlessWidget):
+    def __init__(self) -> None:
+        super().__init__()
+        self.next_id = 0
+        self.created: list[tuple[str, int]] = []
+        self.deleted: list[str] = []
+        self.item_options: dict[int, dict[str, object]] = {}
+        self.item_coords: dict[int, tuple[float, ...]] = {}
+
+    def _create(self, kind: str, **kwargs: object) -> int:
+        self.next_id += 1
+        self.created.append((kind, self.next_id))
+        self.item_options[self.next_id] = dict(kwargs)
+        return self.next_id
+
+    def create_arc(self, *args: object, **kwargs: object) -> int:
+        return self._create("arc", **kwargs)
+
+    def create_text(self, *args: object, **kwargs: object) -> int:
+        return self._create("text", **kwargs)
+
+    def create_polygon(self, *args: object, **kwargs: object) -> int:
+        return self._create("polygon", **kwargs)
+
+    def delete(self, tag: str) -> None:
+        self.deleted.append(tag)
+
+    def itemconfig(self, item_id: int, **kwargs: object) -> None:
+        self.item_options[item_id].update(kwargs)
+
+    def coords(self, item_id: int, *args: float) -> None:
+        self.item_coords[item_id] = args
+
+
+# `after` callbacks never run; idle callbacks run when run_idle() is called.
+class HeadlessRoot:
+    def __init__(self) -> None:
+        self.idle_callbacks: list = []
+
+    def after(self, ms: int, func=None):
+        return "job"
+
+    def after_idle(self, func):
+        self.idle_callbacks.append(func)
+        return "idle"
+
+    def run_idle(self) -> None:
+        callbacks, self.idle_callbacks = self.idle_callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def after_cancel(self, job) -> None:
+        return None
+
+
+class HeadlessSpinLog:
+    def log(self, selection: str, timer_text: str, bpm_text: str) -> bool:
+        return True
+
+    def close(self) -> None:
+        return None
+
+
+def build_headless_wheel(engine: WheelEngine) -> WheelOfFortune:
+    # Everything __init__ sets up, minus the window, dialogs, audio and files.
+    wheel = WheelOfFortune.__new__(WheelOfFortune)
+    wheel.root = HeadlessRoot()
+    wheel.status = HeadlessWidget()
+    wheel.top_bar = HeadlessWidget()
+    wheel.bottom_bar = HeadlessWidget()
+    wheel.timer_label = HeadlessWidget()
+    wheel.session_timer_label = HeadlessWidget()
+    wheel.bpm_label = HeadlessWidget()
+    wheel.canvas = HeadlessCanvas()
+    wheel.auto_spin_var = HeadlessVar(False)
+    wheel.heartbeat_enabled_var = HeadlessVar(False)
+    wheel.engine = engine
+    wheel.engine.subscribe(wheel.handle_engine_event)
+    wheel.spin_logger = HeadlessSpinLog()
+    wheel.trajectory = None
+    wheel.angle_offset = 0.0
+    wheel.last_pointer_index = 0
+    wheel.center = 350
+    wheel.radius = 280
+    wheel.night_mode_var = HeadlessVar(False)
+    wheel.scene_signature = None
+    wheel.wheel_layout = None
+    wheel.label_anchors = []
+    wheel.label_cache = LabelLayoutCache(estimate_text_width)
+    wheel.detail = DetailController(budget=0.008)
+    wheel.segment_ids = []
+    wheel.label_ids = []
+    wheel.pointer_id = None
+    wheel.render_mode = "vector"
+    wheel.sprite_renderer = None
+    wheel.sprite_image_id = None
+    wheel.wheel_pause_job = None
+    wheel.heartbeat_pause_job = None
+    wheel.engine_timer_job = None
+    wheel.auto_spin_job = None
+    wheel.heartbeat_poll_job = None
+    wheel.timer_job = None
+    wheel.sound_cache = SoundCache(lambda filename: None)
+    wheel.mixer = None
+    wheel.audio = AudioBackend("none")
+    wheel.heartbeat_recorder = None
+    wheel.heartbeat_bank = None
+    wheel.audio_sink = None
+    wheel.redraw_pending = False
+    wheel.redraw_job = None
+    return wheel
@@ -0,0 +1,130 @@
+import csv
+import json
+import threading
+from collections import deque
+from pathlib import Path
+
+DEFAULT_WINDOW = 2000
+HISTOGRAM_BUCKET_MS = 1.0
+HISTOGRAM_BUCKETS = 100
+
+
+class BeatRecord:
+    __slots__ = ("bpm", "scheduled", "enqueued", "played")
+
+    def __init__(
+        self, bpm: int, scheduled: float, enqueued: float | None, played: float
+    ) -> None:
+        self.bpm = bpm
+        self.scheduled = scheduled
+        self.enqueued = enqueued
+        self.played = played
+
+    @property
+    def latency(self) -> float:
+        return self.played - self.scheduled
+
+
+def histogram(values_ms: list[float]) -> list[int]:
+    # Last bucket collects everything at or past HISTOGRAM_BUCKETS * bucket width.
+    counts = [0] * (HISTOGRAM_BUCKETS + 1)
+    for value in values_ms:
+        bucket = int(max(0.0, value) / HISTOGRAM_BUCKET_MS)
+        counts[min(bucket, HISTOGRAM_BUCKETS)] += 1
+    return counts
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+# Opt-in record of when each heartbeat was due, handed to the backend and
+# played. Latency and jitter windows are kept per displayed BPM so a tempo
+# change does not smear one tier's numbers into another's.
+class HeartbeatRecorder:
+    def __init__(self, window: int = DEFAULT_WINDOW) -> None:
+        self.window = window
+        self.lock = threading.Lock()
+        self.beats: deque[BeatRecord] = deque(maxlen=window)
+        self.latencies: dict[int, deque[float]] = {}
+        self.jitters: dict[int, deque[float]] = {}
+        self.last_beat: BeatRecord | None = None
+        self.total = 0
+
+    def record(
+        self, bpm: float, scheduled: float, enqueued: float | None, played: float
+    ) -> None:
+        tier = int(round(bpm))
+        beat = BeatRecord(tier, scheduled, enqueued, played)
+        with self.lock:
+            self.total += 1
+            self.beats.append(beat)
+            self.latencies.setdefault(tier, deque(maxlen=self.window)).append(beat.latency)
+            previous = self.last_beat
+            self.last_beat = beat
+            if previous is not None and previous.bpm == tier and bpm > 0:
+                interval = played - previous.played
+                expected = 60.0 / bpm
+                # Gaps of several beats mean the heartbeat was paused, not late.
+                if interval < 2 * expected:
+                    self.jitters.setdefault(tier, deque(maxlen=self.window)).append(
+                        abs(interval - expected)
+                    )
+
+    def summary(self) -> dict[str, object]:
+        with self.lock:
+            tiers = {}
+            for tier, latencies in sorted(self.latencies.items()):
+                latency_ms = sorted(value * 1000 for value in latencies)
+                jitter_ms = sorted(value * 1000 for value in self.jitters.get(tier, ()))
+                tiers[str(tier)] = {
+                    "beats": len(latency_ms),
+                    "latency_ms": {
+                        "mean": sum(latency_ms) / len(latency_ms),
+                        "p50": percentile(latency_ms, 0.5),
+                        "p95": percentile(latency_ms, 0.95),
+                        "p99": percentile(latency_ms, 0.99),
+                        "max": latency_ms[-1],
+                        "histogram": histogram(latency_ms),
+                    },
+                    "jitter_ms": {
+                        "mean": sum(jitter_ms) / len(jitter_ms) if jitter_ms else 0.0,
+                        "p95": percentile(jitter_ms, 0.95),
+                        "max": jitter_ms[-1] if jitter_ms else 0.0,
+                        "histogram": histogram(jitter_ms),
+                    },
+                }
+            return {
+                "beats": self.total,
+                "bucket_ms": HISTOGRAM_BUCKET_MS,
+                "bpm": tiers,
+            }
+
+    def export(self, path: Path) -> None:
+        if path.suffix.lower() == ".csv":
+            self.export_csv(path)
+        else:
+            self.export_json(path)
+
+    def export_json(self, path: Path) -> None:
+        path.write_text(json.dumps(self.summary(), indent=2), encoding="utf-8")
+
+    def export_csv(self, path: Path) -> None:
+        with self.lock:
+            beats = list(self.beats)
+        with path.open("w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(["bpm", "scheduled", "enqueued", "played", "latency_ms"])
+            for beat in beats:
+                writer.writerow(
+                    [
+                        beat.bpm,
+                        f"{beat.scheduled:.6f}",
+                        "" if beat.enqueued is None else f"{beat.enqueued:.6f}",
+                        f"{beat.played:.6f}",
+                        f"{beat.latency * 1000:.3f}",
+                    ]
+                )
@@ -0,0 +1,110 @@
+from typing import Iterator
+
+ModuleSpec = dict[str, int | bool | float | str]
+
+
+class ItemRecord:
+    __slots__ = ("base_name", "modules", "color", "label", "slot")
+
+    def __init__(self, base_name: str, modules: ModuleSpec, color: str, label: str) -> None:
+        self.base_name = base_name
+        self.modules = modules
+        self.color = color
+        self.label = label
+        self.slot = -1
+
+    def __repr__(self) -> str:
+        return f"ItemRecord({self.base_name!r}, {self.modules!r}, {self.color!r}, {self.label!r})"
+
+
+# Removal leaves a hole that is compacted away the next time items are read
+# by position, so removing k copies of a name costs O(k) plus one pass.
+class ItemStore:
+    def __init__(self) -> None:
+        self.slots: list[ItemRecord | None] = []
+        self.slots_by_name: dict[str, dict[int, None]] = {}
+        self.live = 0
+        self.holes = 0
+        self.column_cache: dict[str, tuple[object, ...]] = {}
+
+    def __len__(self) -> int:
+        return self.live
+
+    def __bool__(self) -> bool:
+        return self.live > 0
+
+    def __iter__(self) -> Iterator[ItemRecord]:
+        self.compact()
+        return iter(self.slots)  # type: ignore[arg-type]
+
+    def __getitem__(self, index: int) -> ItemRecord:
+        self.compact()
+        return self.slots[index]  # type: ignore[return-value]
+
+    def clear(self) -> None:
+        self.slots.clear()
+        self.slots_by_name.clear()
+        self.live = 0
+        self.holes = 0
+        self.column_cache.clear()
+
+    def append(self, record: ItemRecord) -> None:
+        record.slot = len(self.slots)
+        self.slots.append(record)
+        self.slots_by_name.setdefault(record.base_name, {})[record.slot] = None
+        self.live += 1
+        self.column_cache.clear()
+
+    def discard(self, record: ItemRecord) -> None:
+        slot = record.slot
+        if slot < 0 or slot >= len(self.slots) or self.slots[slot] is not record:
+            return
+        self.slots[slot] = None
+        record.slot = -1
+        named = self.slots_by_name[record.base_name]
+        del named[slot]
+        if not named:
+            del self.slots_by_name[record.base_name]
+        self.live -= 1
+        self.holes += 1
+        self.column_cache.clear()
+
+    def relabel(self, record: ItemRecord, label: str) -> None:
+        record.label = label
+        self.column_cache.clear()
+
+    def compact(self) -> None:
+        if not self.holes:
+            return
+        self.slots = [record for record in self.slots if record is not None]
+        self.slots_by_name.clear()
+        for slot, record in enumerate(self.slots):
+            record.slot = slot  # type: ignore[union-attr]
+            self.slots_by_name.setdefault(record.base_name, {})[slot] = None  # type: ignore[union-attr]
+        self.holes = 0
+
+    def count(self, base_name: str) -> int:
+        return len(self.slots_by_name.get(base_name, ()))
+
+    def named(self, base_name: str) -> list[ItemRecord]:
+        return [self.slots[slot] for slot in self.slots_by_name.get(base_name, ())]  # type: ignore[misc]
+
+    def first_named(self, base_name: str) -> ItemRecord | None:
+        slots = self.slots_by_name.get(base_name)
+        if not slots:
+            return None
+        # Slots are only ever appended, so insertion order is position order.
+        return self.slots[next(iter(slots))]
+
+    def index_of(self, record: ItemRecord) -> int:
+        self.compact()
+        return record.slot
+
+    # Tuples, so callers can keep or pass them on without corrupting the cache.
+    def column(self, name: str) -> tuple[object, ...]:
+        cached = self.column_cache.get(name)
+        if cached is None:
+            self.compact()
+            cached = tuple(getattr(record, name) for record in self.slots)
+            self.column_cache[name] = cached
+        return cached
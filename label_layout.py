@@ -0,0 +1,106 @@
+import math
+from collections import OrderedDict
+from typing import Callable
+
+LabelFont = tuple[str, int, str]
+TextMeasure = Callable[[str, LabelFont], int]
+
+ELLIPSIS = "…"
+DEFAULT_CAPACITY = 4096
+# Pixels kept clear on each side of a label.
+LABEL_PADDING = 4
+
+
+def estimate_text_width(text: str, font: LabelFont) -> int:
+    # Used when no Tk font is available (headless runs and tests).
+    return int(math.ceil(len(text) * font[1] * 0.6))
+
+
+class LabelFit:
+    __slots__ = ("text", "width", "lines", "truncated")
+
+    def __init__(self, text: str, width: int, lines: int, truncated: bool) -> None:
+        self.text = text
+        self.width = width
+        self.lines = lines
+        self.truncated = truncated
+
+
+# Font metrics and fitted label text, each in its own LRU. Widths are keyed
+# by (text, font); fits by (text, available whole pixels, font), so a wheel
+# whose item count does not change never measures a label twice.
+class LabelLayoutCache:
+    def __init__(self, measure: TextMeasure, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.measure = measure
+        self.capacity = capacity
+        self.widths: OrderedDict[tuple[str, LabelFont], int] = OrderedDict()
+        self.fits: OrderedDict[tuple[str, int, LabelFont], LabelFit] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def text_width(self, text: str, font: LabelFont) -> int:
+        key = (text, font)
+        width = self.widths.get(key)
+        if width is not None:
+            self.widths.move_to_end(key)
+            return width
+        width = self.measure(text, font)
+        self.widths[key] = width
+        if len(self.widths) > self.capacity:
+            self.widths.popitem(last=False)
+        return width
+
+    def fit(self, text: str, available: float, font: LabelFont) -> LabelFit:
+        key = (text, max(0, int(available)), font)
+        fit = self.fits.get(key)
+        if fit is not None:
+            self.hits += 1
+            self.fits.move_to_end(key)
+            return fit
+        self.misses += 1
+        fit = self.fit_text(text, key[1], font)
+        self.fits[key] = fit
+        if len(self.fits) > self.capacity:
+            self.fits.popitem(last=False)
+        return fit
+
+    def fit_text(self, text: str, available: int, font: LabelFont) -> LabelFit:
+        width = self.text_width(text, font)
+        if width <= available:
+            return LabelFit(text, width, 1, False)
+
+        # Two lines split at the space that balances them best.
+        best: tuple[int, str] | None = None
+        for index, char in enumerate(text):
+            if char != " ":
+                continue
+            first, second = text[:index].rstrip(), text[index + 1 :].lstrip()
+            if not first or not second:
+                continue
+            widest = max(self.text_width(first, font), self.text_width(second, font))
+            if widest <= available and (best is None or widest < best[0]):
+                best = (widest, f"{first}\n{second}")
+        if best is not None:
+            return LabelFit(best[1], best[0], 2, False)
+
+        # Longest prefix that still fits with an ellipsis.
+        low, high = 0, len(text)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.text_width(text[:middle].rstrip() + ELLIPSIS, font) <= available:
+                low = middle
+            else:
+                high = middle - 1
+        truncated = text[:low].rstrip() + ELLIPSIS if low else ""
+        return LabelFit(truncated, self.text_width(truncated, font) if truncated else 0, 1, True)
+
+    def clear(self) -> None:
+        self.widths.clear()
+        self.fits.clear()
+
+
+def available_width(sector_degrees: float, text_radius: float, radius: float) -> float:
+    # Chord of the sector at the text radius, capped by the wheel's edge.
+    chord = 2 * text_radius * math.sin(math.radians(min(sector_degrees, 180.0)) / 2)
+    rim = 2 * math.sqrt(max(0.0, radius * radius - text_radius * text_radius))
+    return max(0.0, min(chord, rim) - 2 * LABEL_PADDING)
@@ -0,0 +1,146 @@
+import functools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+
+DEFAULT_HOST = "127.0.0.1"
+METRIC_PREFIX = "wheel_"
+
+
+class TimerStat:
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+
+# Opt-in counters, timers and gauges. Gauges are read by `sample()` on the
+# thread that owns the state (the Tk thread), so readers on other threads
+# only ever see plain numbers. Nothing is installed unless metrics are enabled.
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.counters: dict[str, int] = {}
+        self.timers: dict[str, TimerStat] = {}
+        self.gauges: dict[str, Callable[[], float]] = {}
+        self.values: dict[str, float] = {}
+        self.sampled_at: float | None = None
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self.lock:
+            stat = self.timers.get(name)
+            if stat is None:
+                stat = self.timers[name] = TimerStat()
+            stat.count += 1
+            stat.total += seconds
+            stat.max = max(stat.max, seconds)
+
+    def timed(self, name: str, func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.observe(name, time.perf_counter() - start)
+
+        return wrapper
+
+    def gauge(self, name: str, read: Callable[[], float]) -> None:
+        self.gauges[name] = read
+
+    def sample(self) -> None:
+        values = {}
+        for name, read in self.gauges.items():
+            try:
+                values[name] = float(read())
+            except Exception:
+                continue
+        with self.lock:
+            self.values = values
+            self.sampled_at = time.time()
+
+    def snapshot(self) -> dict[str, object]:
+        with self.lock:
+            return {
+                "sampled_at": self.sampled_at,
+                "counters": dict(self.counters),
+                "gauges": dict(self.values),
+                "timers": {
+                    name: {
+                        "count": stat.count,
+                        "total_seconds": stat.total,
+                        "mean_ms": stat.total / stat.count * 1000 if stat.count else 0.0,
+                        "max_ms": stat.max * 1000,
+                    }
+                    for name, stat in self.timers.items()
+                },
+            }
+
+    def prometheus(self) -> str:
+        snapshot = self.snapshot()
+        lines = []
+        for name, value in sorted(snapshot["counters"].items()):  # type: ignore[union-attr]
+            lines.append(f"# TYPE {METRIC_PREFIX}{name}_total counter")
+            lines.append(f"{METRIC_PREFIX}{name}_total {value}")
+        for name, value in sorted(snapshot["gauges"].items()):  # type: ignore[union-attr]
+            lines.append(f"# TYPE {METRIC_PREFIX}{name} gauge")
+            lines.append(f"{METRIC_PREFIX}{name} {value:g}")
+        for name, stat in sorted(snapshot["timers"].items()):  # type: ignore[union-attr]
+            lines.append(f"# TYPE {METRIC_PREFIX}{name}_seconds summary")
+            lines.append(f"{METRIC_PREFIX}{name}_seconds_count {stat['count']}")
+            lines.append(f"{METRIC_PREFIX}{name}_seconds_sum {stat['total_seconds']:.6f}")
+        return "\n".join(lines) + "\n"
+
+
+# Serves /metrics (Prometheus text) and /metrics.json from a daemon thread,
+# bound to localhost only.
+class MetricsServer:
+    def __init__(self, registry: MetricsRegistry, port: int, host: str = DEFAULT_HOST) -> None:
+        self.registry = registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path == "/metrics":
+                    body = registry.prometheus().encode("utf-8")
+                    content_type = "text/plain; version=0.0.4"
+                elif self.path == "/metrics.json":
+                    body = json.dumps(registry.snapshot()).encode("utf-8")
+                    content_type = "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                return None
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, name="metrics-http", daemon=True
+        )
+
+    @property
+    def port(self) -> int:
+        return self.server.server_address[1]
+
+    def start(self) -> None:
+        self.thread.start()
+
+    def stop(self) -> None:
+        if self.thread.is_alive():
+            self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,188 @@
+import argparse
+import functools
+import re
+import time
+from pathlib import Path
+
+ModuleSpec = dict[str, int | bool | float | str]
+ModulePairs = tuple[tuple[str, int | bool | float | str], ...]
+
+MODULE_GROUP = re.compile(r"\([^)]*\)")
+
+# One alternation for the whole module grammar. Alternatives keep the order
+# the modules were historically tried in, so ambiguous texts resolve the same way.
+MODULE_GRAMMAR = re.compile(
+    r"""
+    (?P<spawn>spawn\s+(?P<spawn_initial>\d+)\s+(?P<spawn_repeat>\d+))
+    | (?P<target>1\s*/\s*(?P<target_value>\d+))
+    | (?P<cooldown>cooldown\s+(?P<cooldown_value>\d+))
+    | (?P<max>max\s+(?P<max_value>\d+))
+    | (?P<boost>\+\s*(?P<boost_value>-?\d+))
+    | (?P<multiplier>\*\s*(?P<multiplier_value>[-+]?\d+(?:\.\d+)?))
+    | (?P<bound>(?P<bound_op>[<>])\s*(?P<bound_value>-?\d+)(?P<bound_seconds>s)?)
+    | (?P<sound>.*\.wav)
+    | (?P<fragile>fragile)
+    | (?P<missing>missing)
+    | (?P<reset>reset)
+    | (?P<post_pause_reset>post\ pause\ reset)
+    | (?P<pause_wheel>pause\s+wheel\s+(?P<pause_wheel_value>\d+))
+    | (?P<pause_heartbeat>pause\s+heartbeat\s+(?P<pause_heartbeat_value>\d+))
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+
+class ModuleDiagnostic:
+    __slots__ = ("line", "column", "text", "message")
+
+    def __init__(self, line: int, column: int, text: str, message: str) -> None:
+        self.line = line
+        self.column = column
+        self.text = text
+        self.message = message
+
+    def __str__(self) -> str:
+        return f"line {self.line}, column {self.column}: {self.message} '{self.text}'"
+
+    def __repr__(self) -> str:
+        return f"ModuleDiagnostic({self.line}, {self.column}, {self.text!r}, {self.message!r})"
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_module(module_text: str) -> ModulePairs | None:
+    match = MODULE_GRAMMAR.fullmatch(module_text)
+    if match is None:
+        return None
+
+    kind = match.lastgroup
+    if kind == "spawn":
+        return (
+            ("spawn_initial", int(match.group("spawn_initial"))),
+            ("spawn_repeat", int(match.group("spawn_repeat"))),
+        )
+    if kind == "target":
+        return (("special_target", int(match.group("target_value"))),)
+    if kind == "cooldown":
+        return (("cooldown", int(match.group("cooldown_value"))),)
+    if kind == "max":
+        return (("max", int(match.group("max_value"))),)
+    if kind == "boost":
+        return (("bpm_boost", int(match.group("boost_value"))),)
+    if kind == "multiplier":
+        return (("bpm_multiplier", float(match.group("multiplier_value"))),)
+    if kind == "bound":
+        value = int(match.group("bound_value"))
+        lower_bound = match.group("bound_op") == ">"
+        if match.group("bound_seconds"):
+            if value < 0:
+                return None
+            return (("timer_min_seconds" if lower_bound else "timer_max_seconds", value),)
+        return (("bps_min" if lower_bound else "bps_max", value),)
+    if kind == "sound":
+        return (("sound_effect", module_text.strip()),)
+    if kind == "fragile":
+        return (("fragile", True),)
+    if kind == "missing":
+        return (("missing", True),)
+    if kind == "reset":
+        return (("reset_timer", True),)
+    if kind == "post_pause_reset":
+        return (("post_pause_reset", True),)
+    if kind == "pause_wheel":
+        return (("pause_wheel", int(match.group("pause_wheel_value"))),)
+    return (("pause_heartbeat", int(match.group("pause_heartbeat_value"))),)
+
+
+@functools.lru_cache(maxsize=65536)
+def scan_item(item: str) -> tuple[str, tuple[tuple[str, int], ...]]:
+    base_parts = []
+    modules = []
+    position = 0
+    for match in MODULE_GROUP.finditer(item):
+        base_parts.append(item[position : match.start()])
+        modules.append((match.group().strip("() "), match.start() + 1))
+        position = match.end()
+    base_parts.append(item[position:])
+    base_name = "".join(base_parts).strip()
+    return base_name or item.strip(), tuple(modules)
+
+
+def split_item(item: str) -> tuple[str, list[str]]:
+    base_name, modules = scan_item(item)
+    return base_name, [text for text, _ in modules]
+
+
+def interpret_modules(module_texts: list[str]) -> ModuleSpec:
+    modules: ModuleSpec = {}
+    for module_text in module_texts:
+        pairs = parse_module(module_text)
+        if pairs is not None:
+            modules.update(pairs)
+    return modules
+
+
+def parse_item(
+    item: str, line: int = 1, column_offset: int = 0
+) -> tuple[str, ModuleSpec, list[ModuleDiagnostic]]:
+    base_name, module_spans = scan_item(item)
+    modules: ModuleSpec = {}
+    diagnostics: list[ModuleDiagnostic] = []
+    for module_text, column in module_spans:
+        pairs = parse_module(module_text)
+        if pairs is None:
+            diagnostics.append(
+                ModuleDiagnostic(line, column + column_offset, module_text, "unknown module")
+            )
+            continue
+        modules.update(pairs)
+    return base_name, modules, diagnostics
+
+
+def split_item_lines(text: str) -> tuple[list[str], list[tuple[int, int]]]:
+    items: list[str] = []
+    positions: list[tuple[int, int]] = []
+    for line_number, line in enumerate(text.splitlines(), start=1):
+        stripped = line.strip()
+        if not stripped:
+            continue
+        items.append(stripped)
+        positions.append((line_number, len(line) - len(line.lstrip())))
+    return items, positions
+
+
+def benchmark(items: list[str], line_count: int) -> float:
+    lines = [items[idx % len(items)] for idx in range(line_count)]
+    scan_item.cache_clear()
+    parse_module.cache_clear()
+    start = time.perf_counter()
+    for line_number, item in enumerate(lines, start=1):
+        parse_item(item, line_number)
+    return time.perf_counter() - start
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Check or benchmark an item file")
+    parser.add_argument("items", type=Path)
+    parser.add_argument(
+        "--benchmark",
+        type=int,
+        metavar="LINES",
+        help="time parsing this many lines generated by repeating the file",
+    )
+    args = parser.parse_args(argv)
+
+    items, positions = split_item_lines(args.items.read_text(encoding="utf-8"))
+    for item, (line, offset) in zip(items, positions):
+        for diagnostic in parse_item(item, line, offset)[2]:
+            print(f"{args.items}: {diagnostic}")
+
+    if args.benchmark and items:
+        elapsed = benchmark(items, args.benchmark)
+        print(
+            f"Parsed {args.benchmark} lines in {elapsed * 1000:.1f} ms "
+            f"({args.benchmark / elapsed:,.0f} lines/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
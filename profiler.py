@@ -0,0 +1,97 @@
+import cProfile
+import functools
+import io
+import pstats
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable
+
+from heartbeat_stats import percentile
+
+DEFAULT_WINDOW = 10000
+
+
+class CallbackStat:
+    __slots__ = ("count", "total", "max", "samples")
+
+    def __init__(self, window: int) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: deque[float] = deque(maxlen=window)
+
+
+# Wall-time per call for the named hot callbacks. Wrapping replaces the bound
+# method on the instance, so nothing is paid when profiling is off. Percentiles
+# come from the last `window` calls; count, total and max cover the whole run.
+class CallbackProfiler:
+    def __init__(self, window: int = DEFAULT_WINDOW, cprofile_path: Path | None = None) -> None:
+        self.window = window
+        self.stats: dict[str, CallbackStat] = {}
+        self.cprofile_path = cprofile_path
+        self.cprofile: cProfile.Profile | None = None
+        if cprofile_path is not None:
+            self.cprofile = cProfile.Profile()
+            self.cprofile.enable()
+
+    def wrap(self, target: object, *names: str, prefix: str = "") -> None:
+        for name in names:
+            label = f"{prefix}{name}"
+            stat = self.stats.setdefault(label, CallbackStat(self.window))
+            setattr(target, name, self.timed(stat, getattr(target, name)))
+
+    @staticmethod
+    def timed(stat: CallbackStat, func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                stat.count += 1
+                stat.total += elapsed
+                if elapsed > stat.max:
+                    stat.max = elapsed
+                stat.samples.append(elapsed)
+
+        return wrapper
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        report = {}
+        for name, stat in self.stats.items():
+            samples_ms = sorted(sample * 1000 for sample in stat.samples)
+            report[name] = {
+                "calls": stat.count,
+                "total_ms": stat.total * 1000,
+                "p50_ms": percentile(samples_ms, 0.5),
+                "p95_ms": percentile(samples_ms, 0.95),
+                "p99_ms": percentile(samples_ms, 0.99),
+                "max_ms": stat.max * 1000,
+            }
+        return report
+
+    def format_table(self) -> str:
+        lines = [
+            f"{'callback':<32} {'calls':>8} {'total ms':>10} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}"
+        ]
+        rows = sorted(self.summary().items(), key=lambda item: item[1]["total_ms"], reverse=True)
+        for name, row in rows:
+            lines.append(
+                f"{name:<32} {row['calls']:>8} {row['total_ms']:>10.1f} {row['p50_ms']:>8.3f} "
+                f"{row['p95_ms']:>8.3f} {row['p99_ms']:>8.3f} {row['max_ms']:>8.3f}"
+            )
+        return "\n".join(lines)
+
+    def finish(self) -> str:
+        # Stops cProfile (dumping it for pstats/snakeviz) and returns the report.
+        report = self.format_table()
+        if self.cprofile is not None:
+            self.cprofile.disable()
+            self.cprofile.dump_stats(str(self.cprofile_path))
+            buffer = io.StringIO()
+            pstats.Stats(self.cprofile, stream=buffer).sort_stats("cumulative").print_stats(15)
+            report += "\n\n" + buffer.getvalue()
+            self.cprofile = None
+        return report
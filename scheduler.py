@@ -0,0 +1,148 @@
+import heapq
+
+
+class TimerHandle:
+    __slots__ = ("due", "seq", "kind", "payload", "active", "remaining", "entry")
+
+    def __init__(self, due: float, seq: int, kind: str, payload: object) -> None:
+        self.due = due
+        self.seq = seq
+        self.kind = kind
+        self.payload = payload
+        self.active = True
+        # Time left while the handle is frozen, None while it is running.
+        self.remaining: float | None = None
+        self.entry: tuple[float, int, TimerHandle] | None = None
+
+    def __repr__(self) -> str:
+        return f"TimerHandle({self.kind!r}, due={self.due:.3f}, payload={self.payload!r})"
+
+
+# One heap for every game timer. Cancelling, freezing or moving a handle leaves
+# its old heap entry behind; stale entries are skipped when they reach the top
+# and compacted away once they outnumber the live ones.
+class Scheduler:
+    def __init__(self) -> None:
+        self.heap: list[tuple[float, int, TimerHandle]] = []
+        self.by_kind: dict[str, dict[int, TimerHandle]] = {}
+        self.frozen: dict[int, TimerHandle] = {}
+        self.seq = 0
+        self.pushes = 0
+        self.live = 0
+
+    def __len__(self) -> int:
+        return self.live + len(self.frozen)
+
+    def clear(self) -> None:
+        for kind_handles in self.by_kind.values():
+            for handle in kind_handles.values():
+                handle.active = False
+        self.heap.clear()
+        self.by_kind.clear()
+        self.frozen.clear()
+        self.live = 0
+
+    def push(self, handle: TimerHandle) -> None:
+        # Each push gets its own tiebreak so a re-pushed handle is never compared.
+        self.pushes += 1
+        handle.entry = (handle.due, self.pushes, handle)
+        heapq.heappush(self.heap, handle.entry)
+        self.live += 1
+        if len(self.heap) > 2 * self.live + 16:
+            self.heap = [entry for entry in self.heap if self.is_live(entry)]
+            heapq.heapify(self.heap)
+
+    @staticmethod
+    def is_live(entry: tuple[float, int, TimerHandle]) -> bool:
+        handle = entry[2]
+        return handle.active and handle.remaining is None and handle.entry is entry
+
+    def schedule_at(self, due: float, kind: str, payload: object = None) -> TimerHandle:
+        self.seq += 1
+        handle = TimerHandle(due, self.seq, kind, payload)
+        self.by_kind.setdefault(kind, {})[handle.seq] = handle
+        self.push(handle)
+        return handle
+
+    def forget(self, handle: TimerHandle) -> None:
+        handle.active = False
+        kind_handles = self.by_kind.get(handle.kind)
+        if kind_handles is not None:
+            kind_handles.pop(handle.seq, None)
+            if not kind_handles:
+                del self.by_kind[handle.kind]
+
+    def cancel(self, handle: TimerHandle | None) -> bool:
+        if handle is None or not handle.active:
+            return False
+        self.forget(handle)
+        if self.frozen.pop(handle.seq, None) is None:
+            self.live -= 1
+        return True
+
+    def cancel_kind(self, *kinds: str) -> int:
+        cancelled = 0
+        for kind in kinds:
+            for handle in list(self.by_kind.get(kind, {}).values()):
+                cancelled += self.cancel(handle)
+        return cancelled
+
+    def drop_stale(self) -> None:
+        while self.heap and not self.is_live(self.heap[0]):
+            heapq.heappop(self.heap)
+
+    def next_deadline(self) -> float | None:
+        self.drop_stale()
+        return self.heap[0][0] if self.heap else None
+
+    def pop_due(self, now: float) -> TimerHandle | None:
+        self.drop_stale()
+        if not self.heap or self.heap[0][0] > now:
+            return None
+        handle = heapq.heappop(self.heap)[2]
+        self.forget(handle)
+        self.live -= 1
+        return handle
+
+    def count(self, kind: str) -> int:
+        return len(self.by_kind.get(kind, ()))
+
+    def pending(self, kind: str | None = None) -> list[TimerHandle]:
+        if kind is None:
+            handles = [handle for named in self.by_kind.values() for handle in named.values()]
+        else:
+            handles = list(self.by_kind.get(kind, {}).values())
+        return sorted(handles, key=lambda handle: (handle.due, handle.seq))
+
+    # Frozen timers keep their remaining time and are left out of
+    # next_deadline() until thawed, e.g. for the length of a wheel pause.
+    def freeze(self, now: float, *kinds: str) -> int:
+        frozen = 0
+        for kind in kinds:
+            for handle in self.by_kind.get(kind, {}).values():
+                if handle.remaining is None:
+                    handle.remaining = max(0.0, handle.due - now)
+                    self.frozen[handle.seq] = handle
+                    self.live -= 1
+                    frozen += 1
+        return frozen
+
+    def thaw(self, now: float) -> int:
+        thawed = list(self.frozen.values())
+        self.frozen.clear()
+        for handle in thawed:
+            handle.due = now + (handle.remaining or 0.0)
+            handle.remaining = None
+            self.push(handle)
+        return len(thawed)
+
+    def shift(self, delta: float, *kinds: str) -> int:
+        shifted = 0
+        for kind in kinds:
+            for handle in list(self.by_kind.get(kind, {}).values()):
+                if handle.remaining is None:
+                    handle.due += delta
+                    self.live -= 1
+                    self.push(handle)
+                    shifted += 1
+        return shifted
@@ -0,0 +1,249 @@
+import argparse
+import random
+import time
+from pathlib import Path
+
+from audio_mixer import (
+    DEFAULT_SAMPLE_RATE,
+    HeartbeatBank,
+    Mixer,
+    Sample,
+    WaveFileSink,
+    mixer_available,
+)
+from engine import WheelEngine
+from frame_pacer import DEFAULT_FPS
+from module_parser import split_item_lines
+from session_journal import JournalReader, apply_input
+from spin_trajectory import SPIN_SECONDS, pointer_index
+
+CLICK_SOUND = "click.wav"
+HEARTBEAT_SOUND = "Heartbeat.wav"
+# Frames rendered and written per chunk; memory use does not grow with length.
+DEFAULT_CHUNK_FRAMES = 8192
+# Silence kept after the last event so effects can ring out.
+TAIL_SECONDS = 2.0
+AUTO_SPIN_DELAY = 0.3
+HEARTBEAT_EVENTS = frozenset(
+    {"bpm_changed", "restarted", "heartbeat_pause_started", "heartbeat_pause_ended"}
+)
+
+
+def find_sound(filename: str, sound_dirs: list[Path]) -> Path | None:
+    name = Path(filename)
+    if name.is_absolute():
+        return name if name.exists() else None
+    candidates = [directory / name for directory in sound_dirs]
+    candidates += [Path(__file__).with_name(filename), Path.cwd() / name]
+    for candidate in candidates:
+        if candidate.exists():
+            return candidate
+    return None
+
+
+# Listens to an engine the way the wheel does and mixes what it would have
+# played into a WAV file: the heartbeat at the BPM in effect, a click whenever
+# a spin frame shows a new sector under the pointer, and `sound_effect` files.
+# Audio is rendered up to each event's time before the event is applied, so
+# the engine can be driven as fast as it will go.
+class SessionAudioRenderer:
+    def __init__(
+        self,
+        path: Path,
+        engine: WheelEngine,
+        sound_dirs: list[Path] | None = None,
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+        chunk_frames: int = DEFAULT_CHUNK_FRAMES,
+        fps: float = DEFAULT_FPS,
+    ) -> None:
+        if not mixer_available():
+            raise RuntimeError("Rendering session audio requires NumPy.")
+        self.engine = engine
+        self.sound_dirs = sound_dirs or []
+        self.chunk_frames = chunk_frames
+        self.fps = fps
+        self.mixer = Mixer(sample_rate)
+        self.sink = WaveFileSink(self.mixer, path, chunk_frames)
+        self.origin = engine.now
+        self.sounds: dict[str, Sample | None] = {}
+        heartbeat = self.sound(HEARTBEAT_SOUND)
+        self.heartbeat_bank = HeartbeatBank(heartbeat) if heartbeat is not None else None
+        self.click = self.sound(CLICK_SOUND)
+        self.clicks = 0
+        self.effects = 0
+        self.update_heartbeat()
+        engine.subscribe(self)
+
+    def sound(self, filename: str) -> Sample | None:
+        if filename not in self.sounds:
+            path = find_sound(filename, self.sound_dirs)
+            try:
+                self.sounds[filename] = self.mixer.load(path) if path is not None else None
+            except (OSError, EOFError, ValueError):
+                self.sounds[filename] = None
+        return self.sounds[filename]
+
+    def frame_at(self, now: float) -> int:
+        return int(round((now - self.origin) * self.mixer.sample_rate))
+
+    @property
+    def seconds(self) -> float:
+        return self.mixer.frame_position / self.mixer.sample_rate
+
+    def render_until(self, now: float) -> None:
+        remaining = self.frame_at(now) - self.mixer.frame_position
+        while remaining > 0:
+            frames = min(self.chunk_frames, remaining)
+            self.sink.pull_frames(frames)
+            remaining -= frames
+
+    def update_heartbeat(self) -> None:
+        if self.heartbeat_bank is None or self.engine.heartbeat_pause_active:
+            self.mixer.stop_heartbeat()
+            return
+        bpm = max(1.0, float(self.engine.bps))
+        self.mixer.set_heartbeat(self.heartbeat_bank.get(bpm), bpm)
+
+    def queue_clicks(self, start: float) -> None:
+        # Same sampling as update_spin: one pointer check per animation frame.
+        trajectory = self.engine.trajectory
+        if trajectory is None or self.click is None:
+            return
+        count = len(self.engine.items)
+        last_index = pointer_index(trajectory.start_angle, count)
+        frame = 0
+        elapsed = 0.0
+        while elapsed < trajectory.duration:
+            frame += 1
+            elapsed = min(frame / self.fps, trajectory.duration)
+            index = pointer_index(trajectory.angle_at(elapsed), count)
+            if index != last_index:
+                self.mixer.play_at(self.click, self.frame_at(start + elapsed))
+                self.clicks += 1
+                last_index = index
+
+    def __call__(self, event: str, payload: dict[str, object]) -> None:
+        # engine.now is the time the event happened, including timers fired late.
+        now = self.engine.now
+        self.render_until(now)
+        if event == "spin_started":
+            self.queue_clicks(now)
+        elif event in HEARTBEAT_EVENTS:
+            self.update_heartbeat()
+        elif event == "sound":
+            sample = self.sound(str(payload["filename"]))
+            if sample is not None:
+                self.mixer.play_at(sample, self.frame_at(now))
+                self.effects += 1
+
+    def finish(self, end: float) -> None:
+        self.render_until(end)
+        self.sink.stop()
+
+
+def render_journal(
+    journal: Path, output: Path, sound_dirs: list[Path] | None = None, **options
+) -> SessionAudioRenderer:
+    reader = JournalReader(journal)
+    first = reader.snapshots[0]
+    engine = reader.snapshot_state(first)
+    renderer = SessionAudioRenderer(output, engine, sound_dirs, **options)
+    for now, name, payload in reader.inputs(first):
+        apply_input(engine, name, payload, now)
+    renderer.finish(reader.end_time + TAIL_SECONDS)
+    return renderer
+
+
+def play_headless(engine: WheelEngine, seconds: float) -> float:
+    # Auto-spins like the wheel until the game ends or the next spin would not
+    # finish in time, and returns the time of the last thing that happened.
+    now = engine.now
+    end = now + seconds
+    while now + SPIN_SECONDS <= end:
+        engine.advance(now)
+        started, _ = engine.start_spin(now)
+        if not started:
+            deadline = engine.next_deadline()
+            if not engine.wheel_pause_active or deadline is None:
+                break
+            now = deadline
+            continue
+        finish = now + engine.trajectory.duration  # type: ignore[union-attr]
+        engine.advance(finish)
+        with engine.batch():
+            outcome = engine.finish_spin(
+                engine.trajectory.winning_index(len(engine.items)),  # type: ignore[union-attr]
+                finish,
+            )
+        now = finish
+        if outcome["ended"]:
+            break
+        if not engine.wheel_pause_active:
+            now += AUTO_SPIN_DELAY
+    return now
+
+
+def render_headless(
+    items: list[str],
+    output: Path,
+    seconds: float,
+    seed: int | None = None,
+    sound_dirs: list[Path] | None = None,
+    **options,
+) -> SessionAudioRenderer:
+    engine = WheelEngine(items, rng=random.Random(seed))
+    if engine.config_error is not None:
+        raise ValueError(engine.config_error)
+    renderer = SessionAudioRenderer(output, engine, sound_dirs, **options)
+    start = engine.now
+    last = play_headless(engine, seconds)
+    renderer.finish(min(last + TAIL_SECONDS, start + seconds))
+    return renderer
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Render a session's audio to a WAV file")
+    parser.add_argument("output", type=Path, help="WAV file to write")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--journal", type=Path, help="session journal to render")
+    source.add_argument("--items", type=Path, help="item file to auto-spin headlessly")
+    parser.add_argument("--seed", type=int, default=None, help="seed for --items runs")
+    parser.add_argument(
+        "--seconds", type=float, default=600.0, help="longest --items run (default 600)"
+    )
+    parser.add_argument(
+        "--sounds",
+        type=Path,
+        action="append",
+        default=[],
+        metavar="DIR",
+        help="directory to look for sound files in (repeatable)",
+    )
+    parser.add_argument("--sample-rate", type=int, default=DEFAULT_SAMPLE_RATE)
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    if args.journal is not None:
+        renderer = render_journal(
+            args.journal, args.output, args.sounds, sample_rate=args.sample_rate
+        )
+    else:
+        items, _ = split_item_lines(args.items.read_text(encoding="utf-8"))
+        renderer = render_headless(
+            items,
+            args.output,
+            args.seconds,
+            args.seed,
+            [args.items.parent, *args.sounds],
+            sample_rate=args.sample_rate,
+        )
+    elapsed = time.perf_counter() - started
+    print(
+        f"Rendered {renderer.seconds:.1f} s of audio ({renderer.mixer.beats_played} beats, "
+        f"{renderer.clicks} clicks, {renderer.effects} effects) in {elapsed:.1f} s "
+        f"({renderer.seconds / max(elapsed, 1e-9):.0f}x real time)."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+import argparse
+import bisect
+import json
+import struct
+import zlib
+from pathlib import Path
+from typing import Iterator
+
+from config_cache import CompiledConfig
+from engine import WheelEngine
+
+JOURNAL_MAGIC = b"WOFJ"
+# Bump whenever the record layout or the snapshot contents change.
+JOURNAL_VERSION = 2
+JOURNAL_HEADER = struct.Struct("<4sH")
+# Payload length, record kind, session time (perf_counter seconds).
+RECORD_HEADER = struct.Struct("<IBd")
+
+RECORD_CONFIG = 0
+RECORD_SNAPSHOT = 1
+RECORD_EVENT = 2
+
+DEFAULT_SNAPSHOT_INTERVAL = 30.0
+
+# Events are stored as a one-byte code followed by their payload as compact
+# JSON (omitted when empty; the time lives in the record header). Timer
+# bookkeeping is left out. Append new names at the end to keep old codes.
+EVENT_NAMES = (
+    "spin_started",
+    "spin_finished",
+    "timer_fired",
+    "restarted",
+    "spin_logged",
+    "items_changed",
+    "bpm_changed",
+    "timer_reset",
+    "timer_stopped",
+    "wheel_pause_started",
+    "wheel_pause_ended",
+    "heartbeat_pause_started",
+    "heartbeat_pause_ended",
+    "game_over",
+    "sound",
+)
+EVENT_CODES = {name: code for code, name in enumerate(EVENT_NAMES)}
+
+# Engine calls that change state; everything else is replayed as a consequence.
+INPUT_EVENTS = frozenset({"spin_started", "spin_finished", "timer_fired", "restarted"})
+
+
+# Snapshots are WheelEngine.to_payload() as compressed JSON; the config is
+# stored once up front.
+def dump_snapshot(engine: WheelEngine) -> bytes:
+    payload = json.dumps(engine.to_payload(), separators=(",", ":"))
+    return zlib.compress(payload.encode("utf-8"))
+
+
+def load_snapshot(data: bytes, compiled: CompiledConfig) -> WheelEngine:
+    return WheelEngine.from_payload(compiled, json.loads(zlib.decompress(data)))
+
+
+def apply_input(engine: WheelEngine, event: str, payload: dict[str, object], now: float) -> None:
+    if event == "spin_started":
+        engine.start_spin(now)
+    elif event == "spin_finished":
+        angle = payload.get("angle")
+        engine.finish_spin(
+            int(payload["index"]),  # type: ignore[arg-type]
+            now,
+            float(angle) if angle is not None else None,  # type: ignore[arg-type]
+        )
+    elif event == "timer_fired":
+        engine.advance(now)
+    elif event == "restarted":
+        engine.restart(now)
+
+
+# Appends every engine event to a binary file of length-prefixed records, with
+# a full engine snapshot at the start and then at most every
+# `snapshot_interval` seconds (taken when a spin starts, between inputs).
+class SessionJournal:
+    def __init__(
+        self,
+        path: Path,
+        engine: WheelEngine,
+        snapshot_interval: float = DEFAULT_SNAPSHOT_INTERVAL,
+    ) -> None:
+        self.path = path
+        self.engine = engine
+        self.snapshot_interval = snapshot_interval
+        self.handle = path.open("wb")
+        self.handle.write(JOURNAL_HEADER.pack(JOURNAL_MAGIC, JOURNAL_VERSION))
+        config = json.dumps(engine.compiled.to_payload(), separators=(",", ":"))
+        self.write_record(RECORD_CONFIG, engine.now, zlib.compress(config.encode("utf-8")))
+        self.records = 0
+        self.last_snapshot = engine.now
+        self.snapshot()
+        engine.subscribe(self)
+
+    def write_record(self, kind: int, now: float, payload: bytes) -> None:
+        self.handle.write(RECORD_HEADER.pack(len(payload), kind, now))
+        self.handle.write(payload)
+
+    def snapshot(self) -> None:
+        self.last_snapshot = self.engine.now
+        self.write_record(RECORD_SNAPSHOT, self.engine.now, dump_snapshot(self.engine))
+        self.handle.flush()
+
+    def __call__(self, event: str, payload: dict[str, object]) -> None:
+        code = EVENT_CODES.get(event)
+        if code is None or self.handle.closed:
+            return
+        now = float(payload.get("now", self.engine.now))  # type: ignore[arg-type]
+        details = {key: value for key, value in payload.items() if key != "now"}
+        body = bytes([code])
+        if details:
+            body += json.dumps(details, separators=(",", ":"), default=str).encode("utf-8")
+        self.write_record(RECORD_EVENT, now, body)
+        self.records += 1
+        if (
+            event == "spin_started"
+            and self.engine.batch_depth == 0
+            and now - self.last_snapshot >= self.snapshot_interval
+        ):
+            self.snapshot()
+
+    def close(self) -> None:
+        if not self.handle.closed:
+            self.handle.close()
+
+
+class JournalError(ValueError):
+    pass
+
+
+# Indexes a journal by scanning record headers only, so seeking costs one
+# snapshot load plus the inputs recorded after it.
+class JournalReader:
+    def __init__(self, path: Path) -> None:
+        self.data = path.read_bytes()
+        if len(self.data) < JOURNAL_HEADER.size:
+            raise JournalError(f"{path} is not a session journal")
+        magic, version = JOURNAL_HEADER.unpack_from(self.data)
+        if magic != JOURNAL_MAGIC or version != JOURNAL_VERSION:
+            raise JournalError(f"{path} is not a version {JOURNAL_VERSION} session journal")
+
+        # (kind, time, payload start, payload end) per complete record.
+        self.records: list[tuple[int, float, int, int]] = []
+        self.snapshots: list[int] = []
+        self.snapshot_times: list[float] = []
+        offset = JOURNAL_HEADER.size
+        while offset + RECORD_HEADER.size <= len(self.data):
+            length, kind, now = RECORD_HEADER.unpack_from(self.data, offset)
+            start = offset + RECORD_HEADER.size
+            end = start + length
+            if end > len(self.data):
+                # A crash mid-write leaves a partial last record; ignore it.
+                break
+            if kind == RECORD_SNAPSHOT:
+                self.snapshots.append(len(self.records))
+                self.snapshot_times.append(now)
+            self.records.append((kind, now, start, end))
+            offset = end
+
+        if not self.records or self.records[0][0] != RECORD_CONFIG or not self.snapshots:
+            raise JournalError(f"{path} has no configuration or snapshot")
+        _, _, start, end = self.records[0]
+        payload = json.loads(zlib.decompress(self.data[start:end]))
+        self.compiled = CompiledConfig.from_payload(payload)
+
+    @property
+    def start_time(self) -> float:
+        return self.records[0][1]
+
+    @property
+    def end_time(self) -> float:
+        return self.records[-1][1]
+
+    def decode_event(self, start: int, end: int) -> tuple[str, dict[str, object]]:
+        name = EVENT_NAMES[self.data[start]]
+        payload = json.loads(self.data[start + 1 : end]) if end > start + 1 else {}
+        return name, payload
+
+    def events(self) -> Iterator[tuple[float, str, dict[str, object]]]:
+        for kind, now, start, end in self.records:
+            if kind == RECORD_EVENT:
+                name, payload = self.decode_event(start, end)
+                yield now, name, payload
+
+    def snapshot_state(self, record_index: int) -> WheelEngine:
+        _, _, start, end = self.records[record_index]
+        return load_snapshot(self.data[start:end], self.compiled)
+
+    def inputs(self, after: int = 0) -> Iterator[tuple[float, str, dict[str, object]]]:
+        # Input events recorded after record `after`; only these are decoded.
+        for kind, now, start, end in self.records[after + 1 :]:
+            if kind != RECORD_EVENT or self.data[start] >= len(EVENT_NAMES):
+                continue
+            if EVENT_NAMES[self.data[start]] not in INPUT_EVENTS:
+                continue
+            name, payload = self.decode_event(start, end)
+            yield now, name, payload
+
+    def state_at(self, when: float) -> WheelEngine:
+        # Engine state after every input recorded at or before `when`.
+        position = max(0, bisect.bisect_right(self.snapshot_times, when) - 1)
+        record_index = self.snapshots[position]
+        engine = self.snapshot_state(record_index)
+        for now, name, payload in self.inputs(record_index):
+            if now > when:
+                break
+            apply_input(engine, name, payload, now)
+        return engine
+
+
+def describe_state(engine: WheelEngine) -> list[str]:
+    lines = [
+        f"BPM: {engine.display_bps_value()}",
+        f"Items ({len(engine.items)}): {', '.join(engine.items)}",
+        f"Hidden: {len(engine.hidden)}",
+    ]
+    if engine.wheel_pause_active:
+        lines.append(f"Wheel paused until {engine.wheel_pause_end_time:.1f}")
+    if engine.game_over:
+        lines.append("Game over")
+    return lines
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Replay a Wheel of Fortune session journal")
+    parser.add_argument("journal", type=Path)
+    parser.add_argument(
+        "--at",
+        type=float,
+        metavar="SECONDS",
+        help="show the wheel this many seconds into the session (default: the end)",
+    )
+    parser.add_argument("--events", action="store_true", help="list the recorded events")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    reader = JournalReader(args.journal)
+    start = reader.start_time
+    if args.events:
+        for now, name, payload in reader.events():
+            details = " ".join(f"{key}={value}" for key, value in payload.items())
+            print(f"{now - start:10.3f}  {name} {details}".rstrip())
+    when = reader.end_time if args.at is None else start + args.at
+    print(f"State at {when - start:.3f}s:")
+    for line in describe_state(reader.state_at(when)):
+        print(f"  {line}")
+
+
+if __name__ == "__main__":
+    main()
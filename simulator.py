@@ -0,0 +1,376 @@
+import argparse
+import importlib.util
+import math
+import re
+from pathlib import Path
+
+from engine import WheelEngine
+from module_parser import split_item_lines
+
+if importlib.util.find_spec("numpy") is not None:  # pragma: no cover - optional dependency
+    import numpy as np  # type: ignore
+else:  # pragma: no cover - fallback when numpy is unavailable
+    np = None  # type: ignore
+
+
+END_REASONS = ["unfinished", "target", "max", "fragile", "cooldown", "empty", "stalled"]
+PERCENTILES = [5, 25, 50, 75, 95]
+
+
+# Copies of a base name always share their modules, so every session is
+# stored as per-name copy counts and visibility is derived from the BPM and
+# timer bounds whenever the wheel is inspected.
+class SessionSimulator:
+    def __init__(
+        self,
+        raw_items: list[str],
+        sessions: int = 10000,
+        seed: int | None = None,
+        spin_seconds: float = 5.0,
+        auto_spin_delay: float = 0.3,
+        max_spins: int = 1000,
+        initial_bps: int = 60,
+    ) -> None:
+        if np is None:
+            raise RuntimeError("The session simulator requires NumPy.")
+
+        engine = WheelEngine(raw_items, initial_bps=initial_bps)
+        if engine.config_error is not None:
+            raise ValueError(engine.config_error)
+
+        self.sessions = sessions
+        self.rng = np.random.default_rng(seed)
+        self.spin_seconds = spin_seconds
+        self.auto_spin_delay = auto_spin_delay
+        self.max_spins = max_spins
+        self.initial_bps = float(engine.bps)
+        self.compile(engine)
+
+    def compile(self, engine: WheelEngine) -> None:
+        compiled = engine.compiled
+        names: list[str] = []
+        modules_by_name: dict[str, dict[str, int | bool | float | str]] = {}
+        spawn_lines: dict[str, int] = {}
+        for base_name, spec_index, _ in compiled.entries:
+            if base_name not in modules_by_name:
+                names.append(base_name)
+                modules_by_name[base_name] = compiled.modules[spec_index]
+        for entry_index, _ in compiled.spawn_entries:
+            name = compiled.entries[entry_index][0]
+            spawn_lines[name] = spawn_lines.get(name, 0) + 1
+
+        self.names = names
+        count = len(names)
+
+        def column(key: str, default: float) -> "np.ndarray":
+            return np.array(
+                [float(modules_by_name[name].get(key, default)) for name in names]
+            )
+
+        self.bps_min = column("bps_min", -math.inf)
+        self.bps_max = column("bps_max", math.inf)
+        self.timer_min = column("timer_min_seconds", -math.inf)
+        self.timer_max = column("timer_max_seconds", math.inf)
+        self.bpm_multiplier = column("bpm_multiplier", 1.0)
+        self.bpm_boost = column("bpm_boost", 0.0)
+        self.has_multiplier = np.array(["bpm_multiplier" in modules_by_name[n] for n in names])
+        self.has_boost = np.array(["bpm_boost" in modules_by_name[n] for n in names])
+        self.reset_timer = np.array([bool(modules_by_name[n].get("reset_timer")) for n in names])
+        self.fragile = np.array(["fragile" in modules_by_name[n] for n in names])
+        self.post_pause_reset = np.array(
+            [bool(modules_by_name[n].get("post_pause_reset")) for n in names]
+        )
+        self.cooldown = column("cooldown", 0.0)
+        self.pause_wheel = column("pause_wheel", 0.0)
+        self.pause_heartbeat = column("pause_heartbeat", 0.0)
+        self.special_target = np.array(
+            [engine.special_targets_by_name.get(n, 0) for n in names], dtype=np.int64
+        )
+        self.max_target = np.array(
+            [engine.max_targets_by_name.get(n, 0) for n in names], dtype=np.int64
+        )
+        self.name_multiplier = np.array(
+            [
+                int(match.group(1)) if (match := re.fullmatch(r"(\d+)x", n.strip().lower())) else 0
+                for n in names
+            ],
+            dtype=np.int64,
+        )
+        self.spawn_lines = np.array([spawn_lines.get(n, 0) for n in names], dtype=np.int64)
+        spawn_initial = column("spawn_initial", 0.0)
+        spawn_repeat = column("spawn_repeat", 0.0)
+        first_delay = np.where(spawn_initial > 0, spawn_initial, spawn_repeat)
+        self.spawn_first = np.where(
+            (self.spawn_lines > 0) & (first_delay > 0), first_delay, math.inf
+        )
+        self.spawn_repeat = spawn_repeat
+
+        index_by_name = {name: idx for idx, name in enumerate(names)}
+        initial_copies = np.zeros(count, dtype=np.int64)
+        for name in engine.base_names:
+            initial_copies[index_by_name[name]] += 1
+        for record in engine.hidden_items:
+            initial_copies[index_by_name[str(record["base_name"])]] += 1
+        self.initial_copies = initial_copies
+
+        interval = self.spin_seconds + self.auto_spin_delay
+        longest_cooldown = float(self.cooldown.max()) if count else 0.0
+        self.cooldown_slots = int(math.ceil(longest_cooldown / interval)) + 1
+
+    def allowed(self, bps: "np.ndarray", elapsed: "np.ndarray") -> "np.ndarray":
+        bps = bps[:, None]
+        elapsed = elapsed[:, None]
+        return (
+            (bps > self.bps_min)
+            & (bps < self.bps_max)
+            & (elapsed > self.timer_min)
+            & (elapsed < self.timer_max)
+        )
+
+    def run(self) -> dict[str, object]:
+        sessions = self.sessions
+        count = len(self.names)
+        rows = np.arange(sessions)
+
+        copies = np.tile(self.initial_copies, (sessions, 1))
+        blocked = np.zeros((sessions, count), dtype=bool)
+        special_counts = np.zeros((sessions, count), dtype=np.int64)
+        max_counts = np.zeros((sessions, count), dtype=np.int64)
+        spawn_next = np.tile(self.spawn_first, (sessions, 1))
+        cooldown_expiry = np.full((sessions, self.cooldown_slots), math.inf)
+        cooldown_type = np.zeros((sessions, self.cooldown_slots), dtype=np.int64)
+
+        bps = np.full(sessions, self.initial_bps)
+        pending_multiplier = np.ones(sessions, dtype=np.int64)
+        clock = np.zeros(sessions)
+        timer_start = np.full(sessions, math.nan)
+        heartbeat_pause_end = np.full(sessions, -math.inf)
+        wheel_pause_end = np.full(sessions, -math.inf)
+        timer_stop_at = np.full(sessions, math.inf)
+        spins = np.zeros(sessions, dtype=np.int64)
+        end_reason = np.zeros(sessions, dtype=np.int8)
+        alive = np.ones(sessions, dtype=bool)
+
+        def elapsed_at(now: "np.ndarray") -> "np.ndarray":
+            return np.where(np.isnan(timer_start), 0.0, now - timer_start)
+
+        def visible_counts(now: "np.ndarray") -> "np.ndarray":
+            return copies * self.allowed(bps, elapsed_at(now))
+
+        def advance(now: "np.ndarray") -> None:
+            due = cooldown_expiry <= now[:, None]
+            if due.any():
+                due_rows, due_slots = np.nonzero(due)
+                types = cooldown_type[due_rows, due_slots]
+                restore = ~blocked[due_rows, types]
+                np.add.at(copies, (due_rows[restore], types[restore]), 1)
+                cooldown_expiry[due] = math.inf
+
+            spawning = spawn_next <= now[:, None]
+            if spawning.any():
+                repeat = np.broadcast_to(self.spawn_repeat, spawn_next.shape)
+                waited = np.where(spawning, now[:, None] - spawn_next, 0.0)
+                fired = np.where(
+                    repeat > 0, np.floor(waited / np.where(repeat > 0, repeat, 1)) + 1, 1
+                ).astype(np.int64)
+                fired = np.where(spawning & ~blocked, fired, 0)
+                copies[:] += fired * self.spawn_lines
+                spawn_next[:] = np.where(
+                    spawning,
+                    np.where(repeat > 0, spawn_next + fired * repeat, math.inf),
+                    spawn_next,
+                )
+
+            stopping = timer_stop_at <= now
+            timer_start[stopping] = math.nan
+            timer_stop_at[stopping] = math.inf
+
+        for _ in range(self.max_spins):
+            if not alive.any():
+                break
+
+            advance(np.where(alive, clock, -math.inf))
+            start = clock
+            timer_start[:] = np.where(alive & np.isnan(timer_start), start, timer_start)
+            stalled = alive & (visible_counts(start).sum(axis=1) == 0)
+            end_reason[stalled] = END_REASONS.index("stalled")
+            alive &= ~stalled
+
+            finish = start + self.spin_seconds
+            advance(np.where(alive, finish, -math.inf))
+            visible = visible_counts(finish)
+            totals = visible.sum(axis=1)
+            stalled = alive & (totals == 0)
+            end_reason[stalled] = END_REASONS.index("stalled")
+            alive &= ~stalled
+
+            draws = self.rng.random(sessions) * np.maximum(totals, 1)
+            winner = (np.cumsum(visible, axis=1) <= draws[:, None]).sum(axis=1)
+            winner = np.minimum(winner, count - 1)
+            active = alive.copy()
+            spins += active
+            clock = np.where(active, finish, clock)
+
+            applied = pending_multiplier.copy()
+            name_multiplier = self.name_multiplier[winner]
+            # Saturate instead of wrapping; the BPM clamp makes larger powers moot.
+            pending_multiplier = np.where(
+                active,
+                np.where(
+                    name_multiplier > 0,
+                    np.minimum(pending_multiplier * name_multiplier, 1 << 32),
+                    1,
+                ),
+                pending_multiplier,
+            )
+            has_multiplier = active & self.has_multiplier[winner]
+            has_boost = active & self.has_boost[winner]
+            effect = np.where((applied > 1) & (has_multiplier | has_boost), applied, 1)
+            with np.errstate(over="ignore"):
+                scaled = bps * self.bpm_multiplier[winner] ** effect
+            bps = np.where(has_multiplier, scaled, bps)
+            bps = np.where(has_boost, bps + self.bpm_boost[winner] * effect, bps)
+            bps = np.where(has_multiplier | has_boost, np.clip(bps, 1, 600), bps)
+
+            resetting = active & self.reset_timer[winner]
+            timer_start = np.where(resetting, finish, timer_start)
+
+            ended = np.zeros(sessions, dtype=bool)
+            has_special = active & (self.special_target[winner] > 0)
+            special_counts[rows[has_special], winner[has_special]] += 1
+            hit_target = has_special & (
+                special_counts[rows, winner] >= self.special_target[winner]
+            )
+            end_reason[hit_target] = END_REASONS.index("target")
+            ended |= hit_target
+
+            has_max = active & (self.max_target[winner] > 0)
+            max_counts[rows[has_max], winner[has_max]] += 1
+            reached_max = has_max & (max_counts[rows, winner] >= self.max_target[winner])
+            blocked[rows[reached_max], winner[reached_max]] = True
+            copies[rows[reached_max], winner[reached_max]] = 0
+            spawn_next[rows[reached_max], winner[reached_max]] = math.inf
+            max_emptied = reached_max & ~ended & (visible_counts(finish).sum(axis=1) == 0)
+            end_reason[max_emptied] = END_REASONS.index("max")
+            ended |= max_emptied
+
+            def remove_one(mask: "np.ndarray") -> "np.ndarray":
+                winner_visible = visible_counts(finish)[rows, winner] > 0
+                removing = mask & winner_visible
+                copies[rows[removing], winner[removing]] -= 1
+                return removing
+
+            breaking = active & self.fragile[winner] & ~ended & ~reached_max
+            remove_one(breaking)
+            fragile_emptied = breaking & (visible_counts(finish).sum(axis=1) == 0)
+            end_reason[fragile_emptied] = END_REASONS.index("fragile")
+            ended |= fragile_emptied
+
+            cooling = remove_one(
+                active
+                & (self.cooldown[winner] > 0)
+                & ~ended
+                & ~blocked[rows, winner]
+                & ~reached_max
+            )
+            slot = spins % self.cooldown_slots
+            cooldown_expiry[rows[cooling], slot[cooling]] = (
+                finish[cooling] + self.cooldown[winner][cooling]
+            )
+            cooldown_type[rows[cooling], slot[cooling]] = winner[cooling]
+            cooldown_emptied = cooling & (visible_counts(finish).sum(axis=1) == 0)
+            end_reason[cooldown_emptied] = END_REASONS.index("cooldown")
+            ended |= cooldown_emptied
+
+            continuing = active & ~ended
+            heartbeat_pausing = continuing & (self.pause_heartbeat[winner] > 0)
+            heartbeat_pause_end = np.where(
+                heartbeat_pausing, finish + self.pause_heartbeat[winner], heartbeat_pause_end
+            )
+            wheel_pausing = continuing & (self.pause_wheel[winner] > 0)
+            wheel_pause_end = np.where(
+                wheel_pausing, finish + self.pause_wheel[winner], wheel_pause_end
+            )
+            post_reset = (heartbeat_pausing | wheel_pausing) & self.post_pause_reset[winner]
+            next_pause_end = np.minimum(
+                np.where(heartbeat_pause_end > finish, heartbeat_pause_end, math.inf),
+                np.where(wheel_pause_end > finish, wheel_pause_end, math.inf),
+            )
+            timer_stop_at = np.where(post_reset, next_pause_end, timer_stop_at)
+
+            emptied = (
+                continuing
+                & ~wheel_pausing
+                & (visible_counts(finish).sum(axis=1) == 0)
+            )
+            end_reason[emptied] = END_REASONS.index("empty")
+            ended |= emptied
+
+            alive &= ~ended
+            clock = np.where(
+                alive,
+                np.where(wheel_pausing, wheel_pause_end, finish + self.auto_spin_delay),
+                clock,
+            )
+
+        return self.summarize(spins, clock, bps, end_reason)
+
+    def summarize(
+        self,
+        spins: "np.ndarray",
+        clock: "np.ndarray",
+        bps: "np.ndarray",
+        end_reason: "np.ndarray",
+    ) -> dict[str, object]:
+        reasons = np.bincount(end_reason, minlength=len(END_REASONS))
+        return {
+            "sessions": self.sessions,
+            "end_reasons": {
+                name: float(reasons[idx]) / self.sessions
+                for idx, name in enumerate(END_REASONS)
+            },
+            "spins": self.percentiles(spins),
+            "session_seconds": self.percentiles(clock),
+            "final_bpm": self.percentiles(np.round(bps)),
+        }
+
+    @staticmethod
+    def percentiles(values: "np.ndarray") -> dict[str, float]:
+        result = {f"p{p}": float(v) for p, v in zip(PERCENTILES, np.percentile(values, PERCENTILES))}
+        result["mean"] = float(values.mean())
+        return result
+
+
+def format_report(report: dict[str, object]) -> str:
+    lines = [f"Sessions: {report['sessions']}", "End conditions:"]
+    for name, share in report["end_reasons"].items():  # type: ignore[union-attr]
+        if share:
+            lines.append(f"  {name:<10} {share:7.2%}")
+    for key, title in (
+        ("spins", "Spins"),
+        ("session_seconds", "Session seconds"),
+        ("final_bpm", "Final BPM"),
+    ):
+        stats = report[key]
+        columns = "  ".join(f"{name}={value:.1f}" for name, value in stats.items())  # type: ignore[union-attr]
+        lines.append(f"{title}: {columns}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Simulate Wheel of Fortune sessions")
+    parser.add_argument("items", type=Path, help="item file to simulate")
+    parser.add_argument("--sessions", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--max-spins", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    items, _ = split_item_lines(args.items.read_text(encoding="utf-8"))
+    simulator = SessionSimulator(
+        items, sessions=args.sessions, seed=args.seed, max_spins=args.max_spins
+    )
+    print(format_report(simulator.run()))
+
+
+if __name__ == "__main__":
+    main()
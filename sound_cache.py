@@ -0,0 +1,140 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+DEFAULT_BUDGET_BYTES = 64 * 1024 * 1024
+DEFAULT_WORKERS = 2
+
+SoundLoader = Callable[[str], object | None]
+
+
+def sound_size(sound: object | None) -> int:
+    if sound is None:
+        return 0
+    frames = getattr(sound, "frames", None)
+    if frames is not None and hasattr(frames, "nbytes"):
+        return int(frames.nbytes)
+    audio_data = getattr(sound, "audio_data", None)
+    if audio_data is not None:
+        return len(audio_data)
+    get_raw = getattr(sound, "get_raw", None)
+    if get_raw is not None:
+        try:
+            return len(get_raw())
+        except Exception:
+            return 0
+    return 0
+
+
+# Decoded sounds by filename, least recently used first. Missing files are
+# cached as None so the candidate paths are probed only once per name.
+class SoundCache:
+    def __init__(
+        self,
+        loader: SoundLoader,
+        budget_bytes: int = DEFAULT_BUDGET_BYTES,
+        workers: int = DEFAULT_WORKERS,
+    ) -> None:
+        self.loader = loader
+        self.budget_bytes = budget_bytes
+        self.workers = workers
+        self.lock = threading.Lock()
+        self.entries: OrderedDict[str, tuple[object | None, int]] = OrderedDict()
+        self.pending: dict[str, Future] = {}
+        self.executor: ThreadPoolExecutor | None = None
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.decodes = 0
+        self.decode_seconds = 0.0
+
+    def __contains__(self, filename: str) -> bool:
+        with self.lock:
+            return filename in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def decode(self, filename: str) -> object | None:
+        start = time.perf_counter()
+        sound = None
+        try:
+            sound = self.loader(filename)
+        except Exception:
+            # A file that fails to decode is cached as missing, not retried.
+            sound = None
+        finally:
+            elapsed = time.perf_counter() - start
+            with self.lock:
+                self.decodes += 1
+                self.decode_seconds += elapsed
+                self.store(filename, sound)
+                self.pending.pop(filename, None)
+        return sound
+
+    def store(self, filename: str, sound: object | None) -> None:
+        previous = self.entries.pop(filename, None)
+        if previous is not None:
+            self.used_bytes -= previous[1]
+        size = sound_size(sound)
+        self.entries[filename] = (sound, size)
+        self.used_bytes += size
+        while self.used_bytes > self.budget_bytes and len(self.entries) > 1:
+            _, (_, evicted_size) = self.entries.popitem(last=False)
+            self.used_bytes -= evicted_size
+            self.evictions += 1
+
+    def get(self, filename: str) -> object | None:
+        with self.lock:
+            entry = self.entries.get(filename)
+            if entry is not None:
+                self.hits += 1
+                self.entries.move_to_end(filename)
+                return entry[0]
+            self.misses += 1
+            future = self.pending.get(filename)
+        if future is not None:
+            # Already decoding in the background; waiting is cheaper than a second decode.
+            return future.result()
+        return self.decode(filename)
+
+    def preload(self, filenames: list[str]) -> list[Future]:
+        futures = []
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="sound-preload"
+                )
+            for filename in dict.fromkeys(filenames):
+                if filename in self.entries or filename in self.pending:
+                    continue
+                future = self.executor.submit(self.decode, filename)
+                self.pending[filename] = future
+                futures.append(future)
+        return futures
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.used_bytes = 0
+
+    def shutdown(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    def stats(self) -> dict[str, float]:
+        with self.lock:
+            return {
+                "entries": len(self.entries),
+                "used_bytes": self.used_bytes,
+                "budget_bytes": self.budget_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "decodes": self.decodes,
+                "decode_seconds": self.decode_seconds,
+            }
@@ -0,0 +1,192 @@
+import csv
+import io
+import json
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import TextIO
+
+DEFAULT_MAX_BYTES = 1024 * 1024
+DEFAULT_BACKUPS = 3
+DEFAULT_QUEUE_SIZE = 1024
+DEFAULT_BATCH_SIZE = 64
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest")
+CSV_FIELDS = ("time", "seq", "selection", "timer", "bpm")
+
+
+def spin_record(seq: int, selection: str, timer_text: str, bpm_text: str) -> dict[str, object]:
+    return {
+        "time": round(time.time(), 3),
+        "seq": seq,
+        "selection": selection,
+        "timer": timer_text,
+        "bpm": bpm_text,
+    }
+
+
+def console_lines(record: dict[str, object]) -> str:
+    return f"1. Selected: {record['selection']}\n2. {record['timer']}\n3. {record['bpm']}\n"
+
+
+# Size-rotated JSONL or CSV file (chosen by suffix): `path` is the live file
+# and path.1 … path.N the older ones, like logging's RotatingFileHandler.
+class RotatingSpinFile:
+    def __init__(self, path: Path, max_bytes: int, backups: int) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.csv = path.suffix.lower() == ".csv"
+        self.handle: TextIO | None = None
+        self.size = 0
+        self.rotations = 0
+
+    def open(self) -> TextIO:
+        if self.handle is None:
+            self.size = self.path.stat().st_size if self.path.exists() else 0
+            self.handle = self.path.open("a", newline="", encoding="utf-8")
+            if self.csv and self.size == 0:
+                header = ",".join(CSV_FIELDS) + "\r\n"
+                self.handle.write(header)
+                self.size += len(header)
+        return self.handle
+
+    def format(self, record: dict[str, object]) -> str:
+        if not self.csv:
+            return json.dumps(record, ensure_ascii=False) + "\n"
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow([record[field] for field in CSV_FIELDS])
+        return buffer.getvalue()
+
+    def write(self, records: list[dict[str, object]]) -> None:
+        text = "".join(self.format(record) for record in records)
+        size = len(text.encode("utf-8"))
+        if self.size and self.size + size > self.max_bytes:
+            self.rotate()
+        handle = self.open()
+        handle.write(text)
+        handle.flush()
+        self.size += size
+
+    def rotate(self) -> None:
+        self.close()
+        self.rotations += 1
+        if self.backups <= 0:
+            self.path.unlink(missing_ok=True)
+            return
+        for index in range(self.backups - 1, 0, -1):
+            older = self.path.with_name(f"{self.path.name}.{index}")
+            if older.exists():
+                older.replace(self.path.with_name(f"{self.path.name}.{index + 1}"))
+        if self.path.exists():
+            self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+
+    def close(self) -> None:
+        if self.handle is not None:
+            self.handle.close()
+            self.handle = None
+
+
+# Spin results are handed to a background writer through a bounded queue, so
+# a slow disk or a stdout pipe nobody reads can never stall the Tk thread.
+# When the queue is full, "drop_oldest" discards the oldest waiting record
+# and "drop_newest" the one being logged; either way `dropped` counts it.
+class SpinLogger:
+    def __init__(
+        self,
+        path: Path | None = None,
+        stream: TextIO | None = sys.stdout,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backups: int = DEFAULT_BACKUPS,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        overflow: str = "drop_oldest",
+    ) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {', '.join(OVERFLOW_POLICIES)}")
+        self.file = RotatingSpinFile(path, max_bytes, backups) if path is not None else None
+        self.stream = stream
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.overflow = overflow
+        self.condition = threading.Condition()
+        self.pending: deque[dict[str, object]] = deque()
+        self.seq = 0
+        self.written = 0
+        self.dropped = 0
+        self.errors = 0
+        self.closed = False
+        self.busy = False
+        self.thread = threading.Thread(target=self.run, name="spin-log", daemon=True)
+        self.thread.start()
+
+    def log(self, selection: str, timer_text: str, bpm_text: str) -> bool:
+        with self.condition:
+            if self.closed:
+                return False
+            self.seq += 1
+            if len(self.pending) >= self.queue_size:
+                self.dropped += 1
+                if self.overflow == "drop_newest":
+                    return False
+                self.pending.popleft()
+            self.pending.append(spin_record(self.seq, selection, timer_text, bpm_text))
+            self.condition.notify()
+        return True
+
+    def run(self) -> None:
+        while True:
+            with self.condition:
+                while not self.pending and not self.closed:
+                    self.condition.wait()
+                if not self.pending:
+                    return
+                count = min(self.batch_size, len(self.pending))
+                batch = [self.pending.popleft() for _ in range(count)]
+                self.busy = True
+            self.write(batch)
+            with self.condition:
+                self.written += len(batch)
+                self.busy = False
+                self.condition.notify_all()
+
+    def write(self, batch: list[dict[str, object]]) -> None:
+        try:
+            if self.file is not None:
+                self.file.write(batch)
+            if self.stream is not None:
+                self.stream.write("".join(console_lines(record) for record in batch))
+                self.stream.flush()
+        except (OSError, ValueError):
+            with self.condition:
+                self.errors += 1
+
+    def flush(self, timeout: float | None = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.condition:
+            while self.pending or self.busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self.condition.wait(remaining)
+        return True
+
+    def close(self, timeout: float = 2.0) -> None:
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+        self.thread.join(timeout)
+        if self.file is not None and not self.thread.is_alive():
+            self.file.close()
+
+    def stats(self) -> dict[str, int]:
+        with self.condition:
+            return {
+                "logged": self.seq,
+                "written": self.written,
+                "dropped": self.dropped,
+                "queued": len(self.pending),
+                "errors": self.errors,
+                "rotations": self.file.rotations if self.file is not None else 0,
+            }
@@ -0,0 +1,84 @@
+import math
+import random
+
+SPIN_SECONDS = 5.0
+COAST_SECONDS = 2.0
+NOISE_STEP = 1 / 60
+
+
+def pointer_index(angle: float, count: int) -> int:
+    if count <= 0:
+        return 0
+    sector_angle = 360 / count
+    relative = (sector_angle / 2 - angle) % 360
+    return min(int(relative // sector_angle), count - 1)
+
+
+# Angle of the wheel against time for one spin, drawn up front from an RNG.
+# The speed coasts for two seconds and then slows linearly to zero at five;
+# jitter is a speed factor that changes every NOISE_STEP seconds. Each noise
+# segment's starting angle is precomputed, so any time is answered in O(1)
+# and the landing angle (and winner) is known before the first frame.
+class SpinTrajectory:
+    __slots__ = (
+        "start_angle",
+        "initial_speed",
+        "deceleration",
+        "noise",
+        "noise_step",
+        "offsets",
+        "final_angle",
+    )
+
+    def __init__(
+        self,
+        start_angle: float,
+        initial_speed: float,
+        noise: list[float] | None = None,
+        noise_step: float = NOISE_STEP,
+    ) -> None:
+        self.start_angle = start_angle
+        self.initial_speed = initial_speed
+        self.deceleration = initial_speed / (SPIN_SECONDS - COAST_SECONDS)
+        self.noise = list(noise) if noise else [0.0]
+        self.noise_step = noise_step if noise else SPIN_SECONDS
+        self.offsets = [0.0]
+        for segment, factor in enumerate(self.noise[:-1]):
+            start = segment * self.noise_step
+            distance = self.base_distance(start + self.noise_step) - self.base_distance(start)
+            self.offsets.append(self.offsets[-1] + (1 + factor) * distance)
+        self.final_angle = self.angle_at(SPIN_SECONDS)
+
+    @classmethod
+    def generate(cls, rng: random.Random, start_angle: float = 0.0) -> "SpinTrajectory":
+        initial_speed = rng.uniform(4.7, 5.3) * 360
+        jitter = rng.uniform(0.01, 0.05)
+        segments = math.ceil(SPIN_SECONDS / NOISE_STEP)
+        noise = [rng.uniform(-jitter, jitter) for _ in range(segments)]
+        return cls(start_angle, initial_speed, noise)
+
+    @property
+    def duration(self) -> float:
+        return SPIN_SECONDS
+
+    def base_distance(self, elapsed: float) -> float:
+        # Degrees covered by the noise-free speed profile after `elapsed` seconds.
+        elapsed = min(max(elapsed, 0.0), SPIN_SECONDS)
+        if elapsed <= COAST_SECONDS:
+            return self.initial_speed * elapsed
+        slow_time = elapsed - COAST_SECONDS
+        return (
+            self.initial_speed * elapsed - self.deceleration * slow_time * slow_time / 2
+        )
+
+    def angle_at(self, elapsed: float) -> float:
+        elapsed = min(max(elapsed, 0.0), SPIN_SECONDS)
+        segment = min(int(elapsed / self.noise_step), len(self.noise) - 1)
+        start = segment * self.noise_step
+        distance = self.offsets[segment] + (1 + self.noise[segment]) * (
+            self.base_distance(elapsed) - self.base_distance(start)
+        )
+        return (self.start_angle + distance) % 360
+
+    def winning_index(self, count: int) -> int:
+        return pointer_index(self.final_angle, count)
@@ -0,0 +1,19 @@
+import time
+
+
+# Wall time between successive startup marks, shown with --verbose.
+class StartupTimeline:
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.last = self.started
+        self.phases: list[tuple[str, float]] = []
+
+    def mark(self, phase: str) -> None:
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+
+    def format(self) -> str:
+        lines = [f"{phase:<16} {seconds * 1000:>9.1f} ms" for phase, seconds in self.phases]
+        lines.append(f"{'total':<16} {(self.last - self.started) * 1000:>9.1f} ms")
+        return "\n".join(lines)
@@ -0,0 +1,43 @@
+import random
+
+from engine import WheelEngine
+from headless_wheel import build_headless_wheel
+from wheel import WheelOfFortune
+
+
+def build_test_engine(base_name: str, modules: dict[str, int | float], bps: int) -> WheelEngine:
+    engine = WheelEngine([], rng=random.Random(0), initial_bps=bps)
+    engine.add_item_with_modules(base_name, modules, color="#fff")
+    if "max" in modules:
+        engine.max_targets_by_name = {base_name: int(modules["max"])}
+        engine.max_counts_by_name = {base_name: 0}
+    return engine
+
+
+def play_session(engine: WheelEngine, spins: int) -> list[tuple[float, tuple[str, ...], int]]:
+    now = 0.0
+    states = []
+    for _ in range(spins):
+        engine.advance(now)
+        started, _ = engine.start_spin(now)
+        if not started:
+            engine.restart(now)
+            now += 1.0
+            continue
+        finish = now + 5.0
+        engine.advance(finish)
+        engine.finish_spin(engine.trajectory.winning_index(len(engine.items)), finish)
+        states.append((finish, engine.items, engine.display_bps_value()))
+        now = engine.wheel_pause_end_time if engine.wheel_pause_active else finish + 0.3
+    return states
+
+
+def build_test_wheel(base_name: str, modules: dict[str, int | float], bps: int) -> WheelOfFortune:
+    wheel = build_headless_wheel(build_test_engine(base_name, modules, bps))
+    # Tests that draw put the real draw_wheel back with `del wheel.draw_wheel`.
+    wheel.draw_wheel = lambda: None
+    wheel.schedule_heartbeat = lambda: None
+    wheel.schedule_auto_spin = lambda: None
+    wheel.log_recent_selection = lambda selection, timer_text, bpm_text: None
+
+    return wheel
@@ -0,0 +1,71 @@
+import threading
+import unittest
+from pathlib import Path
+
+from audio_backends import AUTO_ORDER, AudioBackend
+
+
+class FakeSound:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.plays = 0
+
+    def play(self) -> None:
+        self.plays += 1
+
+
+class FakeSimpleaudio:
+    class WaveObject:
+        @staticmethod
+        def from_wave_file(path: str) -> FakeSound:
+            if path.endswith("broken.wav"):
+                raise ValueError("bad file")
+            return FakeSound(path)
+
+
+class ScriptedBackend(AudioBackend):
+    # Only the backends listed in `working` open; opening is recorded per thread.
+    def __init__(self, choice: str, working: set[str]) -> None:
+        super().__init__(choice)
+        self.working = working
+        self.opened_on: list[str] = []
+
+    def open(self, name: str) -> bool:
+        self.opened_on.append(threading.current_thread().name)
+        if name == "none":
+            return True
+        if name not in self.working:
+            return False
+        self.module = FakeSimpleaudio
+        return True
+
+
+class AudioBackendTests(unittest.TestCase):
+    def test_auto_tries_backends_in_order_once(self) -> None:
+        backend = ScriptedBackend("auto", {"simpleaudio"})
+        backend.start_background()
+        backend.thread.join(timeout=5)
+
+        self.assertEqual(backend.ensure(), "simpleaudio")
+        self.assertEqual(list(backend.timings), list(AUTO_ORDER[:3]))
+        self.assertEqual(set(backend.opened_on), {"audio-init"})
+
+        sound = backend.load(Path("click.wav"))
+        backend.play(sound)
+        self.assertEqual(sound.plays, 1)
+        self.assertIsNone(backend.load(Path("broken.wav")))
+
+    def test_explicit_backend_falls_back_to_silence(self) -> None:
+        backend = ScriptedBackend("pygame", set())
+
+        self.assertIsNone(backend.load(Path("click.wav")))
+        self.assertEqual(backend.name, "none")
+        self.assertEqual(list(backend.timings), ["pygame"])
+
+    def test_unknown_backend_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            AudioBackend("alsa")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import importlib.util
+import tempfile
+import unittest
+import wave
+from pathlib import Path
+
+from audio_mixer import HeartbeatBank, Mixer, NullSink, Sample, WaveFileSink
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+if HAS_NUMPY:
+    import numpy as np
+
+
+def click(frames: int = 4, channels: int = 2) -> Sample:
+    return Sample("click", np.full((frames, channels), 0.25, dtype=np.float32))
+
+
+def onsets(block: "np.ndarray") -> list[int]:
+    loud = block[:, 0] > 0
+    starts = loud & ~np.concatenate(([False], loud[:-1]))
+    return [int(idx) for idx in np.flatnonzero(starts)]
+
+
+@unittest.skipUnless(HAS_NUMPY, "NumPy is not installed")
+class MixerTests(unittest.TestCase):
+    def test_heartbeats_land_on_exact_frames_across_blocks(self) -> None:
+        mixer = Mixer(sample_rate=1000, channels=2)
+        mixer.set_heartbeat(click(), bpm=480)
+        block = NullSink(mixer, block_frames=37).pull(1.0)
+
+        self.assertEqual(onsets(block), [125, 250, 375, 500, 625, 750, 875])
+        self.assertEqual(mixer.beats_played, 7)
+
+    def test_tempo_change_keeps_phase_of_last_beat(self) -> None:
+        mixer = Mixer(sample_rate=1000, channels=1)
+        sink = NullSink(mixer, block_frames=64)
+        mixer.set_heartbeat(click(channels=1), bpm=120)
+        sink.pull(0.6)
+        mixer.set_heartbeat(click(channels=1), bpm=240)
+        block = sink.pull(0.6)
+
+        self.assertEqual(onsets(block), [150, 400])
+
+    def test_overlapping_voices_are_summed_and_clipped(self) -> None:
+        mixer = Mixer(sample_rate=1000, channels=1)
+        loud = Sample("loud", np.full((10, 1), 0.75, dtype=np.float32))
+        mixer.play_at(loud, 5)
+        mixer.play_at(loud, 8)
+        mixer.play(click(channels=1), delay=0.002)
+        block = NullSink(mixer).pull(0.02)
+
+        self.assertAlmostEqual(float(block[2, 0]), 0.25)
+        self.assertAlmostEqual(float(block[6, 0]), 0.75)
+        self.assertAlmostEqual(float(block[9, 0]), 1.0)
+        self.assertEqual(mixer.voices, [])
+
+    def test_file_sink_round_trips_through_wav_decoding(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "out.wav"
+            mixer = Mixer(sample_rate=8000, channels=2)
+            sink = WaveFileSink(mixer, path)
+            mixer.play(click(frames=80))
+            sink.pull(0.05)
+            sink.stop()
+
+            with wave.open(str(path), "rb") as wav:
+                self.assertEqual(wav.getnframes(), 400)
+            resampled = Mixer(sample_rate=16000, channels=1).load(path)
+            self.assertEqual(resampled.frames.shape, (800, 1))
+            self.assertAlmostEqual(float(resampled.frames[10, 0]), 0.25, places=3)
+
+
+@unittest.skipUnless(HAS_NUMPY, "NumPy is not installed")
+class HeartbeatBankTests(unittest.TestCase):
+    def test_renders_fit_the_beat_interval_and_are_reused(self) -> None:
+        base = Sample("beat", np.linspace(0.0, 1.0, 1000, dtype=np.float32).reshape(-1, 1))
+        bank = HeartbeatBank(base, base_bpm=60.0, step=2.0, capacity=2)
+
+        fast = bank.get(599.3)
+        self.assertEqual(len(fast), 100)
+        self.assertAlmostEqual(float(fast.frames[50, 0]), 0.5, places=2)
+        self.assertIs(bank.get(599.9), fast)
+        self.assertIs(bank.get(30.0).frames, base.frames)
+        bank.get(120.0)
+
+        self.assertEqual(list(bank.renders), [30.0, 120.0])
+        self.assertEqual((bank.hits, bank.misses), (1, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,25 @@
+import unittest
+
+from benchmark import CASES, compare, run_benchmarks
+
+
+class BenchmarkTests(unittest.TestCase):
+    def test_every_case_runs_headless(self) -> None:
+        report = run_benchmarks(sizes=(10,), repeat=1)
+
+        self.assertEqual(set(report["results"]), set(CASES))
+        self.assertTrue(all(sizes["10"] >= 0 for sizes in report["results"].values()))
+
+    def test_compare_flags_only_real_slowdowns(self) -> None:
+        baseline = {"results": {"draw_wheel": {"10": 0.010, "100": 0.00001}, "gone": {"10": 1.0}}}
+        current = {"results": {"draw_wheel": {"10": 0.020, "100": 0.00005, "1000": 5.0}}}
+
+        regressions = compare(baseline, current, threshold=0.25)
+
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith("draw_wheel @ 10:"))
+        self.assertEqual(compare(baseline, current, threshold=1.5), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
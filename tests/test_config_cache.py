@@ -0,0 +1,84 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from config_cache import (
+    cache_path_for,
+    compile_items,
+    content_digest,
+    dump_compiled,
+    load_compiled,
+    load_or_compile,
+)
+from engine import WheelEngine
+from module_parser import split_item_lines
+
+CONFIG_TEXT = """Nothing :)
+2x (Cooldown 10)
+Long Breath (Missing) (Spawn 120 0) (*0.75) (Pause Wheel 30) (Max 3)
+Gold (1/3) (+6)
+Quick Breath (breath.wav) (> 15s) (Reset) (Fragile)
+Gold (1/3) (+6)
+Odd (whatever)
+"""
+
+
+class CompiledConfigTests(unittest.TestCase):
+    def test_modules_are_interned(self) -> None:
+        items, positions = split_item_lines(CONFIG_TEXT)
+        compiled = compile_items(items, positions)
+
+        self.assertEqual(len(compiled.entries), 7)
+        self.assertEqual(len(compiled.modules), 5)
+        self.assertEqual(compiled.entries[0][1], compiled.entries[6][1])
+        self.assertEqual(compiled.entries[3][1], compiled.entries[5][1])
+        self.assertEqual(compiled.spawn_entries, [(2, None)])
+        self.assertEqual(compiled.special_targets, {"Gold": 3})
+        self.assertEqual(compiled.max_targets, {"Long Breath": 3})
+        self.assertEqual(compiled.labels[2], "Gold (0/3)")
+        self.assertEqual(compiled.warnings, ["line 7, column 5: unknown module 'whatever'"])
+
+    def test_round_trip_matches_fresh_compile(self) -> None:
+        items, positions = split_item_lines(CONFIG_TEXT)
+        compiled = compile_items(items, positions)
+        digest = content_digest(CONFIG_TEXT)
+
+        loaded = load_compiled(dump_compiled(compiled, digest), digest)
+
+        self.assertIsNotNone(loaded)
+        self.assertEqual(loaded.to_payload(), compiled.to_payload())
+        self.assertIsInstance(loaded.modules[2]["bpm_multiplier"], float)
+        self.assertIsNone(load_compiled(dump_compiled(compiled, digest), b"\0" * 32))
+
+    def test_engine_state_matches_uncached_parse(self) -> None:
+        items, positions = split_item_lines(CONFIG_TEXT)
+        digest = content_digest(CONFIG_TEXT)
+        loaded = load_compiled(dump_compiled(compile_items(items, positions), digest), digest)
+
+        cached = WheelEngine.from_compiled(loaded)
+        fresh = WheelEngine(items, positions=positions)
+
+        for name in ("items", "base_names", "item_modules", "colors", "hidden_items", "spawn_configs"):
+            self.assertEqual(getattr(cached, name), getattr(fresh, name), name)
+
+    def test_cache_file_is_reused_until_content_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            config_path = Path(tmp) / "items.txt"
+            items, positions = split_item_lines(CONFIG_TEXT)
+            load_or_compile(config_path, CONFIG_TEXT, items, positions)
+            cache_path = cache_path_for(config_path)
+            self.assertTrue(cache_path.exists())
+
+            stamp = cache_path.read_bytes()
+            load_or_compile(config_path, CONFIG_TEXT, items, positions)
+            self.assertEqual(cache_path.read_bytes(), stamp)
+
+            changed = CONFIG_TEXT + "New (+1)\n"
+            items, positions = split_item_lines(changed)
+            compiled = load_or_compile(config_path, changed, items, positions)
+            self.assertEqual(compiled.labels[-1], "New")
+            self.assertNotEqual(cache_path.read_bytes(), stamp)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+import random
+import unittest
+
+from engine import WheelEngine
+from tests.helpers import build_test_engine
+
+
+class RecordingListener:
+    def __init__(self) -> None:
+        self.events: list[tuple[str, dict[str, object]]] = []
+
+    def __call__(self, event: str, payload: dict[str, object]) -> None:
+        self.events.append((event, payload))
+
+    def names(self) -> list[str]:
+        return [event for event, _ in self.events]
+
+
+class WheelEngineFinishSpinTests(unittest.TestCase):
+    def test_max_item_blocked_after_bpm_filtering(self) -> None:
+        modules = {"max": 1, "bps_min": 90, "bpm_multiplier": 0.1}
+        engine = build_test_engine("Maxer", modules, bps=120)
+        engine.spawn_configs.append(
+            {
+                "index": 0,
+                "base_name": "Maxer",
+                "initial_delay": 1,
+                "repeat_delay": 1,
+                "color": "#fff",
+                "modules": modules,
+            }
+        )
+
+        engine.finish_spin(0, now=0.0)
+
+        self.assertIn("Maxer", engine.max_blocked_names)
+        self.assertEqual(engine.max_counts_by_name["Maxer"], 1)
+        self.assertEqual(engine.base_names, ())
+        self.assertEqual(engine.items, ())
+        self.assertEqual(engine.hidden_items, [])
+        self.assertEqual(engine.spawn_configs, [])
+
+        engine.add_item_with_modules("Maxer", modules, color="#abc")
+        self.assertEqual(engine.base_names, ())
+        self.assertEqual(engine.items, ())
+
+        engine.apply_spawn_effect(
+            {"base_name": "Maxer", "modules": modules, "repeat_delay": 1}
+        )
+        self.assertEqual(engine.pending_timers("spawn"), 0)
+        engine.duplicate_spawn_item({"base_name": "Maxer", "modules": modules, "color": "#fff"})
+        self.assertEqual(engine.base_names, ())
+        self.assertEqual(engine.items, ())
+
+    def test_cooldown_restores_item_when_time_advances(self) -> None:
+        engine = WheelEngine(["A (Cooldown 10)", "B"], rng=random.Random(0))
+        listener = RecordingListener()
+        engine.subscribe(listener)
+
+        engine.start_spin(now=100.0)
+        outcome = engine.finish_spin(0, now=101.0)
+
+        self.assertEqual(outcome["message"], "A is on cooldown for 10 seconds.")
+        self.assertEqual(engine.items, ("B",))
+        self.assertEqual(engine.next_deadline(), 111.0)
+
+        engine.advance(110.9)
+        self.assertEqual(engine.items, ("B",))
+        engine.advance(111.0)
+        self.assertEqual(engine.items, ("B", "A"))
+        self.assertIn("spin_logged", listener.names())
+
+    def test_wheel_pause_blocks_spins_until_it_expires(self) -> None:
+        engine = WheelEngine(["Rest (Pause Wheel 30) (Reset) (Post Pause Reset)", "B"])
+        listener = RecordingListener()
+        engine.subscribe(listener)
+
+        engine.start_spin(now=0.0)
+        outcome = engine.finish_spin(0, now=5.0)
+
+        self.assertTrue(outcome["paused"])
+        self.assertEqual(engine.start_spin(now=10.0), (False, None))
+        engine.advance(35.0)
+
+        self.assertFalse(engine.wheel_pause_active)
+        self.assertIsNone(engine.first_spin_time)
+        self.assertIn(("wheel_pause_ended", {"timer_stopped": True}), listener.events)
+        self.assertEqual(engine.start_spin(now=36.0), (True, None))
+
+    def test_spawns_repeat_on_schedule(self) -> None:
+        engine = WheelEngine(["Seed (Missing) (Spawn 5 10)", "B"])
+
+        engine.start_spin(now=0.0)
+        engine.finish_spin(0, now=1.0)
+        engine.advance(26.0)
+
+        self.assertEqual(engine.base_names.count("Seed"), 3)
+        self.assertEqual(engine.pending_timers("spawn"), 1)
+
+    def test_timer_bounds_flip_on_their_exact_deadline(self) -> None:
+        engine = WheelEngine(["Late (>10s)", "Early (<5s)", "Plain"])
+        self.assertEqual(engine.items, ("Early", "Plain"))
+
+        engine.start_spin(now=100.0)
+        self.assertEqual(engine.pending_timers("eligibility"), 2)
+        engine.advance(105.0)
+        self.assertEqual(engine.items, ("Plain",))
+        engine.advance(110.0)
+        self.assertEqual(engine.items, ("Plain",))
+        self.assertGreater(engine.next_deadline(), 110.0)
+        engine.advance(110.001)
+        self.assertEqual(engine.items, ("Plain", "Late"))
+        self.assertEqual(engine.pending_timers("eligibility"), 0)
+
+    def test_bpm_change_only_rechecks_crossed_bounds(self) -> None:
+        engine = WheelEngine(["Fast (>100)", "Slow (<50)", "Boost (+60)"], initial_bps=60)
+        self.assertEqual(engine.items, ("Boost",))
+        self.assertEqual(engine.eligibility.crossed_by_bps(60, 120), {"Fast"})
+
+        engine.start_spin(now=0.0)
+        engine.finish_spin(0, now=1.0)
+        self.assertEqual(engine.items, ("Boost", "Fast"))
+        self.assertEqual(len(engine.hidden_items), 1)
+
+    def test_batch_coalesces_change_events(self) -> None:
+        engine = WheelEngine(["A", "B", "C", "D"])
+        listener = RecordingListener()
+        engine.subscribe(listener)
+
+        with engine.batch():
+            for _ in range(3):
+                engine.remove_item(0)
+            engine.end_game("done")
+            self.assertEqual(listener.names(), ["game_over"])
+
+        self.assertEqual(listener.names(), ["game_over", "items_changed"])
+        self.assertEqual(engine.items, ("D",))
+
+    def test_seeded_headless_sessions_are_reproducible(self) -> None:
+        def run(seed: int) -> list[str]:
+            engine = WheelEngine(
+                ["Red (+10)", "Blue (*0.5)", "Green (Max 2)", "2x"],
+                rng=random.Random(seed),
+            )
+            winners = []
+            for spin in range(20):
+                outcome = engine.spin(now=float(spin * 6))
+                if outcome is None:
+                    break
+                winners.append(f"{outcome['message']} {engine.display_bps_value()}")
+            return winners
+
+        self.assertEqual(run(7), run(7))
+        self.assertTrue(run(7))
+
+    def test_conflicting_modules_report_config_error(self) -> None:
+        engine = WheelEngine(["A (+1)", "A (+2)"])
+        self.assertIn("Conflicting modules", str(engine.config_error))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+from unittest import mock
+
+from frame_pacer import FramePacer
+from spin_trajectory import SpinTrajectory
+from tests.helpers import build_test_wheel
+
+
+class FramePacerTests(unittest.TestCase):
+    def test_deadlines_do_not_drift_with_frame_cost(self) -> None:
+        pacer = FramePacer(fps=50)
+        pacer.start(10.0)
+        pacer.begin_frame(10.0)
+        self.assertEqual(pacer.delay_ms(10.015), 5)
+        pacer.begin_frame(10.021)
+        self.assertEqual(pacer.delay_ms(10.030), 10)
+        self.assertEqual((pacer.late_frames, pacer.dropped_frames), (0, 0))
+
+    def test_stalls_count_dropped_frames(self) -> None:
+        pacer = FramePacer(fps=60)
+        pacer.start(0.0)
+        pacer.begin_frame(0.0)
+        pacer.begin_frame(0.26)
+
+        self.assertEqual(pacer.late_frames, 1)
+        self.assertEqual(pacer.dropped_frames, 14)
+        self.assertGreater(pacer.next_frame, 0.26)
+        self.assertLessEqual(pacer.next_frame - 0.26, 1 / 60)
+
+
+class ClockRoot:
+    def __init__(self, clock: list[float], stall_at: int) -> None:
+        self.clock = clock
+        self.calls = 0
+        self.stall_at = stall_at
+
+    def after(self, ms: int, func=None):
+        self.calls += 1
+        self.clock[0] += ms / 1000 + (0.3 if self.calls == self.stall_at else 0.0)
+        func()
+        return "job"
+
+    def after_cancel(self, job) -> None:
+        return None
+
+
+class SpinPacingTests(unittest.TestCase):
+    def spin(self, fps: float, stall_at: int) -> tuple[float, float, int]:
+        wheel = build_test_wheel("Red", {}, bps=60)
+        clock = [100.0]
+        wheel.root = ClockRoot(clock, stall_at)
+        wheel.frame_pacer = FramePacer(fps)
+        wheel.engine.spinning = True
+        wheel.trajectory = SpinTrajectory(0.0, 1800.0)
+        wheel.spin_elapsed = 0.0
+        wheel.play_click_sound = lambda: None
+        finished = []
+        wheel.finish_spin = lambda: finished.append(clock[0])
+
+        with mock.patch("wheel.time.perf_counter", lambda: clock[0]):
+            wheel.frame_pacer.start(clock[0])
+            wheel.update_spin()
+
+        self.assertEqual(len(finished), 1)
+        return wheel.angle_offset, finished[0] - 100.0, wheel.frame_pacer.frames
+
+    def test_spin_covers_the_same_angle_at_any_frame_rate(self) -> None:
+        angle_60, duration_60, frames_60 = self.spin(60, stall_at=0)
+        angle_30, duration_30, frames_30 = self.spin(30, stall_at=40)
+
+        self.assertAlmostEqual(angle_60, 180.0, delta=1e-9)
+        self.assertAlmostEqual(angle_30, 180.0, delta=1e-9)
+        self.assertAlmostEqual(duration_60, 5.0, delta=0.02)
+        self.assertAlmostEqual(duration_30, 5.0, delta=0.04)
+        self.assertLess(frames_30, frames_60)
+
+
+if __name__ == "__main__":
+    unittest.main()
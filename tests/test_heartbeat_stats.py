@@ -0,0 +1,64 @@
+import csv
+import importlib.util
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from heartbeat_stats import HeartbeatRecorder
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+class HeartbeatRecorderTests(unittest.TestCase):
+    def test_latency_and_jitter_are_kept_per_bpm(self) -> None:
+        recorder = HeartbeatRecorder()
+        for beat, late in enumerate([0.002, 0.004, 0.002]):
+            scheduled = beat * 0.5
+            recorder.record(120.0, scheduled, scheduled + 0.001, scheduled + late)
+        recorder.record(240.0, 2.0, None, 2.010)
+
+        summary = recorder.summary()
+        tier = summary["bpm"]["120"]
+        self.assertEqual(summary["beats"], 4)
+        self.assertEqual(tier["beats"], 3)
+        self.assertAlmostEqual(tier["latency_ms"]["max"], 4.0)
+        self.assertAlmostEqual(tier["jitter_ms"]["max"], 2.0)
+        self.assertEqual(tier["latency_ms"]["histogram"][2], 2)
+        self.assertEqual(summary["bpm"]["240"]["jitter_ms"]["histogram"], [0] * 101)
+
+    def test_exports_csv_rows_and_json_summary(self) -> None:
+        recorder = HeartbeatRecorder()
+        recorder.record(60.0, 1.0, 1.0005, 1.003)
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = Path(tmp) / "beats.csv"
+            json_path = Path(tmp) / "beats.json"
+            recorder.export(csv_path)
+            recorder.export(json_path)
+
+            with csv_path.open(newline="") as handle:
+                rows = list(csv.DictReader(handle))
+            self.assertEqual(rows[0]["bpm"], "60")
+            self.assertEqual(rows[0]["latency_ms"], "3.000")
+            self.assertEqual(json.loads(json_path.read_text())["beats"], 1)
+
+    @unittest.skipUnless(HAS_NUMPY, "NumPy is not installed")
+    def test_mixer_reports_beats_on_its_nominal_clock(self) -> None:
+        import numpy as np
+
+        from audio_mixer import Mixer, NullSink, Sample
+
+        recorder = HeartbeatRecorder()
+        mixer = Mixer(sample_rate=1000, channels=1)
+        mixer.beat_listener = recorder.record
+        mixer.set_heartbeat(Sample("beat", np.ones((5, 1), dtype=np.float32)), bpm=600)
+        NullSink(mixer, block_frames=64).pull(1.0)
+
+        beats = list(recorder.beats)
+        self.assertEqual(len(beats), 9)
+        self.assertAlmostEqual(beats[1].scheduled - beats[0].scheduled, 0.1)
+        self.assertTrue(all(abs(beat.latency) < 1e-9 for beat in beats))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+
+from item_store import ItemRecord, ItemStore
+
+
+def build_store(names: list[str]) -> ItemStore:
+    store = ItemStore()
+    for name in names:
+        store.append(ItemRecord(name, {}, "#fff", name))
+    return store
+
+
+class ItemStoreTests(unittest.TestCase):
+    def test_discard_keeps_order_and_name_index(self) -> None:
+        store = build_store(["A", "B", "A", "C", "A"])
+        for record in store.named("A"):
+            store.discard(record)
+
+        self.assertEqual(len(store), 2)
+        self.assertEqual(store.count("A"), 0)
+        self.assertEqual(store.column("label"), ("B", "C"))
+        self.assertEqual(store.index_of(store.first_named("C")), 1)
+
+    def test_discard_is_idempotent(self) -> None:
+        store = build_store(["A", "B"])
+        record = store[0]
+        store.discard(record)
+        store.discard(record)
+        self.assertEqual(len(store), 1)
+        self.assertEqual(store.column("base_name"), ("B",))
+
+    def test_columns_follow_mutations(self) -> None:
+        store = build_store(["A"])
+        self.assertEqual(store.column("label"), ("A",))
+        store.relabel(store[0], "A (1/3)")
+        store.append(ItemRecord("B", {}, "#000", "B"))
+        self.assertEqual(store.column("label"), ("A (1/3)", "B"))
+        self.assertEqual(store.column("color"), ("#fff", "#000"))
+
+
+if __name__ == "__main__":
+    unittest.main()
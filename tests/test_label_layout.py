@@ -0,0 +1,65 @@
+import math
+import unittest
+
+from headless_wheel import HeadlessCanvas
+from item_store import ItemRecord
+from label_layout import ELLIPSIS, LabelLayoutCache, available_width, estimate_text_width
+from tests.helpers import build_test_wheel
+
+FONT = ("Arial", 10, "bold")
+
+
+class LabelLayoutCacheTests(unittest.TestCase):
+    def test_fits_wraps_or_truncates(self) -> None:
+        cache = LabelLayoutCache(estimate_text_width)
+
+        self.assertEqual(cache.fit("Short", 60, FONT).text, "Short")
+        wrapped = cache.fit("Quick Breath", 60, FONT)
+        self.assertEqual((wrapped.text, wrapped.lines), ("Quick\nBreath", 2))
+        truncated = cache.fit("Supercalifragilistic", 60, FONT)
+        self.assertTrue(truncated.truncated)
+        self.assertTrue(truncated.text.endswith(ELLIPSIS))
+        self.assertLessEqual(truncated.width, 60)
+        self.assertEqual(cache.fit("Anything", 2, FONT).text, "")
+
+    def test_fits_and_widths_are_measured_once(self) -> None:
+        calls = []
+
+        def measure(text: str, font: tuple[str, int, str]) -> int:
+            calls.append(text)
+            return estimate_text_width(text, font)
+
+        cache = LabelLayoutCache(measure)
+        first = cache.fit("Red", 100.4, FONT)
+        self.assertIs(cache.fit("Red", 100.9, FONT), first)
+        self.assertEqual((cache.hits, cache.misses, calls), (1, 1, ["Red"]))
+
+    def test_available_width_is_the_chord_capped_by_the_rim(self) -> None:
+        self.assertAlmostEqual(available_width(60, 100, 200), 100 - 8)
+        self.assertAlmostEqual(available_width(360, 160, 200), 240 - 8)
+
+
+class WheelLabelGeometryTests(unittest.TestCase):
+    def test_rotated_anchors_match_per_label_trigonometry(self) -> None:
+        wheel = build_test_wheel("Red", {}, bps=60)
+        del wheel.draw_wheel
+        wheel.canvas = HeadlessCanvas()
+        wheel.engine.store.clear()
+        for name in ("Red", "Green", "Blue", "Yellow"):
+            wheel.engine.store.append(ItemRecord(name, {}, "#fff", name))
+        wheel.draw_wheel()
+        wheel.angle_offset = 117.0
+        wheel.draw_wheel()
+
+        for index, label_id in enumerate(wheel.label_ids):
+            angle = 90 - 45 + index * 90 + 45 + 117.0
+            x = 350 + 280 * 0.65 * math.cos(math.radians(angle))
+            y = 350 - 280 * 0.65 * math.sin(math.radians(angle))
+            actual_x, actual_y = wheel.canvas.item_coords[label_id]
+            self.assertAlmostEqual(actual_x, x)
+            self.assertAlmostEqual(actual_y, y)
+            self.assertAlmostEqual(wheel.canvas.item_options[label_id]["angle"], angle - 90)
+
+
+if __name__ == "__main__":
+    unittest.main()
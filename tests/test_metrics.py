@@ -0,0 +1,50 @@
+import json
+import unittest
+import urllib.request
+
+from metrics import MetricsRegistry, MetricsServer
+
+
+class MetricsRegistryTests(unittest.TestCase):
+    def test_counters_timers_and_sampled_gauges(self) -> None:
+        registry = MetricsRegistry()
+        depth = [3]
+        registry.gauge("queue_depth", lambda: depth[0])
+        registry.gauge("broken", lambda: 1 / 0)
+        draw = registry.timed("draw", lambda value: value * 2)
+
+        self.assertEqual(draw(4), 8)
+        draw(1)
+        registry.incr("spins")
+        registry.sample()
+        depth[0] = 9
+
+        snapshot = registry.snapshot()
+        self.assertEqual(snapshot["counters"], {"spins": 1})
+        self.assertEqual(snapshot["gauges"], {"queue_depth": 3.0})
+        self.assertEqual(snapshot["timers"]["draw"]["count"], 2)
+        text = registry.prometheus()
+        self.assertIn("wheel_spins_total 1\n", text)
+        self.assertIn("wheel_queue_depth 3\n", text)
+        self.assertIn("wheel_draw_seconds_count 2\n", text)
+
+    def test_server_exposes_text_and_json(self) -> None:
+        registry = MetricsRegistry()
+        registry.incr("spins", 5)
+        server = MetricsServer(registry, port=0)
+        server.start()
+        try:
+            base = f"http://127.0.0.1:{server.port}"
+            with urllib.request.urlopen(f"{base}/metrics", timeout=5) as response:
+                text = response.read().decode("utf-8")
+            with urllib.request.urlopen(f"{base}/metrics.json", timeout=5) as response:
+                payload = json.loads(response.read())
+        finally:
+            server.stop()
+
+        self.assertIn("wheel_spins_total 5", text)
+        self.assertEqual(payload["counters"]["spins"], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
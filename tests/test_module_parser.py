@@ -0,0 +1,83 @@
+import unittest
+
+from engine import WheelEngine
+from module_parser import interpret_modules, parse_item, split_item, split_item_lines
+
+
+class ModuleGrammarTests(unittest.TestCase):
+    def test_module_kinds(self) -> None:
+        modules = interpret_modules(
+            [
+                "Spawn 120 0",
+                "1 / 5",
+                "Cooldown 10",
+                "Max 3",
+                "+6",
+                "*0.75",
+                "> 120",
+                "<60",
+                "Pause Wheel 30",
+                "Pause Heartbeat 15",
+                "longbreath.wav",
+                "Fragile",
+                "Missing",
+                "Reset",
+                "Post Pause Reset",
+            ]
+        )
+
+        self.assertEqual(
+            modules,
+            {
+                "spawn_initial": 120,
+                "spawn_repeat": 0,
+                "special_target": 5,
+                "cooldown": 10,
+                "max": 3,
+                "bpm_boost": 6,
+                "bpm_multiplier": 0.75,
+                "bps_min": 120,
+                "bps_max": 60,
+                "pause_wheel": 30,
+                "pause_heartbeat": 15,
+                "sound_effect": "longbreath.wav",
+                "fragile": True,
+                "missing": True,
+                "reset_timer": True,
+                "post_pause_reset": True,
+            },
+        )
+
+    def test_seconds_suffix_selects_timer_bounds(self) -> None:
+        self.assertEqual(interpret_modules(["> 15s"]), {"timer_min_seconds": 15})
+        self.assertEqual(interpret_modules(["<90s"]), {"timer_max_seconds": 90})
+        self.assertEqual(interpret_modules(["> -5s"]), {})
+        self.assertEqual(interpret_modules(["> -5"]), {"bps_min": -5})
+
+    def test_split_keeps_base_name_spacing(self) -> None:
+        self.assertEqual(
+            split_item("Break is over (+30) ( <60 )"), ("Break is over", ["+30", "<60"])
+        )
+        self.assertEqual(split_item("(Fragile)"), ("(Fragile)", ["Fragile"]))
+
+    def test_unknown_modules_report_line_and_column(self) -> None:
+        items, positions = split_item_lines("Red (+1)\n\n  Blue (Sometimes) (Max 2)\n")
+        base_name, modules, diagnostics = parse_item(items[1], *positions[1])
+
+        self.assertEqual(positions, [(1, 0), (3, 2)])
+        self.assertEqual((base_name, modules), ("Blue", {"max": 2}))
+        self.assertEqual(
+            [str(diagnostic) for diagnostic in diagnostics],
+            ["line 3, column 8: unknown module 'Sometimes'"],
+        )
+
+    def test_engine_collects_warnings(self) -> None:
+        items, positions = split_item_lines("A (+1)\nB (huh)\n")
+        engine = WheelEngine(items, positions=positions)
+
+        self.assertIsNone(engine.config_error)
+        self.assertEqual(engine.config_warnings, ["line 2, column 3: unknown module 'huh'"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import pstats
+import tempfile
+import unittest
+from pathlib import Path
+
+from profiler import CallbackProfiler
+from tests.helpers import build_test_wheel
+
+
+class CallbackProfilerTests(unittest.TestCase):
+    def test_wrapped_callbacks_are_counted_per_name(self) -> None:
+        wheel = build_test_wheel("Red", {}, bps=60)
+        profiler = CallbackProfiler(window=2)
+        profiler.wrap(wheel, "draw_wheel", "pointer_index")
+        profiler.wrap(wheel.engine, "apply_bps_conditions", prefix="engine.")
+
+        for _ in range(3):
+            wheel.draw_wheel()
+        self.assertEqual(wheel.pointer_index(), 0)
+        wheel.engine.apply_bps_conditions()
+
+        summary = profiler.summary()
+        self.assertEqual(summary["draw_wheel"]["calls"], 3)
+        self.assertEqual(summary["pointer_index"]["calls"], 1)
+        self.assertEqual(summary["engine.apply_bps_conditions"]["calls"], 1)
+        self.assertLessEqual(summary["draw_wheel"]["p99_ms"], summary["draw_wheel"]["max_ms"])
+        self.assertIn("draw_wheel", profiler.format_table())
+
+    def test_cprofile_dump_is_readable_by_pstats(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "wheel.pstats"
+            profiler = CallbackProfiler(cprofile_path=path)
+            sum(range(1000))
+            report = profiler.finish()
+            stats = pstats.Stats(str(path))
+
+        self.assertIn("function calls", report)
+        self.assertGreater(stats.total_calls, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from scheduler import Scheduler
+
+
+def drain(scheduler: Scheduler, now: float) -> list[object]:
+    fired = []
+    while (handle := scheduler.pop_due(now)) is not None:
+        fired.append(handle.payload)
+    return fired
+
+
+class SchedulerTests(unittest.TestCase):
+    def test_fires_in_deadline_order_and_skips_cancelled(self) -> None:
+        scheduler = Scheduler()
+        scheduler.schedule_at(3.0, "spawn", "c")
+        first = scheduler.schedule_at(1.0, "cooldown", "a")
+        scheduler.schedule_at(2.0, "spawn", "b")
+        self.assertTrue(scheduler.cancel(first))
+        self.assertFalse(scheduler.cancel(first))
+
+        self.assertEqual(scheduler.next_deadline(), 2.0)
+        self.assertEqual([handle.payload for handle in scheduler.pending("spawn")], ["b", "c"])
+        self.assertEqual(drain(scheduler, 5.0), ["b", "c"])
+        self.assertEqual(len(scheduler), 0)
+        self.assertIsNone(scheduler.next_deadline())
+
+    def test_cancelled_entries_do_not_accumulate(self) -> None:
+        scheduler = Scheduler()
+        for step in range(1000):
+            scheduler.cancel(scheduler.schedule_at(float(step), "cooldown"))
+        scheduler.schedule_at(0.5, "spawn")
+        self.assertEqual(len(scheduler), 1)
+        self.assertLess(len(scheduler.heap), 40)
+        self.assertEqual(scheduler.count("cooldown"), 0)
+
+    def test_freeze_keeps_remaining_time_until_thawed(self) -> None:
+        scheduler = Scheduler()
+        spawn = scheduler.schedule_at(10.0, "spawn", "s")
+        scheduler.schedule_at(12.0, "wheel_pause", "p")
+
+        scheduler.freeze(4.0, "spawn")
+        self.assertEqual(scheduler.next_deadline(), 12.0)
+        self.assertEqual(drain(scheduler, 20.0), ["p"])
+        self.assertEqual(scheduler.count("spawn"), 1)
+
+        scheduler.thaw(20.0)
+        self.assertEqual(spawn.due, 26.0)
+        self.assertEqual(drain(scheduler, 25.9), [])
+        self.assertEqual(drain(scheduler, 26.0), ["s"])
+
+    def test_shift_moves_only_the_given_kinds(self) -> None:
+        scheduler = Scheduler()
+        scheduler.schedule_at(1.0, "spawn", "s")
+        scheduler.schedule_at(2.0, "cooldown", "c")
+        scheduler.shift(5.0, "spawn")
+        self.assertEqual(drain(scheduler, 10.0), ["c", "s"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import importlib.util
+import random
+import tempfile
+import unittest
+import wave
+from pathlib import Path
+
+from engine import WheelEngine
+from session_journal import SessionJournal
+from tests.helpers import play_session
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+if HAS_NUMPY:
+    import numpy as np
+
+    from session_audio import SessionAudioRenderer, render_headless, render_journal
+
+RATE = 8000
+
+
+def write_tone(path: Path, seconds: float, level: int) -> None:
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(RATE)
+        wav.writeframes(np.full(int(seconds * RATE), level, dtype="<i2").tobytes())
+
+
+def read_wav(path: Path) -> "np.ndarray":
+    with wave.open(str(path), "rb") as wav:
+        return np.frombuffer(wav.readframes(wav.getnframes()), dtype="<i2").reshape(-1, 2)
+
+
+@unittest.skipUnless(HAS_NUMPY, "NumPy is not installed")
+class SessionAudioTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        write_tone(self.dir / "Heartbeat.wav", 0.05, 1000)
+        write_tone(self.dir / "click.wav", 0.002, 2000)
+        write_tone(self.dir / "boom.wav", 0.1, 4000)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_heartbeat_follows_bpm_and_spins_click(self) -> None:
+        engine = WheelEngine(["A", "B", "C"], rng=random.Random(2), initial_bps=120)
+        output = self.dir / "out.wav"
+        renderer = SessionAudioRenderer(output, engine, [self.dir], sample_rate=RATE)
+        engine.start_spin(1.0)
+        renderer.finish(10.0)
+
+        audio = read_wav(output)
+        self.assertEqual(len(audio), 10 * RATE)
+        # Beats every half second from 0.5 s; clicks only during the spin.
+        self.assertEqual(renderer.mixer.beats_played, 19)
+        clicks = np.flatnonzero(audio[:, 0] > 1500)
+        self.assertGreater(renderer.clicks, 10)
+        self.assertGreaterEqual(clicks.min(), int(1.0 * RATE))
+        self.assertLessEqual(clicks.max(), int(6.0 * RATE) + 16)
+
+    def test_headless_run_plays_sound_effects(self) -> None:
+        output = self.dir / "headless.wav"
+        renderer = render_headless(
+            ["Boom (boom.wav)", "Quiet"], output, 60.0, seed=5, sound_dirs=[self.dir],
+            sample_rate=RATE, chunk_frames=1000,
+        )
+
+        self.assertGreater(renderer.effects, 0)
+        self.assertEqual(len(read_wav(output)), int(round(renderer.seconds * RATE)))
+        self.assertAlmostEqual(renderer.seconds, 60.0)
+        self.assertGreater(read_wav(output)[:, 0].max(), 3500)
+
+    def test_journal_renders_the_same_audio_as_the_live_session(self) -> None:
+        items = ["A (+30)", "B (*0.5) (Pause Heartbeat 5)", "C (boom.wav)"]
+        engine = WheelEngine(items, rng=random.Random(8))
+        journal = SessionJournal(self.dir / "session.wofj", engine)
+        live = SessionAudioRenderer(self.dir / "live.wav", engine, [self.dir], sample_rate=RATE)
+        play_session(engine, 20)
+        journal.close()
+        live.finish(engine.now + 2.0)
+
+        replayed = render_journal(
+            self.dir / "session.wofj", self.dir / "replay.wav", [self.dir], sample_rate=RATE
+        )
+
+        self.assertGreater(replayed.mixer.beats_played, 0)
+        self.assertEqual(
+            (replayed.clicks, replayed.effects, replayed.mixer.beats_played),
+            (live.clicks, live.effects, live.mixer.beats_played),
+        )
+        live_audio = read_wav(self.dir / "live.wav")
+        replay_audio = read_wav(self.dir / "replay.wav")
+        self.assertTrue(np.array_equal(live_audio, replay_audio[: len(live_audio)]))
+
+
+if __name__ == "__main__":
+    unittest.main()
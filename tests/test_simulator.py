@@ -0,0 +1,108 @@
+import importlib.util
+import random
+import statistics
+import unittest
+
+from engine import WheelEngine
+from simulator import END_REASONS, SessionSimulator
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+# Engine end messages by the simulator's END_REASONS name.
+END_MESSAGES = (
+    ("was chosen", "target"),
+    ("reached Max", "max"),
+    ("was destroyed", "fragile"),
+    ("is on cooldown", "cooldown"),
+)
+
+
+def end_reason(message: str) -> str:
+    for fragment, reason in END_MESSAGES:
+        if fragment in message:
+            return reason
+    return "empty"
+
+
+def run_engine_session(items: list[str], seed: int, max_spins: int = 200) -> tuple[int, str]:
+    engine = WheelEngine(items, rng=random.Random(seed))
+    now = 0.0
+    spins = 0
+    while spins < max_spins:
+        engine.advance(now)
+        started, _ = engine.start_spin(now)
+        if not started:
+            return spins, "stalled"
+        finish = now + 5.0
+        engine.advance(finish)
+        if not engine.items:
+            return spins, "stalled"
+        outcome = engine.finish_spin(engine.rng.randrange(len(engine.items)), finish)
+        spins += 1
+        if outcome["ended"]:
+            return spins, end_reason(str(outcome["message"]))
+        now = engine.wheel_pause_end_time if outcome["paused"] else finish + 0.3
+    return spins, "unfinished"
+
+
+@unittest.skipUnless(HAS_NUMPY, "NumPy is not installed")
+class SessionSimulatorTests(unittest.TestCase):
+    def test_special_target_ends_after_exact_spins(self) -> None:
+        report = SessionSimulator(["A (1/3)"], sessions=50, seed=1).run()
+
+        self.assertEqual(report["end_reasons"]["target"], 1.0)
+        self.assertEqual(report["spins"]["p50"], 3)
+        self.assertAlmostEqual(report["session_seconds"]["mean"], 15.6)
+
+    def test_max_and_bpm_effects(self) -> None:
+        report = SessionSimulator(["A (+10) (Max 2)"], sessions=20, seed=1).run()
+
+        self.assertEqual(report["end_reasons"]["max"], 1.0)
+        self.assertEqual(report["final_bpm"]["mean"], 80)
+
+    def test_fragile_and_cooldown_depletion(self) -> None:
+        fragile = SessionSimulator(["A (Fragile)", "B (Fragile)"], sessions=20, seed=1).run()
+        cooldown = SessionSimulator(["A (Cooldown 10)"], sessions=20, seed=1).run()
+
+        self.assertEqual(fragile["end_reasons"]["fragile"], 1.0)
+        self.assertEqual(fragile["spins"]["mean"], 2)
+        self.assertEqual(cooldown["end_reasons"]["cooldown"], 1.0)
+        self.assertEqual(cooldown["spins"]["mean"], 1)
+
+    def test_multiplier_items_scale_the_next_bpm_effect(self) -> None:
+        report = SessionSimulator(["2x (Max 1)", "Up (+10) (Max 1)"], sessions=400, seed=3).run()
+
+        # Up either lands first (+10) or after the doubler (+20).
+        self.assertEqual(report["final_bpm"]["p5"], 70)
+        self.assertEqual(report["final_bpm"]["p95"], 80)
+
+    def test_matches_engine_sessions(self) -> None:
+        items = [
+            "Red (+20) (Max 3)",
+            "Blue (*0.5) (Cooldown 12)",
+            "Gold (1/2) (> 90)",
+            "Seed (Missing) (Spawn 8 8) (Fragile)",
+        ]
+        simulated = SessionSimulator(items, sessions=4000, seed=5, max_spins=200).run()
+        engine_runs = [run_engine_session(items, seed) for seed in range(800)]
+        engine_spins = [spins for spins, _ in engine_runs]
+
+        self.assertAlmostEqual(
+            simulated["spins"]["mean"],
+            statistics.mean(engine_spins),
+            delta=0.1 * statistics.mean(engine_spins),
+        )
+        # A wrong rule can keep the mean close; how sessions end cannot.
+        reasons = [reason for _, reason in engine_runs]
+        for reason in END_REASONS:
+            self.assertAlmostEqual(
+                simulated["end_reasons"][reason],
+                reasons.count(reason) / len(reasons),
+                delta=0.05,
+                msg=reason,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import threading
+import unittest
+
+from sound_cache import SoundCache
+
+
+class FakeSound:
+    def __init__(self, size: int) -> None:
+        self.audio_data = b"\0" * size
+
+
+class SoundCacheTests(unittest.TestCase):
+    def test_hits_misses_and_missing_files_are_cached(self) -> None:
+        calls = []
+
+        def loader(filename: str) -> FakeSound | None:
+            calls.append(filename)
+            return None if filename == "missing.wav" else FakeSound(10)
+
+        cache = SoundCache(loader)
+        first = cache.get("a.wav")
+        self.assertIs(cache.get("a.wav"), first)
+        self.assertIsNone(cache.get("missing.wav"))
+        self.assertIsNone(cache.get("missing.wav"))
+
+        self.assertEqual(calls, ["a.wav", "missing.wav"])
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["decodes"]), (2, 2, 2))
+        self.assertEqual(stats["used_bytes"], 10)
+
+    def test_failed_decode_is_cached_as_missing(self) -> None:
+        calls = []
+
+        def loader(filename: str) -> FakeSound | None:
+            calls.append(filename)
+            raise ValueError("corrupt header")
+
+        cache = SoundCache(loader)
+        cache.preload(["bad.wav"])[0].result()
+
+        self.assertIsNone(cache.get("bad.wav"))
+        self.assertIsNone(cache.get("bad.wav"))
+        self.assertEqual(calls, ["bad.wav"])
+        self.assertEqual(cache.pending, {})
+        cache.shutdown()
+
+    def test_evicts_least_recently_used_over_budget(self) -> None:
+        cache = SoundCache(lambda filename: FakeSound(40), budget_bytes=130)
+        for name in ("a", "b", "c"):
+            cache.get(name)
+        cache.get("a")
+        cache.get("d")
+
+        self.assertNotIn("b", cache)
+        self.assertIn("a", cache)
+        self.assertEqual(cache.used_bytes, 120)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_preload_decodes_in_background_once(self) -> None:
+        release = threading.Event()
+        threads = []
+
+        def loader(filename: str) -> FakeSound:
+            release.wait(timeout=5)
+            threads.append(threading.current_thread().name)
+            return FakeSound(1)
+
+        cache = SoundCache(loader)
+        futures = cache.preload(["a.wav", "b.wav", "a.wav"])
+        self.assertEqual(len(futures), 2)
+        self.assertEqual(cache.preload(["a.wav"]), [])
+        release.set()
+        sound = cache.get("a.wav")
+        for future in futures:
+            future.result(timeout=5)
+        cache.shutdown()
+
+        self.assertIsInstance(sound, FakeSound)
+        self.assertEqual(cache.decodes, 2)
+        self.assertTrue(all(name.startswith("sound-preload") for name in threads))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import csv
+import io
+import json
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from spin_log import SpinLogger
+
+
+class BlockedStream(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = threading.Event()
+
+    def write(self, text: str) -> int:
+        self.release.wait(timeout=5)
+        return super().write(text)
+
+
+class SpinLoggerTests(unittest.TestCase):
+    def test_writes_jsonl_and_console_lines(self) -> None:
+        stream = io.StringIO()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "spins.jsonl"
+            logger = SpinLogger(path, stream=stream)
+            logger.log("Red", "Timer: 00:05", "BPM: 60")
+            logger.log("Blue", "Timer: 00:10", "BPM: 66")
+            self.assertTrue(logger.flush(timeout=5))
+            logger.close()
+            records = [json.loads(line) for line in path.read_text().splitlines()]
+
+        self.assertEqual([record["selection"] for record in records], ["Red", "Blue"])
+        self.assertEqual(records[1]["bpm"], "BPM: 66")
+        self.assertIn("1. Selected: Red\n2. Timer: 00:05\n3. BPM: 60\n", stream.getvalue())
+
+    def test_rotates_csv_by_size(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "spins.csv"
+            logger = SpinLogger(path, stream=None, max_bytes=200, backups=2, batch_size=1)
+            for index in range(12):
+                logger.log(f"Item {index}", "Timer: 00:01", "BPM: 60")
+            logger.close()
+            files = sorted(child.name for child in Path(tmp).iterdir())
+            with path.open(newline="") as handle:
+                rows = list(csv.DictReader(handle))
+
+        self.assertEqual(files, ["spins.csv", "spins.csv.1", "spins.csv.2"])
+        self.assertGreater(logger.stats()["rotations"], 2)
+        self.assertEqual(rows[-1]["selection"], "Item 11")
+
+    def test_full_queue_drops_instead_of_blocking(self) -> None:
+        for overflow, kept in (("drop_oldest", "Item 9"), ("drop_newest", "Item 2")):
+            stream = BlockedStream()
+            logger = SpinLogger(stream=stream, queue_size=2, overflow=overflow)
+            logger.log("Item 0", "", "")
+            deadline = time.monotonic() + 5
+            while logger.stats()["queued"] and time.monotonic() < deadline:
+                time.sleep(0.001)
+
+            start = time.perf_counter()
+            for index in range(1, 10):
+                logger.log(f"Item {index}", "", "")
+            self.assertLess(time.perf_counter() - start, 0.5)
+            stream.release.set()
+            logger.close()
+
+            self.assertEqual(logger.stats()["dropped"], 7)
+            self.assertIn(kept, stream.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
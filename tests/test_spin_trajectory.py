@@ -0,0 +1,48 @@
+import random
+import unittest
+
+from engine import WheelEngine
+from spin_trajectory import SpinTrajectory, pointer_index
+
+
+class SpinTrajectoryTests(unittest.TestCase):
+    def test_noise_free_curve_matches_coast_then_linear_slowdown(self) -> None:
+        trajectory = SpinTrajectory(10.0, 1800.0)
+
+        self.assertAlmostEqual(trajectory.angle_at(1.0), 1810.0 % 360)
+        self.assertAlmostEqual(trajectory.angle_at(3.0), (10.0 + 5400.0 - 300.0) % 360)
+        self.assertAlmostEqual(trajectory.final_angle, 190.0)
+        self.assertEqual(trajectory.angle_at(9.0), trajectory.final_angle)
+
+    def test_noise_is_continuous_across_segments(self) -> None:
+        trajectory = SpinTrajectory.generate(random.Random(3))
+        step = trajectory.noise_step
+        for segment in (1, 120, 250):
+            edge = segment * step
+            before = trajectory.angle_at(edge - 1e-9)
+            after = trajectory.angle_at(edge + 1e-9)
+            self.assertAlmostEqual((after - before + 180) % 360 - 180, 0.0, places=4)
+
+    def test_same_seed_gives_same_winner(self) -> None:
+        first = SpinTrajectory.generate(random.Random(42), 30.0)
+        second = SpinTrajectory.generate(random.Random(42), 30.0)
+
+        self.assertEqual(first.final_angle, second.final_angle)
+        self.assertEqual(first.winning_index(7), pointer_index(first.final_angle, 7))
+
+    def test_headless_spin_lands_on_the_precomputed_winner(self) -> None:
+        engine = WheelEngine(["A", "B", "C", "D"], rng=random.Random(5))
+        started, _ = engine.start_spin(0.0)
+        self.assertTrue(started)
+        trajectory = engine.trajectory
+        expected = engine.items[trajectory.winning_index(len(engine.items))]
+
+        outcome = engine.finish_spin(trajectory.winning_index(len(engine.items)), 5.0)
+
+        self.assertIn(expected, str(outcome["message"]))
+        self.assertEqual(engine.wheel_angle, trajectory.final_angle)
+        self.assertIsNone(engine.trajectory)
+
+
+if __name__ == "__main__":
+    unittest.main()
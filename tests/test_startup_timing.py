@@ -0,0 +1,19 @@
+import unittest
+
+from startup_timing import StartupTimeline
+
+
+class StartupTimelineTests(unittest.TestCase):
+    def test_phases_add_up_to_total(self) -> None:
+        timeline = StartupTimeline()
+        timeline.mark("window")
+        timeline.mark("engine")
+
+        self.assertEqual([phase for phase, _ in timeline.phases], ["window", "engine"])
+        total = sum(seconds for _, seconds in timeline.phases)
+        self.assertAlmostEqual(total, timeline.last - timeline.started)
+        self.assertEqual(timeline.format().splitlines()[-1].split()[0], "total")
+
+
+if __name__ == "__main__":
+    unittest.main()
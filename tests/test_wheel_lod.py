@@ -0,0 +1,93 @@
+import unittest
+
+from headless_wheel import HeadlessCanvas
+from item_store import ItemRecord
+from tests.helpers import build_test_wheel
+from wheel_lod import (
+    DETAIL_NO_OUTLINES,
+    DETAIL_NO_SPIN_LABELS,
+    MAX_ARCS,
+    MIN_LABEL_DEGREES,
+    SETTLE_FRAMES,
+    DetailController,
+    plan_wheel,
+)
+
+
+class PlanWheelTests(unittest.TestCase):
+    def test_small_wheels_keep_every_sector_and_label(self) -> None:
+        layout = plan_wheel(["A", "B", "C"], ["#f00", "#0f0", "#00f"])
+
+        self.assertEqual(
+            layout.arcs, [(0.0, 120.0, "#f00"), (120.0, 120.0, "#0f0"), (240.0, 120.0, "#00f")]
+        )
+        self.assertEqual([text for _, _, text in layout.labels], ["A", "B", "C"])
+        self.assertTrue(layout.outlines)
+
+    def test_huge_wheels_stay_bounded(self) -> None:
+        colors = ["#f00", "#0f0", "#00f"]
+        labels = [f"Item {index}" for index in range(100_000)]
+        layout = plan_wheel(labels, [colors[index % 3] for index in range(100_000)])
+
+        self.assertLessEqual(len(layout.arcs), MAX_ARCS)
+        self.assertAlmostEqual(sum(extent for _, extent, _ in layout.arcs), 360.0)
+        self.assertEqual(layout.labels, [])
+        self.assertFalse(layout.outlines)
+
+    def test_same_colored_runs_share_an_arc_and_a_label(self) -> None:
+        labels = ["Spawn"] * 300 + [f"Item {index}" for index in range(300)]
+        colors = ["#f00"] * 300 + ["#0f0", "#00f"] * 150
+        layout = plan_wheel(labels, colors)
+
+        self.assertEqual(layout.arcs[0], (0.0, 180.0, "#f00"))
+        self.assertEqual(layout.labels, [(90.0, 180.0, "Spawn")])
+        self.assertGreaterEqual(180.0, MIN_LABEL_DEGREES)
+
+    def test_level_two_drops_labels_only_when_asked(self) -> None:
+        layout = plan_wheel(["A", "B"], ["#f00", "#0f0"], DETAIL_NO_SPIN_LABELS, show_labels=False)
+
+        self.assertEqual(len(layout.arcs), 2)
+        self.assertEqual(layout.labels, [])
+        self.assertFalse(layout.outlines)
+
+
+class DetailControllerTests(unittest.TestCase):
+    def test_slow_frames_lower_detail_and_fast_frames_restore_it(self) -> None:
+        controller = DetailController(budget=0.008)
+        changes = [controller.observe(0.020) for _ in range(2 * SETTLE_FRAMES)]
+        self.assertEqual(changes.count(True), 2)
+        self.assertEqual(controller.level, DETAIL_NO_SPIN_LABELS)
+
+        for _ in range(SETTLE_FRAMES):
+            controller.observe(0.0001)
+        self.assertEqual(controller.level, DETAIL_NO_OUTLINES)
+
+
+class WheelLodRenderingTests(unittest.TestCase):
+    def test_labels_are_hidden_while_spinning_at_lowest_detail(self) -> None:
+        wheel = build_test_wheel("Red", {}, bps=60)
+        del wheel.draw_wheel
+        wheel.canvas = HeadlessCanvas()
+        wheel.engine.store.clear()
+        for index in range(2000):
+            color = "#f00" if index % 2 else "#0f0"
+            wheel.engine.store.append(ItemRecord(f"Item {index}", {}, color, f"Item {index}"))
+
+        wheel.draw_wheel()
+        self.assertLessEqual(len(wheel.canvas.created), MAX_ARCS + 1)
+        self.assertEqual(wheel.label_ids, [])
+
+        wheel.engine.store.clear()
+        for name in ("Red", "Green"):
+            wheel.engine.store.append(ItemRecord(name, {}, "#fff", name))
+        wheel.detail.change_level(DETAIL_NO_SPIN_LABELS)
+        wheel.engine.spinning = True
+        wheel.draw_wheel()
+        self.assertEqual(wheel.label_ids, [])
+        wheel.engine.spinning = False
+        wheel.draw_wheel()
+        self.assertEqual(len(wheel.label_ids), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
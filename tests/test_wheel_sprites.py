@@ -0,0 +1,87 @@
+import unittest
+
+from spin_trajectory import pointer_index
+from tests.helpers import build_test_wheel
+from wheel_sprites import Image, SpriteCache, WheelSpriteRenderer
+
+
+class SpriteCacheTests(unittest.TestCase):
+    def test_evicts_least_recently_used_over_budget(self) -> None:
+        cache = SpriteCache(budget_bytes=30)
+        cache.get("a", lambda: ("A", 10))
+        cache.get("b", lambda: ("B", 10))
+        cache.get("c", lambda: ("C", 10))
+        cache.get("a", lambda: ("A2", 10))
+        cache.get("d", lambda: ("D", 10))
+
+        self.assertNotIn("b", cache)
+        self.assertIn("a", cache)
+        self.assertEqual(cache.used_bytes, 30)
+        self.assertEqual((cache.hits, cache.misses, cache.evictions), (1, 4, 1))
+
+    def test_keeps_single_entry_larger_than_budget(self) -> None:
+        cache = SpriteCache(budget_bytes=5)
+        cache.get("a", lambda: ("A", 10))
+        cache.get("b", lambda: ("B", 10))
+
+        self.assertEqual(list(cache.entries), ["b"])
+        self.assertEqual(cache.used_bytes, 10)
+
+
+@unittest.skipIf(Image is None, "Pillow is not installed")
+class WheelSpriteRendererTests(unittest.TestCase):
+    def test_angle_buckets_wrap(self) -> None:
+        renderer = WheelSpriteRenderer(radius=50, angle_step=3.0)
+        self.assertEqual(renderer.angle_bucket(0.0), 0)
+        self.assertEqual(renderer.angle_bucket(4.4), 1)
+        self.assertEqual(renderer.angle_bucket(359.0), 0)
+        self.assertEqual(renderer.angle_bucket(-3.0), 119)
+
+    def test_rasterize_paints_sector_colors(self) -> None:
+        renderer = WheelSpriteRenderer(radius=50)
+        image, size = renderer.rasterize((("A", "B"), ("#ff0000", "#0000ff"), False))
+
+        self.assertEqual(size, image.width * image.height * 4)
+        center = image.width // 2
+        self.assertEqual(image.getpixel((center, center - 45))[:3], (255, 0, 0))
+        self.assertEqual(image.getpixel((center, center + 45))[:3], (0, 0, 255))
+
+    def test_winner_is_the_sector_shown_by_the_final_frame(self) -> None:
+        wheel = build_test_wheel("I0", {}, bps=60)
+        for number in range(1, 60):
+            wheel.engine.add_item_with_modules(f"I{number}", {}, color="#fff")
+        wheel.sprite_renderer = WheelSpriteRenderer(radius=50, angle_step=3.0)
+        winners = []
+        wheel.engine.subscribe(
+            lambda event, payload: winners.append(payload["index"])
+            if event == "spin_finished"
+            else None
+        )
+        wheel.engine.start_spin(0.0)
+        # 4° rests in sector 59, but the frame drawn for it is the 3° one.
+        wheel.angle_offset = 4.0
+        self.assertEqual(pointer_index(4.0, 60), 59)
+
+        wheel.finish_spin()
+
+        shown = wheel.sprite_renderer.angle_bucket(4.0) * wheel.sprite_renderer.angle_step
+        self.assertEqual(winners, [pointer_index(shown, 60)])
+        self.assertEqual(winners, [0])
+
+    def test_next_spin_starts_from_the_frame_on_screen(self) -> None:
+        wheel = build_test_wheel("A", {}, bps=60)
+        wheel.engine.add_item_with_modules("B", {}, color="#fff")
+        wheel.sprite_renderer = WheelSpriteRenderer(radius=50, angle_step=3.0)
+        wheel.engine.start_spin(0.0)
+        wheel.angle_offset = wheel.engine.trajectory.final_angle + 1.0
+
+        wheel.finish_spin()
+
+        self.assertEqual(wheel.engine.wheel_angle, wheel.angle_offset)
+        self.assertEqual(wheel.angle_offset % 3.0, 0.0)
+        wheel.engine.start_spin(10.0)
+        self.assertEqual(wheel.engine.trajectory.start_angle, wheel.angle_offset)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,36 +1,88 @@
-import copy
-import importlib
-import importlib.util
+import argparse
 import math
 import queue
 import random
-import re
 import threading
 import time
 import tkinter as tk
 from pathlib import Path
 from tkinter import filedialog, messagebox
-
-if importlib.util.find_spec("simpleaudio") is not None:  # pragma: no cover - optional dependency
-    import simpleaudio  # type: ignore
-else:  # pragma: no cover - fallback for environments without simpleaudio
-    simpleaudio = None  # type: ignore
-
-if importlib.util.find_spec("winsound") is not None:  # pragma: no cover - optional dependency
-    import winsound  # type: ignore
-else:  # pragma: no cover - fallback for non-Windows platforms
-    winsound = None  # type: ignore
-
-if importlib.util.find_spec("pygame") is not None:  # pragma: no cover - optional dependency
-    pygame = importlib.import_module("pygame")
-    pygame.mixer.init()
-else:  # pragma: no cover - fallback when pygame is unavailable
-    pygame = None  # type: ignore
+from tkinter import font as tkfont
+from typing import TYPE_CHECKING
+
+from audio_backends import AUDIO_BACKENDS, AudioBackend
+from config_cache import CompiledConfig, load_or_compile
+from engine import WheelEngine
+from frame_pacer import DEFAULT_FPS, FramePacer
+from heartbeat_stats import HeartbeatRecorder
+from label_layout import LabelFont, LabelLayoutCache, available_width
+from module_parser import split_item_lines
+from session_journal import SessionJournal
+from sound_cache import SoundCache
+from spin_log import SpinLogger
+from spin_trajectory import SpinTrajectory, pointer_index
+from startup_timing import StartupTimeline
+from wheel_lod import (
+    DETAIL_FULL,
+    DETAIL_NO_SPIN_LABELS,
+    DetailController,
+    WheelLayout,
+    plan_full_wheel,
+    plan_wheel,
+)
+from wheel_sprites import WheelSpriteRenderer, sprites_available
+
+# The mixer (NumPy), metrics (http.server) and profiler (cProfile) modules are
+# imported where they are first used, so a plain start does not load them.
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from audio_mixer import HeartbeatBank, Mixer
+    from metrics import MetricsRegistry, MetricsServer
+    from profiler import CallbackProfiler
+
+LABEL_FONT: LabelFont = ("Arial", 14, "bold")
+# Label distance from the center as a fraction of the radius.
+LABEL_RADIUS = 0.65
+
+# Entry points timed by --profile: Tk callbacks and the engine work they trigger.
+PROFILED_CALLBACKS = (
+    "update_spin",
+    "draw_wheel",
+    "finish_spin",
+    "flush_redraw",
+    "poll_heartbeat_queue",
+    "update_timer_label",
+    "engine_timer_tick",
+)
+PROFILED_ENGINE_CALLS = ("apply_bps_conditions", "refresh_eligibility", "advance")
 
 
 class WheelOfFortune:
-    def __init__(self, root: tk.Tk) -> None:
+    def __init__(
+        self,
+        root: tk.Tk,
+        render_mode: str = "vector",
+        heartbeat_log: Path | None = None,
+        fps: float = DEFAULT_FPS,
+        seed: int | None = None,
+        journal: Path | None = None,
+        spin_log: Path | None = None,
+        metrics_port: int | None = None,
+        profile: bool = False,
+        profile_dump: Path | None = None,
+        lod: bool = True,
+        audio_backend: str = "auto",
+        verbose: bool = False,
+    ) -> None:
+        self.startup = StartupTimeline()
+        # Sound backends load on a worker while the window and file dialog come up.
+        self.audio = AudioBackend(audio_backend)
+        self.audio.start_background()
         self.root = root
+        self.profiler: "CallbackProfiler | None" = None
+        if profile or profile_dump is not None:
+            from profiler import CallbackProfiler
+
+            self.profiler = CallbackProfiler(cprofile_path=profile_dump)
         self.root.title("Wheel of Fortune")
 
         self.canvas_size = 700
@@ -110,65 +162,95 @@ class WheelOfFortune:
 
         self.auto_spin_job: str | None = None
         self.heartbeat_poll_job: str | None = None
-        self.heartbeat_queue: queue.SimpleQueue[float] = queue.SimpleQueue()
+        # (scheduled, enqueued) perf_counter times per beat from the worker.
+        self.heartbeat_queue: queue.SimpleQueue[tuple[float, float]] = queue.SimpleQueue()
         self.heartbeat_stop_event = threading.Event()
         self.heartbeat_thread: threading.Thread | None = None
 
         self.config_dir = Path(__file__).parent
-        self.items = self.prompt_for_items()
-        if not self.items:
+        self.startup.mark("window")
+        compiled = self.prompt_for_config()
+        self.startup.mark("config dialog")
+        if compiled is None:
             self.root.destroy()
             return
 
-        self.colors = self.generate_colors(len(self.items))
-        self.original_items = list(self.items)
+        self.engine = WheelEngine.from_compiled(
+            compiled, now=time.perf_counter(), rng=random.Random(seed)
+        )
+        if self.engine.config_error is not None:
+            messagebox.showerror("Error", self.engine.config_error)
+            self.root.destroy()
+            return
+        if self.engine.config_warnings:
+            messagebox.showwarning(
+                "Unknown modules",
+                "These modules were ignored:\n" + "\n".join(self.engine.config_warnings),
+            )
+        self.engine.subscribe(self.handle_engine_event)
+        self.journal = SessionJournal(journal, self.engine) if journal is not None else None
+        self.spin_logger = SpinLogger(spin_log)
+
         self.angle_offset = 0.0
-        self.spinning = False
-        self.pending_multiplier = 1
-        self.wheel_pause_active = False
-        self.wheel_pause_end_time = 0.0
         self.wheel_pause_job: str | None = None
-        self.heartbeat_pause_active = False
-        self.heartbeat_pause_end_time = 0.0
         self.heartbeat_pause_job: str | None = None
-        self.post_pause_reset_pending = False
+        self.engine_timer_job: str | None = None
         self.timer_job: str | None = None
-        self.session_start_time: float | None = None
-        self.jitter = 0.02
-        self.initial_speed = 0.0
-        self.deceleration = 0.0
-        self.spin_start = 0.0
-        self.first_spin_time: float | None = None
-        self.last_update = 0.0
+        self.trajectory: SpinTrajectory | None = None
+        self.spin_elapsed = 0.0
+        self.frame_pacer = FramePacer(fps)
         self.last_pointer_index = 0
-        self.sound_cache: dict[str, object | None] = {}
+        self.scene_signature: tuple[object, tuple[int, bool]] | None = None
+        self.wheel_layout: WheelLayout | None = None
+        # (x, y, angle) per label at rest, relative to the wheel center.
+        self.label_anchors: list[tuple[float, float, float]] = []
+        self.label_fonts: dict[LabelFont, tkfont.Font] = {}
+        self.label_cache = LabelLayoutCache(self.measure_label)
+        # Level of detail for big wheels and slow machines; None draws everything.
+        self.detail: DetailController | None = (
+            DetailController(self.frame_pacer.frame_interval / 2) if lod else None
+        )
+        self.segment_ids: list[int] = []
+        self.label_ids: list[int] = []
+        self.pointer_id: int | None = None
+        if render_mode == "sprite" and not sprites_available():
+            render_mode = "vector"
+        self.render_mode = render_mode
+        self.sprite_renderer: WheelSpriteRenderer | None = (
+            WheelSpriteRenderer(self.radius) if render_mode == "sprite" else None
+        )
+        self.sprite_image_id: int | None = None
+        self.startup.mark("engine")
+        # One callback-driven output stream when NumPy and sounddevice are
+        # installed; otherwise sounds go through pygame/simpleaudio/winsound.
+        self.audio.ensure()
+        self.startup.mark("audio wait")
+        self.mixer: "Mixer | None" = self.audio.mixer
+        self.audio_sink = self.audio.sink
+        self.sound_cache = SoundCache(self.load_sound_file)
+        self.heartbeat_log = heartbeat_log
+        self.heartbeat_recorder = HeartbeatRecorder() if heartbeat_log is not None else None
+        if self.mixer is not None and self.heartbeat_recorder is not None:
+            self.mixer.beat_listener = self.heartbeat_recorder.record
+        self.redraw_pending = False
+        self.redraw_job: str | None = None
         self.click_sound = self.load_click_sound()
         self.heartbeat_sound = self.load_heartbeat_sound()
-
-        self.spawn_configs: list[dict[str, int | str]] = []
-        self.spawn_jobs: list[str] = []
-        self.spawn_started = False
-
-        self.cooldown_jobs: list[str] = []
-
-        self.base_names: list[str] = []
-        self.item_modules: list[dict[str, int | bool | float | str]] = []
-        self.hidden_items: list[dict[str, str | dict[str, int | bool | float | str] | None]] = []
-
-        self.initial_bps = 60
-        self.bps = self.initial_bps
-        self.special_targets_by_name: dict[str, int] = {}
-        self.special_counts_by_name: dict[str, int] = {}
-        self.max_targets_by_name: dict[str, int] = {}
-        self.max_counts_by_name: dict[str, int] = {}
-        self.max_blocked_names: set[str] = set()
-        self.game_over = False
-        self.has_invalid_config = False
-
-        self.parse_items_and_modules()
-        if self.has_invalid_config:
-            self.root.destroy()
-            return
+        self.heartbeat_bank: "HeartbeatBank | None" = None
+        if self.mixer is not None and self.heartbeat_sound is not None:
+            from audio_mixer import HeartbeatBank
+
+            self.heartbeat_bank = HeartbeatBank(self.heartbeat_sound)
+        self.sound_cache.preload(self.preload_sound_names())
+        self.startup.mark("sounds")
+        self.metrics: "MetricsRegistry | None" = None
+        self.metrics_server: "MetricsServer | None" = None
+        self.metrics_job: str | None = None
+        if metrics_port is not None:
+            self.install_metrics(metrics_port)
+        if self.profiler is not None:
+            self.profiler.wrap(self, *PROFILED_CALLBACKS)
+            self.profiler.wrap(self.engine, *PROFILED_ENGINE_CALLS, prefix="engine.")
 
         self.update_bpm_display()
 
@@ -176,366 +258,69 @@ class WheelOfFortune:
         self.last_pointer_index = self.pointer_index()
         self.schedule_heartbeat()
         self.apply_theme()
+        self.startup.mark("first draw")
+        if verbose:
+            self.print_startup()
+
+    def print_startup(self) -> None:
+        print(self.startup.format())
+        tried = ", ".join(
+            f"{name} {seconds * 1000:.1f} ms" for name, seconds in self.audio.timings.items()
+        )
+        print(f"audio backend: {self.audio.name} (background init: {tried or 'nothing tried'})")
+
+    def install_metrics(self, port: int) -> None:
+        # Only called when metrics are enabled, so disabled runs pay nothing.
+        from metrics import MetricsRegistry, MetricsServer
+
+        metrics = self.metrics = MetricsRegistry()
+        self.draw_wheel = metrics.timed("draw_wheel", self.draw_wheel)
+        self.engine.subscribe(
+            lambda event, payload: metrics.incr("spins") if event == "spin_finished" else None
+        )
+        metrics.gauge("pending_after_jobs", self.pending_after_jobs)
+        metrics.gauge("heartbeat_queue_depth", self.heartbeat_queue.qsize)
+        metrics.gauge("sound_cache_entries", lambda: len(self.sound_cache))
+        metrics.gauge("sound_cache_bytes", lambda: self.sound_cache.used_bytes)
+        metrics.gauge("visible_items", lambda: len(self.engine.store))
+        metrics.gauge("hidden_items", lambda: len(self.engine.hidden))
+        metrics.gauge("pending_engine_timers", lambda: len(self.engine.scheduler))
+        metrics.gauge("dropped_frames", lambda: self.frame_pacer.dropped_frames)
+        self.metrics_server = MetricsServer(metrics, port)
+        self.metrics_server.start()
+        self.sample_metrics()
+
+    def pending_after_jobs(self) -> int:
+        return len(self.root.tk.splitlist(self.root.tk.call("after", "info")))
+
+    def sample_metrics(self) -> None:
+        self.metrics_job = None
+        if self.metrics is None:
+            return
+        self.metrics.sample()
+        self.metrics_job = self.root.after(1000, self.sample_metrics)
 
-    def prompt_for_items(self) -> list[str]:
+    def prompt_for_config(self) -> CompiledConfig | None:
         path = filedialog.askopenfilename(
             title="Select a text file",
             filetypes=[("Text Files", "*.txt"), ("All Files", "*.*")],
         )
         if not path:
-            return []
+            return None
 
         try:
-            lines = Path(path).read_text(encoding="utf-8").splitlines()
+            text = Path(path).read_text(encoding="utf-8")
         except OSError as exc:
             messagebox.showerror("Error", f"Unable to read file: {exc}")
-            return []
+            return None
 
         self.config_dir = Path(path).parent
 
-        items = [line.strip() for line in lines if line.strip()]
+        items, positions = split_item_lines(text)
         if not items:
             messagebox.showerror("Error", "The selected file is empty.")
-            return []
-        return items
-
-    @staticmethod
-    def generate_colors(count: int) -> list[str]:
-        palette = [
-            "#FF6B6B",
-            "#4ECDC4",
-            "#FFD93D",
-            "#1A535C",
-            "#FF9F1C",
-            "#9B5DE5",
-            "#00BBF9",
-            "#F15BB5",
-        ]
-        colors = []
-        for idx in range(count):
-            colors.append(palette[idx % len(palette)])
-        return colors
-
-    def parse_items_and_modules(self) -> None:
-        self.base_names.clear()
-        self.item_modules.clear()
-        self.spawn_configs.clear()
-        self.special_targets_by_name.clear()
-        self.special_counts_by_name.clear()
-        self.max_targets_by_name.clear()
-        self.max_counts_by_name.clear()
-        self.max_blocked_names.clear()
-        seen_modules: dict[str, dict[str, int | bool | float | str]] = {}
-
-        parsed_items: list[str] = []
-
-        parsed_entries: list[tuple[str, dict[str, int | bool | float | str], bool]] = []
-        non_missing_count = 0
-        for raw_item in self.items:
-            base_name, module_texts = self.extract_base_and_modules(raw_item)
-            modules = self.interpret_modules(module_texts)
-            if base_name in seen_modules and seen_modules[base_name] != modules:
-                messagebox.showerror(
-                    "Error",
-                    (
-                        "Conflicting modules found for choice "
-                        f"'{base_name}'. All occurrences must use the same modules."
-                    ),
-                )
-                self.has_invalid_config = True
-                return
-
-            seen_modules[base_name] = copy.deepcopy(modules)
-            is_missing = bool(modules.get("missing"))
-            parsed_entries.append((base_name, modules, is_missing))
-            if not is_missing:
-                non_missing_count += 1
-
-        self.colors = self.generate_colors(non_missing_count)
-
-        self.hidden_items.clear()
-
-        color_idx = 0
-        for base_name, modules, is_missing in parsed_entries:
-            color = self.colors[color_idx] if not is_missing else None
-
-            if not is_missing:
-                current_index = len(parsed_items)
-                self.register_modules(current_index, base_name, modules, color)
-                self.base_names.append(base_name)
-                self.item_modules.append(modules)
-                parsed_items.append(self.format_item_label(current_index))
-                color_idx += 1
-            else:
-                self.register_modules(None, base_name, modules, color)
-
-        self.items = parsed_items
-        self.apply_bps_conditions()
-
-    @staticmethod
-    def extract_base_and_modules(item: str) -> tuple[str, list[str]]:
-        module_matches = re.findall(r"\([^)]*\)", item)
-        base_name = re.sub(r"\([^)]*\)", "", item).strip()
-        module_texts = [match.strip("() ") for match in module_matches]
-        return base_name or item.strip(), module_texts
-
-    def interpret_modules(self, module_texts: list[str]) -> dict[str, int | bool | float | str]:
-        modules: dict[str, int | bool | float | str] = {}
-        for module_text in module_texts:
-            lower = module_text.lower()
-
-            spawn_match = re.fullmatch(r"spawn\s+(\d+)\s+(\d+)", lower)
-            if spawn_match:
-                modules["spawn_initial"] = int(spawn_match.group(1))
-                modules["spawn_repeat"] = int(spawn_match.group(2))
-                continue
-
-            target_match = re.fullmatch(r"1\s*/\s*(\d+)", lower)
-            if target_match:
-                modules["special_target"] = int(target_match.group(1))
-                continue
-
-            cooldown_match = re.fullmatch(r"cooldown\s+(\d+)", lower)
-            if cooldown_match:
-                modules["cooldown"] = int(cooldown_match.group(1))
-                continue
-
-            max_match = re.fullmatch(r"max\s+(\d+)", lower)
-            if max_match:
-                modules["max"] = int(max_match.group(1))
-                continue
-
-            bpm_match = re.fullmatch(r"\+\s*(-?\d+)", lower)
-            if bpm_match:
-                modules["bpm_boost"] = int(bpm_match.group(1))
-                continue
-
-            multiplier_match = re.fullmatch(r"\*\s*([-+]?\d+(?:\.\d+)?)", lower)
-            if multiplier_match:
-                modules["bpm_multiplier"] = float(multiplier_match.group(1))
-                continue
-
-            greater_than_match = re.fullmatch(r">\s*(-?\d+)", lower)
-            if greater_than_match:
-                modules["bps_min"] = int(greater_than_match.group(1))
-                continue
-
-            less_than_match = re.fullmatch(r"<\s*(-?\d+)", lower)
-            if less_than_match:
-                modules["bps_max"] = int(less_than_match.group(1))
-                continue
-
-            timer_greater_match = re.fullmatch(r">\s*(\d+)s", lower)
-            if timer_greater_match:
-                modules["timer_min_seconds"] = int(timer_greater_match.group(1))
-                continue
-
-            timer_less_match = re.fullmatch(r"<\s*(\d+)s", lower)
-            if timer_less_match:
-                modules["timer_max_seconds"] = int(timer_less_match.group(1))
-                continue
-
-            if lower.endswith(".wav"):
-                modules["sound_effect"] = module_text.strip()
-                continue
-
-            if lower == "fragile":
-                modules["fragile"] = True
-                continue
-
-            if lower == "missing":
-                modules["missing"] = True
-                continue
-
-            if lower == "reset":
-                modules["reset_timer"] = True
-                continue
-
-            if lower == "post pause reset":
-                modules["post_pause_reset"] = True
-                continue
-
-            pause_wheel_match = re.fullmatch(r"pause\s+wheel\s+(\d+)", lower)
-            if pause_wheel_match:
-                modules["pause_wheel"] = int(pause_wheel_match.group(1))
-                continue
-
-            pause_heartbeat_match = re.fullmatch(r"pause\s+heartbeat\s+(\d+)", lower)
-            if pause_heartbeat_match:
-                modules["pause_heartbeat"] = int(pause_heartbeat_match.group(1))
-                continue
-
-        return modules
-
-    def is_item_allowed_by_bps(self, modules: dict[str, int | bool | float | str]) -> bool:
-        min_bps = modules.get("bps_min")
-        max_bps = modules.get("bps_max")
-
-        if isinstance(min_bps, int) and self.bps <= min_bps:
-            return False
-        if isinstance(max_bps, int) and self.bps >= max_bps:
-            return False
-        return True
-
-    def current_timer_seconds(self) -> float:
-        if self.first_spin_time is None:
-            return 0.0
-        return time.perf_counter() - self.first_spin_time
-
-    def timer_display_value(self) -> str:
-        elapsed = int(self.current_timer_seconds())
-        minutes, seconds = divmod(elapsed, 60)
-        return f"{minutes:02d}:{seconds:02d}"
-
-    def is_item_allowed_by_timer(
-        self, modules: dict[str, int | bool | float | str]
-    ) -> bool:
-        min_seconds = modules.get("timer_min_seconds")
-        max_seconds = modules.get("timer_max_seconds")
-        elapsed = self.current_timer_seconds()
-
-        if isinstance(min_seconds, int) and elapsed <= min_seconds:
-            return False
-        if isinstance(max_seconds, int) and elapsed >= max_seconds:
-            return False
-        return True
-
-    def is_item_allowed(self, modules: dict[str, int | bool | float | str]) -> bool:
-        return self.is_item_allowed_by_bps(modules) and self.is_item_allowed_by_timer(modules)
-
-    def register_modules(
-        self,
-        idx: int | None,
-        base_name: str,
-        modules: dict[str, int | bool | float | str],
-        color: str | None,
-    ) -> None:
-        if "spawn_initial" in modules and "spawn_repeat" in modules:
-            self.spawn_configs.append(
-                {
-                    "index": idx,
-                    "base_name": base_name,
-                    "initial_delay": modules["spawn_initial"],
-                    "repeat_delay": modules["spawn_repeat"],
-                    "color": color,
-                    "modules": copy.deepcopy(modules),
-                }
-            )
-
-        if "special_target" in modules:
-            target = modules["special_target"]
-            if base_name not in self.special_targets_by_name:
-                self.special_targets_by_name[base_name] = target
-                self.special_counts_by_name[base_name] = 0
-
-        if "max" in modules:
-            target = int(modules["max"])
-            if base_name not in self.max_targets_by_name:
-                self.max_targets_by_name[base_name] = target
-                self.max_counts_by_name[base_name] = 0
-
-    def format_item_label(self, idx: int) -> str:
-        label = self.base_names[idx]
-        modules = self.item_modules[idx]
-        if "special_target" in modules:
-            target = modules["special_target"]
-            base_name = self.base_names[idx]
-            current = self.special_counts_by_name.get(base_name, 0)
-            label = f"{label} ({current}/{target})"
-        return label
-
-    def add_item_with_modules(
-        self,
-        base_name: str,
-        modules: dict[str, int | bool | float | str],
-        color: str | None = None,
-        register_spawn: bool = False,
-    ) -> None:
-        modules = copy.deepcopy(modules)
-        if base_name in self.max_blocked_names:
-            return
-
-        if not self.is_item_allowed(modules):
-            self.hidden_items.append(
-                {"base_name": base_name, "modules": modules, "color": color}
-            )
-            return
-
-        if "max" in modules and base_name not in self.max_targets_by_name:
-            self.max_targets_by_name[base_name] = int(modules["max"])
-            self.max_counts_by_name[base_name] = 0
-
-        if color is None:
-            palette = self.generate_colors(len(self.items) + 1)
-            color = palette[len(self.items)]
-
-        self.base_names.append(base_name)
-        self.item_modules.append(copy.deepcopy(modules))
-        self.colors.append(str(color))
-
-        new_index = len(self.items)
-        if "special_target" in modules:
-            target = modules["special_target"]
-            if base_name not in self.special_targets_by_name:
-                self.special_targets_by_name[base_name] = target
-                self.special_counts_by_name[base_name] = 0
-
-        self.items.append(self.format_item_label(new_index))
-
-        if (
-            register_spawn
-            and "spawn_initial" in modules
-            and "spawn_repeat" in modules
-        ):
-            self.spawn_configs.append(
-                {
-                    "index": new_index,
-                    "base_name": base_name,
-                    "initial_delay": modules["spawn_initial"],
-                    "repeat_delay": modules["spawn_repeat"],
-                    "color": color,
-                    "modules": copy.deepcopy(modules),
-                }
-            )
-
-    def apply_bps_conditions(self) -> None:
-        removed_any = False
-        for idx in range(len(self.item_modules) - 1, -1, -1):
-            modules = self.item_modules[idx]
-            if self.is_item_allowed(modules):
-                continue
-
-            record: dict[str, str | dict[str, int | bool | float | str] | None] = {
-                "base_name": self.base_names[idx],
-                "modules": copy.deepcopy(modules),
-                "color": self.colors[idx],
-            }
-            self.hidden_items.append(record)
-            self.remove_item(idx)
-            removed_any = True
-
-        added_any = False
-        for record in list(self.hidden_items):
-            modules = record.get("modules")
-            base_name = record.get("base_name")
-            color = record.get("color")
-            if not isinstance(modules, dict) or not isinstance(base_name, str):
-                continue
-
-            if not self.is_item_allowed(modules):
-                continue
-
-            self.add_item_with_modules(
-                base_name,
-                copy.deepcopy(modules),
-                str(color) if color else None,
-                register_spawn=False,
-            )
-            self.hidden_items.remove(record)
-            added_any = True
-
-        if removed_any or added_any:
-            self.draw_wheel()
+            return None
+        return load_or_compile(Path(path), text, items, positions)
 
     def load_sound_file(self, filename: str):  # type: ignore[override]
         candidate_paths = []
@@ -556,29 +341,25 @@ class WheelOfFortune:
 
         if path is None:
             return None
-
-        if pygame is not None:
-            try:
-                return pygame.mixer.Sound(str(path))
-            except Exception:
-                return None
-
-        if simpleaudio is not None:
-            try:
-                return simpleaudio.WaveObject.from_wave_file(str(path))
-            except Exception:
-                return None
-
-        if winsound is not None:
-            return path
-
-        return None
+        return self.audio.load(path)
 
     def load_click_sound(self):  # type: ignore[override]
-        return self.load_sound_file("click.wav")
+        return self.sound_cache.get("click.wav")
 
     def load_heartbeat_sound(self):  # type: ignore[override]
-        return self.load_sound_file("Heartbeat.wav")
+        return self.sound_cache.get("Heartbeat.wav")
+
+    def preload_sound_names(self) -> list[str]:
+        names = [
+            str(modules["sound_effect"])
+            for modules in self.engine.compiled.modules
+            if "sound_effect" in modules
+        ]
+        if self.heartbeat_bank is None:
+            names.extend(
+                self.heartbeat_filename_for_bpm(bpm) for bpm in range(60, 241, 30)
+            )
+        return names
 
     def heartbeat_filename_for_bpm(self, bpm: int) -> str:
         if bpm >= 240:
@@ -598,96 +379,147 @@ class WheelOfFortune:
     def play_sound(self, sound: object | None) -> None:
         if sound is None:
             return
-
-        if pygame is not None and hasattr(sound, "play"):
-            try:
-                sound.play()
-            except Exception:
-                pass
-            return
-
-        if simpleaudio is not None and hasattr(sound, "play"):
-            try:
-                sound.play()
-            except Exception:
-                pass
-            return
-
-        if winsound is not None:
-            try:
-                winsound.PlaySound(
-                    str(sound),
-                    winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT,
-                )
-            except Exception:
-                pass
+        self.audio.play(sound)
 
     def play_click_sound(self) -> None:
         self.play_sound(self.click_sound)
 
-    def play_heartbeat_sound(self) -> None:
-        if not self.heartbeat_enabled_var.get():
-            return
-
-        if self.heartbeat_pause_active:
-            return
-
-        filename = self.heartbeat_filename_for_bpm(self.display_bps_value())
-        if filename not in self.sound_cache:
-            self.sound_cache[filename] = self.load_sound_file(filename)
+    def current_heartbeat_sound(self) -> object | None:
+        if self.heartbeat_bank is not None:
+            return self.heartbeat_bank.get(max(1.0, float(self.engine.bps)))
 
+        filename = self.heartbeat_filename_for_bpm(self.engine.display_bps_value())
         sound = self.sound_cache.get(filename)
         if sound is None:
             sound = self.heartbeat_sound
+        return sound
 
-        self.play_sound(sound)
+    def play_heartbeat_sound(self) -> bool:
+        if not self.heartbeat_enabled_var.get():
+            return False
+
+        if self.engine.heartbeat_pause_active:
+            return False
+
+        self.play_sound(self.current_heartbeat_sound())
+        return True
+
+    # With the mixer the beat grid runs on the audio thread; the view only
+    # tells it the current tempo and sample.
+    def update_mixer_heartbeat(self) -> None:
+        if self.mixer is None:
+            return
+        sound = self.current_heartbeat_sound()
+        if self.engine.heartbeat_pause_active or sound is None:
+            self.mixer.stop_heartbeat()
+            return
+        self.mixer.set_heartbeat(sound, max(1.0, float(self.engine.bps)))
+
+    def wheel_scene_signature(self) -> tuple[tuple[str, ...], tuple[str, ...], bool]:
+        return (
+            tuple(self.engine.items),
+            tuple(self.engine.colors),
+            bool(self.night_mode_var.get()),
+        )
 
     def draw_wheel(self) -> None:
-        self.canvas.delete("all")
-        if not self.items:
+        if self.sprite_renderer is not None:
+            self.draw_wheel_sprite()
+            return
+
+        signature = (self.wheel_scene_signature(), self.detail_key())
+        if signature != self.scene_signature:
+            self.rebuild_wheel_scene()
+            self.scene_signature = signature
+            self.update_wheel_geometry()
             return
-        sector_angle = 360 / len(self.items)
-        pointer_angle = 90
+        start = time.perf_counter()
+        self.update_wheel_geometry()
+        if self.detail is not None and self.detail.observe(time.perf_counter() - start):
+            self.scene_signature = None
+
+    def measure_label(self, text: str, font: LabelFont) -> int:
+        measurer = self.label_fonts.get(font)
+        if measurer is None:
+            measurer = self.label_fonts[font] = tkfont.Font(root=self.root, font=font)
+        return measurer.measure(text)
+
+    def detail_key(self) -> tuple[int, bool]:
+        # (detail level, labels shown); any change rebuilds the scene.
+        if self.detail is None:
+            return DETAIL_FULL, True
+        level = self.detail.level
+        return level, not (level >= DETAIL_NO_SPIN_LABELS and self.engine.spinning)
+
+    def rebuild_wheel_scene(self) -> None:
+        self.canvas.delete("wheel")
+        self.segment_ids = []
+        self.label_ids = []
+        self.pointer_id = None
+        self.sprite_image_id = None
+        self.wheel_layout = None
+        if not self.engine.items:
+            return
+
+        level, show_labels = self.detail_key()
+        if self.detail is None:
+            layout = plan_full_wheel(self.engine.items, self.engine.colors)
+        else:
+            layout = plan_wheel(self.engine.items, self.engine.colors, level, show_labels)
+        self.wheel_layout = layout
+
         bbox = (
             self.center - self.radius,
             self.center - self.radius,
             self.center + self.radius,
             self.center + self.radius,
         )
+        for _, extent, color in layout.arcs:
+            self.segment_ids.append(
+                self.canvas.create_arc(
+                    bbox,
+                    start=0,
+                    extent=extent,
+                    fill=color,
+                    outline="white" if layout.outlines else "",
+                    width=2 if layout.outlines else 0,
+                    tags=("wheel",),
+                )
+            )
 
-        text_items = []
-        for index, label in enumerate(self.items):
-            start_angle = (
-                pointer_angle - sector_angle / 2 + index * sector_angle + self.angle_offset
+        text_fill = "black" if self.night_mode_var.get() else "white"
+        text_radius = self.radius * LABEL_RADIUS
+        first_edge = 90 - layout.sector_angle / 2
+        self.label_anchors = []
+        for center, width, label in layout.labels:
+            fit = self.label_cache.fit(
+                label, available_width(width, text_radius, self.radius), LABEL_FONT
             )
-            self.canvas.create_arc(
-                bbox,
-                start=start_angle,
-                extent=sector_angle,
-                fill=self.colors[index],
-                outline="white",
-                width=2,
+            if not fit.text:
+                continue
+            # Position with the wheel at rest; frames only rotate it.
+            angle = first_edge + center
+            angle_rad = math.radians(angle)
+            self.label_anchors.append(
+                (text_radius * math.cos(angle_rad), text_radius * math.sin(angle_rad), angle)
             )
-
-            segment_center = start_angle + sector_angle / 2
-            angle_rad = math.radians(segment_center)
-            text_radius = self.radius * 0.65
-            x = self.center + text_radius * math.cos(angle_rad)
-            y = self.center - text_radius * math.sin(angle_rad)
-            text_items.append((x, y, label, segment_center - 90))
-
-        for x, y, label, angle in text_items:
-            self.canvas.create_text(
-                x,
-                y,
-                text=label,
-                font=("Arial", 14, "bold"),
-                fill="black" if self.night_mode_var.get() else "white",
-                angle=angle,
+            self.label_ids.append(
+                self.canvas.create_text(
+                    self.center,
+                    self.center,
+                    text=fit.text,
+                    font=LABEL_FONT,
+                    fill=text_fill,
+                    justify="center",
+                    tags=("wheel",),
+                )
             )
 
+        self.create_pointer()
+
+    def create_pointer(self) -> None:
         pointer_size = 18
-        self.canvas.create_polygon(
+        self.pointer_id = self.canvas.create_polygon(
             self.center - pointer_size,
             self.center - self.radius - 10,
             self.center + pointer_size,
@@ -695,15 +527,60 @@ class WheelOfFortune:
             self.center,
             self.center - self.radius - 40,
             fill="black",
+            tags=("wheel",),
         )
 
+    # Redraws triggered by engine events are coalesced into one per idle turn.
+    def request_redraw(self) -> None:
+        self.redraw_pending = True
+        if self.redraw_job is None:
+            self.redraw_job = self.root.after_idle(self.flush_redraw)
+
+    def flush_redraw(self) -> None:
+        self.redraw_job = None
+        if self.redraw_pending:
+            self.redraw_pending = False
+            self.draw_wheel()
+
+    def draw_wheel_sprite(self) -> None:
+        if self.sprite_image_id is None:
+            self.canvas.delete("wheel")
+            self.scene_signature = None
+            self.segment_ids = []
+            self.label_ids = []
+            self.sprite_image_id = self.canvas.create_image(
+                self.center, self.center, tags=("wheel",)
+            )
+            self.create_pointer()
+
+        frame = self.sprite_renderer.frame(self.wheel_scene_signature(), self.angle_offset)
+        self.canvas.itemconfig(self.sprite_image_id, image=frame)
+
+    def update_wheel_geometry(self) -> None:
+        layout = self.wheel_layout
+        if layout is None:
+            return
+        first_edge = 90 - layout.sector_angle / 2 + self.angle_offset
+        for segment_id, (start, _, _) in zip(self.segment_ids, layout.arcs):
+            self.canvas.itemconfig(segment_id, start=first_edge + start)
+
+        angle_rad = math.radians(self.angle_offset)
+        cos_a = math.cos(angle_rad)
+        sin_a = math.sin(angle_rad)
+        for label_id, (x, y, angle) in zip(self.label_ids, self.label_anchors):
+            self.canvas.coords(
+                label_id, self.center + x * cos_a - y * sin_a, self.center - x * sin_a - y * cos_a
+            )
+            self.canvas.itemconfig(label_id, angle=angle + self.angle_offset - 90)
+
+    def shown_angle(self, angle: float) -> float:
+        # Sprite frames come in fixed angle steps; vector drawing is exact.
+        if self.sprite_renderer is None:
+            return angle
+        return self.sprite_renderer.snap_angle(angle)
+
     def pointer_index(self) -> int:
-        if not self.items:
-            return 0
-        sector_angle = 360 / len(self.items)
-        relative = (sector_angle / 2 - self.angle_offset) % 360
-        index = int(relative // sector_angle)
-        return min(index, len(self.items) - 1)
+        return pointer_index(self.angle_offset, len(self.engine.items))
 
     def toggle_heartbeat(self) -> None:
         if self.heartbeat_enabled_var.get():
@@ -758,9 +635,9 @@ class WheelOfFortune:
         self.cancel_auto_spin()
         if (
             self.auto_spin_var.get()
-            and not self.wheel_pause_active
-            and not self.game_over
-            and not self.spinning
+            and not self.engine.wheel_pause_active
+            and not self.engine.game_over
+            and not self.engine.spinning
         ):
             self.auto_spin_job = self.root.after(300, self.auto_spin_tick)
 
@@ -768,6 +645,10 @@ class WheelOfFortune:
         if not self.heartbeat_enabled_var.get():
             return
 
+        if self.mixer is not None:
+            self.update_mixer_heartbeat()
+            return
+
         self.start_heartbeat_worker()
         self.ensure_heartbeat_polling()
 
@@ -798,7 +679,7 @@ class WheelOfFortune:
         next_target = time.perf_counter()
         lookahead = 0.003
         while not self.heartbeat_stop_event.is_set():
-            bpm = max(1.0, float(self.bps))
+            bpm = max(1.0, float(self.engine.bps))
             interval = 60.0 / bpm
             next_target = max(next_target + interval, time.perf_counter() + interval)
 
@@ -815,7 +696,7 @@ class WheelOfFortune:
             if self.heartbeat_stop_event.is_set():
                 return
 
-            self.heartbeat_queue.put(time.perf_counter())
+            self.heartbeat_queue.put((next_target, time.perf_counter()))
 
     def ensure_heartbeat_polling(self) -> None:
         if self.heartbeat_poll_job is None:
@@ -826,10 +707,10 @@ class WheelOfFortune:
         processed = False
         while True:
             try:
-                self.heartbeat_queue.get_nowait()
+                scheduled, enqueued = self.heartbeat_queue.get_nowait()
             except queue.Empty:
                 break
-            self.heartbeat_tick()
+            self.heartbeat_tick(scheduled, enqueued)
             processed = True
 
         if self.heartbeat_enabled_var.get() and self.heartbeat_worker_running():
@@ -842,6 +723,8 @@ class WheelOfFortune:
             self.auto_spin_job = None
 
     def cancel_heartbeat(self) -> None:
+        if self.mixer is not None:
+            self.mixer.stop_heartbeat()
         self.stop_heartbeat_worker()
         if self.heartbeat_poll_job is not None:
             self.root.after_cancel(self.heartbeat_poll_job)
@@ -854,22 +737,23 @@ class WheelOfFortune:
 
     def update_timer_label(self) -> None:
         now = time.perf_counter()
-        if self.first_spin_time is None:
+        first_spin_time = self.engine.first_spin_time
+        if first_spin_time is None:
             self.timer_label.config(text="Timer: 00:00")
         else:
-            elapsed = now - self.first_spin_time
+            elapsed = now - first_spin_time
             minutes, seconds = divmod(int(elapsed), 60)
             self.timer_label.config(text=f"Timer: {minutes:02d}:{seconds:02d}")
 
-        if self.session_start_time is None:
+        session_start_time = self.engine.session_start_time
+        if session_start_time is None:
             self.session_timer_label.config(text="Session Timer: 00:00")
         else:
-            session_elapsed = now - self.session_start_time
+            session_elapsed = now - session_start_time
             minutes, seconds = divmod(int(session_elapsed), 60)
             self.session_timer_label.config(
                 text=f"Session Timer: {minutes:02d}:{seconds:02d}"
             )
-        self.apply_bps_conditions()
         self.timer_job = self.root.after(500, self.update_timer_label)
 
     def cancel_timer(self) -> None:
@@ -877,135 +761,100 @@ class WheelOfFortune:
             self.root.after_cancel(self.timer_job)
             self.timer_job = None
 
-    def reset_spin_timer(self) -> None:
-        self.first_spin_time = time.perf_counter()
-        self.cancel_timer()
-        self.update_timer_label()
-        self.apply_bps_conditions()
-
-    def stop_spin_timer(self) -> None:
-        self.cancel_timer()
-        self.first_spin_time = None
-        self.timer_label.config(text="Timer: 00:00")
-        self.apply_bps_conditions()
-
-    def cancel_spawn_jobs(self) -> None:
-        for job in self.spawn_jobs:
-            try:
-                self.root.after_cancel(job)
-            except Exception:
-                pass
-        self.spawn_jobs.clear()
-
-    def cancel_cooldown_jobs(self) -> None:
-        for job in self.cooldown_jobs:
-            try:
-                self.root.after_cancel(job)
-            except Exception:
-                pass
-        self.cooldown_jobs.clear()
-
-    def start_spawn_timers_if_needed(self) -> None:
-        if self.spawn_started:
-            return
-
-        self.spawn_started = True
-        self.schedule_spawn_items()
-
-    def schedule_spawn_items(self) -> None:
-        self.cancel_spawn_jobs()
-        for config in self.spawn_configs:
-            delay = config["initial_delay"] if config["initial_delay"] > 0 else config["repeat_delay"]
-            if delay <= 0:
-                continue
-            job = self.root.after(
-                int(delay * 1000),
-                lambda cfg=config: self.apply_spawn_effect(cfg),
-            )
-            self.spawn_jobs.append(job)
-
-    def apply_spawn_effect(self, config: dict[str, int | str]) -> None:
-        base_name = str(config["base_name"])
-        if base_name in self.max_blocked_names:
+    def schedule_engine_timers(self) -> None:
+        self.cancel_engine_timers()
+        deadline = self.engine.next_deadline()
+        if deadline is None:
             return
-
-        repeat_delay = int(config["repeat_delay"])
-        self.duplicate_spawn_item(config)
-
-        if repeat_delay > 0:
-            job = self.root.after(
-                int(repeat_delay * 1000),
-                lambda cfg=config: self.apply_spawn_effect(cfg),
+        delay_ms = max(0, int(math.ceil((deadline - time.perf_counter()) * 1000)))
+        self.engine_timer_job = self.root.after(delay_ms, self.engine_timer_tick)
+
+    def cancel_engine_timers(self) -> None:
+        if self.engine_timer_job is not None:
+            self.root.after_cancel(self.engine_timer_job)
+            self.engine_timer_job = None
+
+    def engine_timer_tick(self) -> None:
+        self.engine_timer_job = None
+        self.engine.advance(time.perf_counter())
+        if self.engine_timer_job is None:
+            self.schedule_engine_timers()
+
+    def handle_engine_event(self, event: str, payload: dict[str, object]) -> None:
+        if event == "items_changed":
+            self.request_redraw()
+        elif event == "bpm_changed":
+            self.update_bpm_display()
+            self.schedule_heartbeat()
+        elif event == "timers_changed":
+            self.schedule_engine_timers()
+        elif event == "sound":
+            self.play_sound(self.sound_cache.get(str(payload["filename"])))
+        elif event == "spin_logged":
+            self.log_recent_selection(
+                str(payload["selection"]),
+                str(payload["timer_text"]),
+                str(payload["bpm_text"]),
             )
-            self.spawn_jobs.append(job)
+        elif event == "timer_reset":
+            self.cancel_timer()
+            self.update_timer_label()
+        elif event == "timer_stopped":
+            self.cancel_timer()
+            self.timer_label.config(text="Timer: 00:00")
+        elif event == "wheel_pause_started":
+            self.start_wheel_pause_timer()
+        elif event == "wheel_pause_ended":
+            self.finish_wheel_pause_timer(bool(payload["timer_stopped"]))
+        elif event == "heartbeat_pause_started":
+            self.start_heartbeat_pause_timer()
+            self.update_mixer_heartbeat()
+        elif event == "heartbeat_pause_ended":
+            self.finish_heartbeat_pause_timer(bool(payload["timer_stopped"]))
+            self.schedule_heartbeat()
+        elif event == "game_over":
+            self.end_game(str(payload["message"]))
 
     def auto_spin_tick(self) -> None:
         self.auto_spin_job = None
         if not self.auto_spin_var.get():
             return
-        if self.game_over:
+        if self.engine.game_over:
             return
-        if self.wheel_pause_active:
+        if self.engine.wheel_pause_active:
             return
-        if not self.spinning:
+        if not self.engine.spinning:
             self.start_spin()
 
-    def heartbeat_tick(self) -> None:
-        self.play_heartbeat_sound()
+    def heartbeat_tick(self, scheduled: float, enqueued: float) -> None:
+        if self.play_heartbeat_sound() and self.heartbeat_recorder is not None:
+            self.heartbeat_recorder.record(
+                self.engine.bps, scheduled, enqueued, time.perf_counter()
+            )
 
     def start_spin(self, event: tk.Event | None = None) -> None:
-        if self.game_over:
-            self.status.config(text="Game over. Press Restart to play again.")
-            return
-        if self.wheel_pause_active:
-            return
-        if self.spinning:
-            return
-        if not self.items:
-            self.status.config(text="No available choices. Adjust BPM or restart.")
+        started, message = self.engine.start_spin(time.perf_counter())
+        if message is not None:
+            self.status.config(text=message)
+        if not started:
             return
 
-        if self.first_spin_time is None:
-            now = time.perf_counter()
-            if self.session_start_time is None:
-                self.session_start_time = now
-            self.first_spin_time = now
-            self.schedule_timer_update()
-        elif self.session_start_time is None:
-            self.session_start_time = time.perf_counter()
-            self.schedule_timer_update()
-
-        self.start_spawn_timers_if_needed()
-        self.spinning = True
-        self.spin_start = time.perf_counter()
-        self.last_update = self.spin_start
-        self.initial_speed = random.uniform(4.7, 5.3) * 360
-        self.deceleration = self.initial_speed / 3.0
-        self.jitter = random.uniform(0.01, 0.05)
+        self.schedule_timer_update()
+        self.trajectory = self.engine.trajectory
+        self.spin_elapsed = 0.0
+        self.frame_pacer.start(time.perf_counter())
         self.last_pointer_index = self.pointer_index()
         self.update_spin()
 
-    def current_speed(self, elapsed: float) -> float:
-        noise = 1 + random.uniform(-self.jitter, self.jitter)
-        if elapsed < 2:
-            return self.initial_speed * noise
-        if elapsed < 5:
-            slow_time = elapsed - 2
-            speed = max(self.initial_speed - self.deceleration * slow_time, 0)
-            return speed * noise
-        return 0.0
-
     def update_spin(self) -> None:
-        if not self.spinning:
+        if not self.engine.spinning or self.trajectory is None:
             return
 
         now = time.perf_counter()
-        elapsed = now - self.spin_start
-        dt = now - self.last_update
-        self.last_update = now
-
-        speed = self.current_speed(elapsed)
-        self.angle_offset = (self.angle_offset + speed * dt) % 360
+        self.frame_pacer.begin_frame(now)
+        # Frames only sample the precomputed curve; slow frames skip ahead.
+        self.spin_elapsed = min(now - self.frame_pacer.started, self.trajectory.duration)
+        self.angle_offset = self.shown_angle(self.trajectory.angle_at(self.spin_elapsed))
         self.draw_wheel()
 
         pointer_index = self.pointer_index()
@@ -1013,376 +862,84 @@ class WheelOfFortune:
             self.play_click_sound()
             self.last_pointer_index = pointer_index
 
-        if elapsed >= 5:
+        if self.spin_elapsed >= self.trajectory.duration:
             self.finish_spin()
             return
 
-        self.root.after(16, self.update_spin)
+        delay_ms = self.frame_pacer.delay_ms(time.perf_counter())
+        self.root.after(delay_ms, self.update_spin)
 
     def finish_spin(self) -> None:
-        self.spinning = False
-        if not self.items:
-            self.end_game("No items remain. Ending game.")
-            return
-
+        # The winner is whatever sector the frame on screen has under the pointer.
+        self.angle_offset = self.shown_angle(self.angle_offset)
         index = self.pointer_index()
-        if index >= len(self.base_names):
-            self.end_game("All items were removed during the spin.")
-            return
-
         self.last_pointer_index = index
-        winner = self.items[index]
-        base_name = self.base_names[index]
-        modules = self.item_modules[index]
-        selected_index = index
-        selected_winner = winner
-        selected_base_name = base_name
-        selected_modules = copy.deepcopy(modules)
-        lowered_winner = base_name.strip().lower()
-        multiplier_match = re.fullmatch(r"(\d+)x", lowered_winner)
-        multiplier_value = int(multiplier_match.group(1)) if multiplier_match else None
-        applied_multiplier = self.pending_multiplier
-        is_special_multiplier = multiplier_value is not None
-        bpm_effect_multiplier = applied_multiplier if applied_multiplier > 1 else 1
-        has_bpm_effect = "bpm_multiplier" in modules or "bpm_boost" in modules
-        if not has_bpm_effect:
-            bpm_effect_multiplier = 1
-
-        display_winner = selected_winner
-        if applied_multiplier > 1:
-            display_winner = f"{applied_multiplier}x {selected_winner}"
-
-        timer_reset_at: str | None = None
-        previous_bpm = self.display_bps_value()
-        final_bpm = previous_bpm
-        logged = False
-
-        def timer_log_text() -> str:
-            if timer_reset_at is not None:
-                return f"Timer has been reset at {timer_reset_at}"
-            return self.timer_display_value()
-
-        def bpm_log_text() -> str:
-            if final_bpm > previous_bpm:
-                return f"BPM increased to {final_bpm}"
-            if final_bpm < previous_bpm:
-                return f"BPM reduced to {final_bpm}"
-            return str(final_bpm)
-
-        def log_spin() -> None:
-            nonlocal logged
-            if logged:
-                return
-            self.log_recent_selection(display_winner, timer_log_text(), bpm_log_text())
-            logged = True
-
-        if is_special_multiplier:
-            self.pending_multiplier *= multiplier_value
-        else:
-            # Deplete any stored multiplier as soon as a non-multiplier choice resolves.
-            self.pending_multiplier = 1
-
-        module_messages = []
-        bpm_changed = False
-        applied_multiplier_value: float | None = None
-        applied_boost_value: int | None = None
-        if "bpm_multiplier" in selected_modules:
-            multiplier = float(selected_modules["bpm_multiplier"])
-            total_multiplier = math.pow(multiplier, bpm_effect_multiplier)
-            self.bps *= total_multiplier
-            bpm_changed = True
-            applied_multiplier_value = total_multiplier
-
-        if "bpm_boost" in selected_modules:
-            boost = selected_modules["bpm_boost"] * bpm_effect_multiplier
-            self.bps += boost
-            bpm_changed = True
-            applied_boost_value = boost
-
-        if bpm_changed:
-            self.clamp_bps()
-            self.update_bpm_display()
-            self.schedule_heartbeat()
-            self.apply_bps_conditions()
-
-            new_bpm_text = self.display_bps_value()
-            final_bpm = new_bpm_text
-            if applied_multiplier_value is not None:
-                module_messages.append(
-                    f"BPM multiplied by {applied_multiplier_value} to {new_bpm_text}."
-                )
-            if applied_boost_value is not None:
-                module_messages.append(
-                    f"BPM increased by {applied_boost_value} to {new_bpm_text}."
-                )
-
-        if "sound_effect" in selected_modules:
-            filename = str(selected_modules["sound_effect"])
-            if filename not in self.sound_cache:
-                self.sound_cache[filename] = self.load_sound_file(filename)
-            self.play_sound(self.sound_cache.get(filename))
-
-        if selected_modules.get("reset_timer"):
-            timer_reset_at = self.timer_display_value()
-            self.reset_spin_timer()
-            module_messages.append("Timer reset.")
-
-        ended, message = self.handle_special_result(
-            selected_base_name, display_winner, 1
-        )
-
-        max_ended, max_message = self.handle_max_result(selected_base_name, display_winner)
-        if max_message:
-            message = max_message
-        ended = ended or max_ended
-        reached_max = False
-        if selected_base_name in self.max_targets_by_name:
-            reached_max = (
-                self.max_counts_by_name.get(selected_base_name, 0)
-                >= self.max_targets_by_name.get(selected_base_name, 0)
-            )
-
-        if "fragile" in selected_modules and not ended and not reached_max:
-            message = self.handle_fragile_result(
-                selected_index, selected_base_name, display_winner
-            )
-            ended = self.game_over
-
-        if (
-            "cooldown" in selected_modules
-            and not ended
-            and selected_base_name not in self.max_blocked_names
-            and not reached_max
-        ):
-            cooldown_index = None
-            for idx, name in enumerate(self.base_names):
-                if name == selected_base_name:
-                    cooldown_index = idx
-                    break
-
-            if cooldown_index is not None:
-                ended, message = self.handle_cooldown_result(
-                    cooldown_index, display_winner
-                )
-
-        if not ended:
-            pause_heartbeat_seconds = (
-                int(selected_modules.get("pause_heartbeat", 0))
-                if "pause_heartbeat" in selected_modules
-                else 0
-            )
-            post_pause_reset = bool(selected_modules.get("post_pause_reset"))
-            if pause_heartbeat_seconds > 0:
-                heartbeat_duration = pause_heartbeat_seconds
-                self.start_heartbeat_pause_timer(heartbeat_duration)
-                if post_pause_reset:
-                    self.post_pause_reset_pending = True
-                module_messages.append(
-                    f"Heartbeat paused for {heartbeat_duration} seconds."
-                )
-
-            pause_wheel_seconds = (
-                int(selected_modules.get("pause_wheel", 0))
-                if "pause_wheel" in selected_modules
-                else 0
-            )
-            if pause_wheel_seconds > 0:
-                wheel_duration = pause_wheel_seconds
-                self.start_wheel_pause_timer(wheel_duration)
-                if post_pause_reset:
-                    self.post_pause_reset_pending = True
-                module_messages.append(
-                    f"Wheel paused for {wheel_duration} seconds."
-                )
-                if module_messages:
-                    message = f"{message} {' '.join(module_messages)}".strip()
-                log_spin()
-                return
-
-        if module_messages:
-            message = f"{message} {' '.join(module_messages)}".strip()
-
-        if not ended and not self.items:
-            message = "All items were removed during the spin."
-            self.end_game(message)
-            ended = True
-
-        if ended:
-            log_spin()
+        with self.engine.batch():
+            outcome = self.engine.finish_spin(index, time.perf_counter(), self.angle_offset)
+        if self.detail is not None and self.detail.level >= DETAIL_NO_SPIN_LABELS:
+            # Labels were left out while spinning; bring them back.
+            self.request_redraw()
+        if outcome["ended"] or outcome["paused"]:
             return
 
-        log_spin()
-        self.status.config(text=message)
+        self.status.config(text=str(outcome["message"]))
         self.schedule_auto_spin()
 
     def log_recent_selection(self, selection: str, timer_text: str, bpm_text: str) -> None:
-        print(f"1. Selected: {selection}")
-        print(f"2. {timer_text}")
-        print(f"3. {bpm_text}")
-
-    def handle_special_result(
-        self, base_name: str, display_winner: str, applied_multiplier: int = 1
-    ) -> tuple[bool, str]:
-        if base_name not in self.special_targets_by_name:
-            return False, f"Result: {display_winner}."
-
-        self.special_counts_by_name[base_name] += max(1, applied_multiplier)
-        target = self.special_targets_by_name[base_name]
-        name = base_name
-        current = self.special_counts_by_name[base_name]
-        display_current = min(current, target)
-        if current >= target:
-            message = f"{name} was chosen {target} times"
-            self.end_game(message)
-            return True, message
-
-        return (
-            False,
-            f"Result: {display_winner}. {name} chosen {display_current}/{target}.",
-        )
-
-    def remove_all_items_by_base_name(self, base_name: str) -> int:
-        removed = 0
-        for idx in range(len(self.base_names) - 1, -1, -1):
-            if self.base_names[idx] == base_name:
-                removed += 1
-                self.remove_item(idx)
-        hidden_removed = 0
-        new_hidden_items = []
-        for record in self.hidden_items:
-            if record.get("base_name") == base_name:
-                hidden_removed += 1
-            else:
-                new_hidden_items.append(record)
-        self.hidden_items = new_hidden_items
-        self.spawn_configs = [
-            cfg for cfg in self.spawn_configs if cfg.get("base_name") != base_name
-        ]
-        return removed + hidden_removed
-
-    def handle_max_result(self, base_name: str, display_winner: str) -> tuple[bool, str | None]:
-        if base_name not in self.max_targets_by_name:
-            return False, None
-
-        self.max_counts_by_name[base_name] += 1
-        current = self.max_counts_by_name[base_name]
-        target = self.max_targets_by_name[base_name]
-        if current < target:
-            return False, (
-                f"{display_winner} progress {current}/{target} towards Max."
-            )
-
-        self.max_blocked_names.add(base_name)
-        removed = self.remove_all_items_by_base_name(base_name)
-        if not self.items:
-            message = f"{display_winner} reached Max {target}. No items remain."
-            self.end_game(message)
-            return True, message
-
-        return (
-            False,
-            f"{display_winner} reached Max {target}. Removed {removed} choice(s).",
-        )
-
-    def handle_cooldown_result(self, index: int, display_winner: str) -> tuple[bool, str]:
-        modules = self.item_modules[index]
-        base_name = self.base_names[index]
-        duration = int(modules.get("cooldown", 0))
-        if duration <= 0:
-            return False, f"Result: {display_winner}."
-
-        color = self.colors[index]
-        modules_copy = dict(modules)
-        self.remove_item(index)
-
-        job: str | None = None
-
-        def restore() -> None:
-            self.restore_cooldown_item(base_name, modules_copy, color)
-            if job in self.cooldown_jobs:
-                self.cooldown_jobs.remove(job)  # type: ignore[arg-type]
-
-        job = self.root.after(int(duration * 1000), restore)
-        self.cooldown_jobs.append(job)
+        self.spin_logger.log(selection, timer_text, bpm_text)
 
-        if not self.items:
-            message = f"{display_winner} is on cooldown for {duration} seconds. No items remain."
-            self.end_game(message)
-            return True, message
-
-        return (
-            False,
-            f"{display_winner} is on cooldown for {duration} seconds.",
-        )
-
-    def restore_cooldown_item(
-        self, base_name: str, modules: dict[str, int | bool | float | str], color: str | None
-    ) -> None:
-        self.add_item_with_modules(base_name, modules, color)
-        self.draw_wheel()
+    @staticmethod
+    def countdown_delay_ms(remaining: float) -> int:
+        # Wake up when the whole-second count shown in the status next changes.
+        return max(1, math.ceil((remaining - math.ceil(remaining) + 1) * 1000))
 
-    def start_wheel_pause_timer(self, duration: float) -> None:
+    def start_wheel_pause_timer(self) -> None:
         self.cancel_wheel_pause_timer()
-        self.wheel_pause_active = True
-        self.wheel_pause_end_time = time.perf_counter() + duration
         self.cancel_auto_spin()
         self.update_wheel_pause_timer()
 
-    def apply_post_pause_reset(self) -> bool:
-        if not self.post_pause_reset_pending:
-            return False
-
-        self.post_pause_reset_pending = False
-        self.stop_spin_timer()
-        return True
-
     def update_wheel_pause_timer(self) -> None:
-        remaining = self.wheel_pause_end_time - time.perf_counter()
-        if remaining <= 0:
-            self.wheel_pause_active = False
-            self.wheel_pause_job = None
-            timer_stopped = self.apply_post_pause_reset()
-            if self.auto_spin_var.get():
-                status_text = "Wheel pause over. Spinning automatically."
-                if timer_stopped:
-                    status_text += " Timer stopped."
-                self.status.config(text=status_text)
-                self.start_spin()
-            else:
-                status_text = "Wheel pause over."
-                if timer_stopped:
-                    status_text += " Timer stopped."
-                self.status.config(text=status_text)
-            return
-
+        remaining = self.engine.wheel_pause_end_time - time.perf_counter()
         seconds_left = max(1, math.ceil(remaining))
         self.status.config(text=f"Wheel paused: {seconds_left} seconds remaining.")
-        self.wheel_pause_job = self.root.after(200, self.update_wheel_pause_timer)
-
-    def start_heartbeat_pause_timer(self, duration: float) -> None:
-        self.cancel_heartbeat_pause_timer()
-        self.heartbeat_pause_active = True
-        self.heartbeat_pause_end_time = time.perf_counter() + duration
-        self.update_heartbeat_pause_timer()
+        self.wheel_pause_job = self.root.after(
+            self.countdown_delay_ms(remaining), self.update_wheel_pause_timer
+        )
 
-    def update_heartbeat_pause_timer(self) -> None:
-        remaining = self.heartbeat_pause_end_time - time.perf_counter()
-        if remaining <= 0:
-            self.heartbeat_pause_active = False
-            self.heartbeat_pause_job = None
-            timer_stopped = self.apply_post_pause_reset()
-            status_text = "Heartbeat pause over."
+    def finish_wheel_pause_timer(self, timer_stopped: bool) -> None:
+        self.cancel_wheel_pause_timer()
+        if self.auto_spin_var.get():
+            status_text = "Wheel pause over. Spinning automatically."
             if timer_stopped:
                 status_text += " Timer stopped."
             self.status.config(text=status_text)
-            return
+            self.start_spin()
+        else:
+            status_text = "Wheel pause over."
+            if timer_stopped:
+                status_text += " Timer stopped."
+            self.status.config(text=status_text)
+
+    def start_heartbeat_pause_timer(self) -> None:
+        self.cancel_heartbeat_pause_timer()
+        self.update_heartbeat_pause_timer()
 
+    def update_heartbeat_pause_timer(self) -> None:
+        remaining = self.engine.heartbeat_pause_end_time - time.perf_counter()
         seconds_left = max(1, math.ceil(remaining))
         self.status.config(text=f"Heartbeat paused: {seconds_left} seconds remaining.")
-        self.heartbeat_pause_job = self.root.after(200, self.update_heartbeat_pause_timer)
+        self.heartbeat_pause_job = self.root.after(
+            self.countdown_delay_ms(remaining), self.update_heartbeat_pause_timer
+        )
+
+    def finish_heartbeat_pause_timer(self, timer_stopped: bool) -> None:
+        self.cancel_heartbeat_pause_timer()
+        status_text = "Heartbeat pause over."
+        if timer_stopped:
+            status_text += " Timer stopped."
+        self.status.config(text=status_text)
 
     def end_game(self, message: str) -> None:
-        self.game_over = True
         self.cancel_auto_spin()
         self.cancel_wheel_pause_timer()
         self.cancel_heartbeat_pause_timer()
@@ -1392,85 +949,25 @@ class WheelOfFortune:
         if self.wheel_pause_job is not None:
             self.root.after_cancel(self.wheel_pause_job)
             self.wheel_pause_job = None
-        self.wheel_pause_active = False
 
     def cancel_heartbeat_pause_timer(self) -> None:
         if self.heartbeat_pause_job is not None:
             self.root.after_cancel(self.heartbeat_pause_job)
             self.heartbeat_pause_job = None
-        self.heartbeat_pause_active = False
-
-    def update_special_label(self, index: int) -> None:
-        self.items[index] = self.format_item_label(index)
-        self.draw_wheel()
-
-    def handle_fragile_result(self, index: int, base_name: str, display_winner: str) -> str:
-        remove_index = None
-        if 0 <= index < len(self.base_names) and self.base_names[index] == base_name:
-            remove_index = index
-        else:
-            candidates = [
-                idx for idx, name in enumerate(self.base_names) if name == base_name
-            ]
-            if candidates:
-                remove_index = min(candidates, key=lambda idx: abs(idx - index))
-
-        if remove_index is not None:
-            self.remove_item(remove_index)
-        if not self.items:
-            end_message = f"{display_winner} was destroyed. No items remain."
-            self.end_game(end_message)
-            return end_message
-
-        return f"{display_winner} was destroyed after being chosen."
-
-    def remove_item(self, index: int) -> None:
-        if index < 0 or index >= len(self.items):
-            return
-
-        del self.items[index]
-        del self.base_names[index]
-        del self.item_modules[index]
-        del self.colors[index]
-        self.draw_wheel()
-
-    def duplicate_spawn_item(self, config: dict[str, int | str]) -> None:
-        base_name = str(config["base_name"])
-        if base_name in self.max_blocked_names:
-            return
-
-        modules = config.get("modules", {})
-        color = config.get("color")
-        self.add_item_with_modules(base_name, dict(modules), str(color) if color else None)
-        self.draw_wheel()
 
     def restart_game(self) -> None:
         self.cancel_auto_spin()
         self.cancel_heartbeat()
         self.cancel_wheel_pause_timer()
         self.cancel_heartbeat_pause_timer()
-        self.cancel_spawn_jobs()
-        self.cancel_cooldown_jobs()
-        self.items = list(self.original_items)
-        self.colors = self.generate_colors(len(self.items))
-        self.parse_items_and_modules()
-        self.spawn_started = False
-        self.game_over = False
-        self.spinning = False
-        self.pending_multiplier = 1
-        self.bps = self.initial_bps
-        self.clamp_bps()
+        self.cancel_engine_timers()
         self.angle_offset = 0.0
-        self.wheel_pause_active = False
-        self.wheel_pause_end_time = 0.0
-        self.heartbeat_pause_active = False
-        self.heartbeat_pause_end_time = 0.0
+        self.engine.restart(time.perf_counter())
         self.auto_spin_var.set(True)
         self.last_pointer_index = self.pointer_index()
         self.cancel_timer()
-        self.first_spin_time = None
         self.timer_label.config(text="Timer: 00:00")
-        if self.session_start_time is not None:
+        if self.engine.session_start_time is not None:
             self.update_timer_label()
         self.draw_wheel()
         self.schedule_heartbeat()
@@ -1478,25 +975,121 @@ class WheelOfFortune:
         self.status.config(text="Press Start to spin")
 
     def run(self) -> None:
-        if self.items:
+        if hasattr(self, "engine") and self.engine.config_error is None:
             self.root.mainloop()
-
-    def display_bps_value(self) -> int:
-        return int(round(self.bps))
+        if getattr(self, "audio_sink", None) is not None:
+            self.audio_sink.stop()
+        if hasattr(self, "sound_cache"):
+            self.sound_cache.shutdown()
+        if getattr(self, "heartbeat_recorder", None) is not None:
+            self.heartbeat_recorder.export(self.heartbeat_log)
+        if getattr(self, "journal", None) is not None:
+            self.journal.close()
+        if hasattr(self, "spin_logger"):
+            self.spin_logger.close()
+        if getattr(self, "metrics_server", None) is not None:
+            self.metrics_server.stop()
+        if self.profiler is not None:
+            print(self.profiler.finish())
 
     def bpm_text(self) -> str:
-        return f"BPM: {self.display_bps_value()}"
-
-    def clamp_bps(self) -> None:
-        self.bps = min(600, max(1, self.bps))
+        return f"BPM: {self.engine.display_bps_value()}"
 
     def update_bpm_display(self) -> None:
         self.bpm_label.config(text=self.bpm_text())
 
 
-def main() -> None:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Wheel of Fortune")
+    parser.add_argument(
+        "--render-mode",
+        choices=("vector", "sprite"),
+        default="vector",
+        help="draw the wheel with canvas items or with cached pre-rotated images (needs Pillow)",
+    )
+    parser.add_argument(
+        "--heartbeat-log",
+        type=Path,
+        metavar="PATH",
+        help="record heartbeat timing and write it here on exit (.csv per beat, else JSON summary)",
+    )
+    parser.add_argument(
+        "--fps",
+        type=float,
+        default=DEFAULT_FPS,
+        help="target frame rate of the spin animation; spins last as long at any rate",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="seed the spin outcomes so a session can be replayed",
+    )
+    parser.add_argument(
+        "--journal",
+        type=Path,
+        metavar="PATH",
+        help="record every game event to this binary journal (see session_journal.py)",
+    )
+    parser.add_argument(
+        "--spin-log",
+        type=Path,
+        metavar="PATH",
+        help="also write spin results here (.csv, else JSON lines), rotated at 1 MB",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        metavar="PORT",
+        help="serve live metrics on http://127.0.0.1:PORT/metrics (off by default)",
+    )
+    parser.add_argument(
+        "--audio-backend",
+        choices=AUDIO_BACKENDS,
+        default="auto",
+        help="sound output to use; auto tries mixer, pygame, simpleaudio, winsound in turn",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="print how long each startup phase took",
+    )
+    parser.add_argument(
+        "--no-lod",
+        action="store_true",
+        help="draw every sector and label even on huge wheels or when frames run late",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="time the hot callbacks and print call counts and percentiles on exit",
+    )
+    parser.add_argument(
+        "--profile-dump",
+        type=Path,
+        metavar="PATH",
+        help="also run cProfile and write its stats here for pstats (implies --profile)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
     root = tk.Tk()
-    app = WheelOfFortune(root)
+    app = WheelOfFortune(
+        root,
+        render_mode=args.render_mode,
+        heartbeat_log=args.heartbeat_log,
+        fps=args.fps,
+        seed=args.seed,
+        journal=args.journal,
+        spin_log=args.spin_log,
+        metrics_port=args.metrics_port,
+        profile=args.profile,
+        profile_dump=args.profile_dump,
+        lod=not args.no_lod,
+        audio_backend=args.audio_backend,
+        verbose=args.verbose,
+    )
     app.run()
 
 
@@ -0,0 +1,133 @@
+# Level of detail for the vector wheel. A layout is planned once per scene
+# change; spin frames then only move its arcs and labels, and there are at
+# most MAX_ARCS arcs and 360 / MIN_LABEL_DEGREES labels whatever the item count.
+
+# Narrowest sector (degrees) that still fits a 14 pt label at the text radius.
+MIN_LABEL_DEGREES = 4.5
+# Below this width a sector is drawn without outline, and same-colored
+# neighbours share one arc.
+MIN_SECTOR_DEGREES = 1.5
+MAX_ARCS = 720
+
+DETAIL_FULL = 0
+DETAIL_NO_OUTLINES = 1
+DETAIL_NO_SPIN_LABELS = 2
+# Frames observed after a level change before the next one is considered.
+SETTLE_FRAMES = 10
+
+
+class WheelLayout:
+    __slots__ = ("sector_angle", "arcs", "labels", "outlines")
+
+    def __init__(self, sector_angle: float, outlines: bool) -> None:
+        self.sector_angle = sector_angle
+        # (start, extent, color) in degrees from the first sector's edge.
+        self.arcs: list[tuple[float, float, str]] = []
+        # (center, width, text), angles in degrees from the first sector's edge.
+        self.labels: list[tuple[float, float, str]] = []
+        self.outlines = outlines
+
+
+def merge_arcs(spans: list[tuple[float, float, str]]) -> list[tuple[float, float, str]]:
+    # (start, end, color) spans in order -> (start, extent, color) arcs, with
+    # neighbours of the same color joined.
+    merged: list[list] = []
+    for start, end, color in spans:
+        if merged and merged[-1][2] == color:
+            merged[-1][1] = end
+        else:
+            merged.append([start, end, color])
+    return [(start, end - start, color) for start, end, color in merged]
+
+
+def plan_wheel(
+    labels: list[str],
+    colors: list[str],
+    level: int = DETAIL_FULL,
+    show_labels: bool = True,
+    max_arcs: int = MAX_ARCS,
+) -> WheelLayout:
+    count = len(labels)
+    if count == 0:
+        return WheelLayout(360.0, False)
+    sector_angle = 360 / count
+    layout = WheelLayout(
+        sector_angle, level < DETAIL_NO_OUTLINES and sector_angle >= MIN_SECTOR_DEGREES
+    )
+
+    if sector_angle >= MIN_SECTOR_DEGREES:
+        layout.arcs = [
+            (index * sector_angle, sector_angle, color) for index, color in enumerate(colors)
+        ]
+    else:
+        layout.arcs = merge_arcs(
+            [
+                (index * sector_angle, (index + 1) * sector_angle, color)
+                for index, color in enumerate(colors)
+            ]
+        )
+        if len(layout.arcs) > max_arcs:
+            # Still too many: sample one color per fixed-width bucket.
+            bucket = 360 / max_arcs
+            sampled = []
+            for step in range(max_arcs):
+                index = min(count - 1, int((step + 0.5) * bucket / sector_angle))
+                sampled.append((step * bucket, (step + 1) * bucket, colors[index]))
+            layout.arcs = merge_arcs(sampled)
+
+    if show_labels:
+        # Neighbours with the same text (spawned copies) share one label.
+        run_start = 0
+        for index in range(1, count + 1):
+            if index < count and labels[index] == labels[run_start]:
+                continue
+            width = (index - run_start) * sector_angle
+            if width >= MIN_LABEL_DEGREES:
+                center = (run_start + index) / 2 * sector_angle
+                layout.labels.append((center, width, labels[run_start]))
+            run_start = index
+    return layout
+
+
+def plan_full_wheel(labels: list[str], colors: list[str]) -> WheelLayout:
+    # Every sector with outline and label, as drawn when LOD is switched off.
+    if not labels:
+        return WheelLayout(360.0, False)
+    sector_angle = 360 / len(labels)
+    layout = WheelLayout(sector_angle, True)
+    layout.arcs = [
+        (index * sector_angle, sector_angle, color) for index, color in enumerate(colors)
+    ]
+    layout.labels = [
+        ((index + 0.5) * sector_angle, sector_angle, label) for index, label in enumerate(labels)
+    ]
+    return layout
+
+
+# Lowers the detail level while spin frames take longer than `budget` seconds
+# on average, and raises it again once they are well under. Rebuild frames
+# are not fed in; only the per-frame geometry update is.
+class DetailController:
+    def __init__(self, budget: float) -> None:
+        self.budget = budget
+        self.level = DETAIL_FULL
+        self.average: float | None = None
+        self.frames_since_change = 0
+
+    def observe(self, seconds: float) -> bool:
+        self.average = seconds if self.average is None else 0.8 * self.average + 0.2 * seconds
+        self.frames_since_change += 1
+        if self.frames_since_change < SETTLE_FRAMES:
+            return False
+        if self.average > self.budget and self.level < DETAIL_NO_SPIN_LABELS:
+            self.change_level(self.level + 1)
+            return True
+        if self.average < self.budget / 4 and self.level > DETAIL_FULL:
+            self.change_level(self.level - 1)
+            return True
+        return False
+
+    def change_level(self, level: int) -> None:
+        self.level = level
+        self.average = None
+        self.frames_since_change = 0
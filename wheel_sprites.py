@@ -0,0 +1,172 @@
+import importlib.util
+import math
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+if importlib.util.find_spec("PIL") is not None:  # pragma: no cover - optional dependency
+    from PIL import Image, ImageDraw, ImageFont, ImageTk  # type: ignore
+else:  # pragma: no cover - fallback when Pillow is unavailable
+    Image = ImageDraw = ImageFont = ImageTk = None  # type: ignore
+
+
+DEFAULT_ANGLE_STEP = 3.0
+DEFAULT_BUDGET_BYTES = 256 * 1024 * 1024
+
+
+def sprites_available() -> bool:
+    return Image is not None and ImageTk is not None
+
+
+class SpriteCache:
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES) -> None:
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self.entries: OrderedDict[Hashable, tuple[object, int]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.entries
+
+    def get(self, key: Hashable, factory: Callable[[], tuple[object, int]]) -> object:
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        value, size = factory()
+        self.entries[key] = (value, size)
+        self.used_bytes += size
+        self.evict(keep=key)
+        return value
+
+    def evict(self, keep: Hashable | None = None) -> None:
+        while self.used_bytes > self.budget_bytes and len(self.entries) > 1:
+            key = next(iter(self.entries))
+            if key == keep:
+                self.entries.move_to_end(key)
+                key = next(iter(self.entries))
+            _, size = self.entries.pop(key)
+            self.used_bytes -= size
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.used_bytes = 0
+
+
+class WheelSpriteRenderer:
+    def __init__(
+        self,
+        radius: int,
+        angle_step: float = DEFAULT_ANGLE_STEP,
+        budget_bytes: int = DEFAULT_BUDGET_BYTES,
+        font_size: int = 14,
+    ) -> None:
+        self.radius = radius
+        self.size = 2 * radius + 4
+        self.angle_step = angle_step
+        self.bucket_count = max(1, int(round(360 / angle_step)))
+        self.cache = SpriteCache(budget_bytes)
+        self.font = self.load_font(font_size)
+
+    @staticmethod
+    def load_font(size: int):  # type: ignore[override]
+        for name in ("arialbd.ttf", "Arial Bold.ttf", "DejaVuSans-Bold.ttf"):
+            try:
+                return ImageFont.truetype(name, size)
+            except (OSError, AttributeError):
+                continue
+        try:
+            return ImageFont.load_default(size)
+        except TypeError:
+            return ImageFont.load_default()
+
+    def angle_bucket(self, angle_offset: float) -> int:
+        return int(round((angle_offset % 360) / self.angle_step)) % self.bucket_count
+
+    def snap_angle(self, angle_offset: float) -> float:
+        # The angle of the frame actually shown for `angle_offset`.
+        return self.angle_bucket(angle_offset) * self.angle_step
+
+    def frame(
+        self,
+        signature: tuple[tuple[str, ...], tuple[str, ...], bool],
+        angle_offset: float,
+    ) -> object:
+        bucket = self.angle_bucket(angle_offset)
+        return self.cache.get(
+            (signature, bucket), lambda: self.render_frame(signature, bucket)
+        )
+
+    def base_image(self, signature: tuple[tuple[str, ...], tuple[str, ...], bool]):  # type: ignore[override]
+        return self.cache.get((signature, None), lambda: self.rasterize(signature))
+
+    def render_frame(
+        self, signature: tuple[tuple[str, ...], tuple[str, ...], bool], bucket: int
+    ) -> tuple[object, int]:
+        base = self.base_image(signature)
+        rotated = base.rotate(bucket * self.angle_step, resample=Image.BICUBIC)
+        return ImageTk.PhotoImage(rotated), self.image_bytes()
+
+    def image_bytes(self) -> int:
+        return self.size * self.size * 4
+
+    def rasterize(
+        self, signature: tuple[tuple[str, ...], tuple[str, ...], bool]
+    ) -> tuple[object, int]:
+        labels, colors, night_mode = signature
+        image = Image.new("RGBA", (self.size, self.size), (0, 0, 0, 0))
+        if not labels:
+            return image, self.image_bytes()
+
+        draw = ImageDraw.Draw(image)
+        center = self.size / 2
+        bbox = (
+            center - self.radius,
+            center - self.radius,
+            center + self.radius,
+            center + self.radius,
+        )
+        sector_angle = 360 / len(labels)
+        pointer_angle = 90
+        for index, color in enumerate(colors):
+            start_angle = pointer_angle - sector_angle / 2 + index * sector_angle
+            # Tk measures arcs counter-clockwise, Pillow clockwise.
+            draw.pieslice(
+                bbox,
+                start=-(start_angle + sector_angle),
+                end=-start_angle,
+                fill=color,
+                outline="white",
+                width=2,
+            )
+
+        text_fill = "black" if night_mode else "white"
+        text_radius = self.radius * 0.65
+        for index, label in enumerate(labels):
+            segment_center = pointer_angle + index * sector_angle
+            angle_rad = math.radians(segment_center)
+            x = center + text_radius * math.cos(angle_rad)
+            y = center - text_radius * math.sin(angle_rad)
+            self.paste_label(image, label, x, y, segment_center - 90, text_fill)
+
+        return image, self.image_bytes()
+
+    def paste_label(
+        self, image, label: str, x: float, y: float, angle: float, fill: str  # type: ignore[no-untyped-def]
+    ) -> None:
+        left, top, right, bottom = self.font.getbbox(label)
+        width = max(1, right - left)
+        height = max(1, bottom - top)
+        text_image = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+        ImageDraw.Draw(text_image).text((-left, -top), label, font=self.font, fill=fill)
+        rotated = text_image.rotate(angle, resample=Image.BICUBIC, expand=True)
+        position = (int(round(x - rotated.width / 2)), int(round(y - rotated.height / 2)))
+        image.paste(rotated, position, rotated)